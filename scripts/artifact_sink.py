@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Skip-unchanged, atomic writes for generated artifacts.
+
+Output is buffered in memory, compared with the file on disk by size and
+SHA-256, and only written when it differs. Writes go to a temp file in the
+target directory followed by ``os.replace``, so readers never see a torn
+file and unchanged artifacts keep their mtime for caches and file watchers.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import secrets
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Tuple
+
+
+def file_matches(path: Path, data: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(data).digest()
+    except OSError:
+        return False
+
+
+def create_temp(path: Path) -> Tuple[int, str]:
+    """Open a fresh temp file beside ``path`` with mode 0o666, so the kernel applies the umask."""
+    while True:
+        tmp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666), tmp_name
+        except FileExistsError:
+            continue
+
+
+def write_artifact(path: Path, content: str | bytes) -> bool:
+    """Atomically replace ``path`` with ``content`` unless it already holds it; True when written."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if file_matches(path, data):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except OSError:
+        mode = None
+    fd, tmp_name = create_temp(path)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        if mode is not None:
+            os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return True
+
+
+@contextmanager
+def open_artifact(path: Path) -> Iterator[io.StringIO]:
+    """Text buffer standing in for ``path.open("w", newline="")``; committed on a clean exit."""
+    buffer = io.StringIO(newline="")
+    yield buffer
+    write_artifact(path, buffer.getvalue())
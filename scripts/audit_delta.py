@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Compact audit snapshots and the delta between two runs.
+
+A snapshot keeps one line per operation (``METHOD path``) and per screen
+(``source_file:screen_id``) holding its surface, id, match state and a
+short hash of every field that reaches the audit artifacts. Diffing two
+snapshots only compares hashes, and the delta lists just the entries that
+were added, removed, newly matched, newly orphaned or otherwise changed,
+so reviewers and gates read O(changes) rows instead of the full CSVs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+SNAPSHOT_NAME = "AUDIT_SNAPSHOT.json"
+DELTA_NAME = "AUDIT_DELTA"
+SNAPSHOT_VERSION = 1
+CHANGES = ("added", "removed", "matched", "orphaned", "changed")
+KINDS = ("operation", "screen")
+
+# key -> [surface, id, linked (0/1), hash]
+SnapshotSection = Dict[str, List[Any]]
+
+
+def entry_hash(fields: Iterable[Any]) -> str:
+    return hashlib.blake2b("\x1f".join(map(str, fields)).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def unique_keys(keys: Iterable[str]) -> List[str]:
+    """``keys`` with ``#2``, ``#3``... appended to repeats so every entry has its own slot."""
+    seen: Counter = Counter()
+    unique = []
+    for key in keys:
+        seen[key] += 1
+        unique.append(key if seen[key] == 1 else f"{key}#{seen[key]}")
+    return unique
+
+
+def build_snapshot(service: str, operations: SnapshotSection, screens: SnapshotSection) -> Dict[str, Any]:
+    return {"version": SNAPSHOT_VERSION, "service": service, "operations": operations, "screens": screens}
+
+
+def render_snapshot(snapshot: Dict[str, Any]) -> str:
+    return json.dumps(snapshot, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n"
+
+
+def load_snapshot(path: Path) -> Optional[Dict[str, Any]]:
+    """Previous snapshot, or ``None`` when missing, unreadable or from another format version."""
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def diff_section(kind: str, previous: SnapshotSection, current: SnapshotSection) -> List[Dict[str, Any]]:
+    changes = []
+    for key, (surface, ident, linked, digest) in current.items():
+        before = previous.get(key)
+        if before is None:
+            change = "added"
+        elif before[3] == digest:
+            continue
+        elif bool(before[2]) != bool(linked):
+            change = "matched" if linked else "orphaned"
+        else:
+            change = "changed"
+        changes.append({"kind": kind, "change": change, "key": key, "surface_id": surface, "id": ident, "linked": bool(linked)})
+    for key, (surface, ident, linked, _) in previous.items():
+        if key not in current:
+            changes.append({"kind": kind, "change": "removed", "key": key, "surface_id": surface, "id": ident, "linked": bool(linked)})
+    return changes
+
+
+def diff_snapshots(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Changes from ``previous`` to ``current`` plus per-surface counts; no baseline means everything is added."""
+    baseline = previous or {"operations": {}, "screens": {}}
+    changes = diff_section("operation", baseline["operations"], current["operations"])
+    changes += diff_section("screen", baseline["screens"], current["screens"])
+    changes.sort(key=lambda change: (change["kind"], change["surface_id"], change["key"]))
+    counts: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(lambda: {kind: dict.fromkeys(CHANGES, 0) for kind in KINDS})
+    for change in changes:
+        counts[change["surface_id"] or "-"][change["kind"]][change["change"]] += 1
+    return {
+        "service": current["service"],
+        "baseline": previous is not None,
+        "totals": {kind: {name: sum(row[kind][name] for row in counts.values()) for name in CHANGES} for kind in KINDS},
+        "counts": {surface: counts[surface] for surface in sorted(counts)},
+        "changes": changes,
+    }
+
+
+def render_delta_markdown(delta: Dict[str, Any]) -> str:
+    lines = [f"# SRV-{delta['service']} Audit Delta", ""]
+    if not delta["baseline"]:
+        lines += ["No previous snapshot: every entry is reported as added.", ""]
+    if not delta["changes"]:
+        lines += ["No changes since the previous run.", ""]
+        return "\n".join(lines)
+    lines += [
+        "## Counts by Surface",
+        "",
+        "| Surface | Kind | Added | Removed | Newly matched | Newly orphaned | Changed |",
+        "| --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for surface, by_kind in delta["counts"].items():
+        for kind in KINDS:
+            row = by_kind[kind]
+            if any(row.values()):
+                lines.append(f"| {surface} | {kind} | " + " | ".join(str(row[change]) for change in CHANGES) + " |")
+    lines += ["", "## Changes", "", "| Change | Kind | Surface | Id | Key |", "| --- | --- | --- | --- | --- |"]
+    for change in delta["changes"]:
+        lines.append(f"| {change['change']} | {change['kind']} | {change['surface_id'] or '-'} | {change['id']} | `{change['key']}` |")
+    lines.append("")
+    return "\n".join(lines)
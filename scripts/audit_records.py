@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Typed records for the parity audit: FE screens, BE operations and the links between them.
+
+Screens and operations are ``__slots__`` dataclasses rather than free-form
+dicts: every instance has a fixed field layout and no per-instance
+``__dict__``, and a misspelt field fails loudly instead of reading as empty.
+Matching never writes into an operation; it fills a ``MatchLinks`` table
+that maps each screen to its operation and each operation to its screens.
+Records compare by identity so they can key those tables. ``AuditModel``
+bundles one service's screens, operations and links.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+
+@dataclass(slots=True, eq=False)
+class ScreenEntry:
+    source_file: str
+    screen_id: str
+    surface_id: str
+    screen_title: str
+    status: str
+    notes: str
+    endpoint: str
+    operation_id_hint: str
+    action_id_hint: str
+    role: str
+    method_hint: Optional[str]
+    related_service: str
+    # Set by matching: the matched operation's values, else the screen's own hints.
+    trace_link_ok: bool = False
+    operation_id: str = ""
+    method: str = ""
+    path: str = ""
+    rbac_role: str = ""
+    action_id_resolved: str = ""
+
+
+@dataclass(slots=True, eq=False)
+class Operation:
+    method: str
+    path: str
+    operation_id: str
+    summary: str
+    description: str
+    tags: List[str]
+    rbac_role: str
+    action_id: str
+    guards: str
+    entity_code: str
+    idempotency: bool
+    pagination: bool
+    req_schema: str
+    res_schema: str
+    errors_profile: str
+    parameters: List[Dict[str, Any]]
+
+
+@dataclass(slots=True)
+class MatchLinks:
+    """FE→BE link table (``screen_op``) and its inverse (``op_screens``, screens in entry order)."""
+
+    screen_op: Dict[ScreenEntry, Operation] = field(default_factory=dict)
+    op_screens: Dict[Operation, List[ScreenEntry]] = field(default_factory=dict)
+
+    def link(self, entry: ScreenEntry, op: Optional[Operation]) -> None:
+        if op is None:
+            self.screen_op.pop(entry, None)
+        else:
+            self.screen_op[entry] = op
+
+    def screens(self, op: Operation) -> List[ScreenEntry]:
+        return self.op_screens.get(op, [])
+
+    def rebuild(self, entries: Iterable[ScreenEntry]) -> None:
+        """Drop links of screens not in ``entries`` and regroup the rest per operation."""
+        screen_op: Dict[ScreenEntry, Operation] = {}
+        op_screens: Dict[Operation, List[ScreenEntry]] = {}
+        for entry in entries:
+            op = self.screen_op.get(entry)
+            if op is not None:
+                screen_op[entry] = op
+                op_screens.setdefault(op, []).append(entry)
+        self.screen_op = screen_op
+        self.op_screens = op_screens
+
+
+@dataclass(slots=True)
+class AuditModel:
+    """One service's matched audit: the records every artifact is serialised from."""
+
+    profile: Dict[str, Any]
+    fe_entries: List[ScreenEntry]
+    be_operations: List[Operation]
+    links: MatchLinks
+
+    def orphan_operations(self) -> List[Operation]:
+        return [op for op in self.be_operations if op not in self.links.op_screens]
+
+    def orphan_screens(self) -> List[ScreenEntry]:
+        return [entry for entry in self.fe_entries if not entry.trace_link_ok]
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Run the parity/traceability audit for every service in registry/SSOT_INDEX.json.
+
+Screen catalogs are parsed once in the parent process and handed to one
+worker process per service; each worker runs the auto_dsh_audit engine with
+that service's profile and writes dist/<svc>/. A combined summary lands in
+dist/SERVICES_AUDIT_SUMMARY.md (and .json). With ``--ndjson`` the services are
+instead streamed one after another into a single NDJSON stream.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from artifact_sink import write_artifact
+from audit_delta import SNAPSHOT_NAME
+from auto_dsh_audit import (
+    REPO_ROOT,
+    SUGGESTIONS_TOP_K,
+    open_ndjson,
+    read_screen_catalogs,
+    run_audit,
+    service_profile,
+    stream_records,
+    write_ndjson,
+)
+
+SSOT_INDEX_PATH = REPO_ROOT / "registry" / "SSOT_INDEX.json"
+SUMMARY_DIR = REPO_ROOT / "dist"
+SUMMARY_NAME = "SERVICES_AUDIT_SUMMARY"
+
+
+def registry_services(index_path: Path = SSOT_INDEX_PATH) -> List[str]:
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    return [service["code"].upper() for service in index.get("services", []) if service.get("code")]
+
+
+def audit_service(code: str, catalogs: List[tuple[str, List[Dict[str, str]]]], options: Dict[str, Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    profile = service_profile(code)
+    result: Dict[str, Any] = {"service": code, "status": "ok", "detail": ""}
+    if not profile["openapi"].exists():
+        result.update(status="skipped", detail=f"no spec at {profile['openapi'].relative_to(REPO_ROOT).as_posix()}")
+    else:
+        try:
+            delta_baseline = profile["dist_dir"] / SNAPSHOT_NAME if options["delta"] else None
+            counts = run_audit(
+                profile,
+                catalogs,
+                options["reproducible"],
+                options["suggestions"],
+                inventory_db=options["db"],
+                delta_baseline=delta_baseline,
+            )
+            result.update(counts)
+            result["dist"] = profile["dist_dir"].relative_to(REPO_ROOT).as_posix()
+        except Exception as exc:  # reported per service so one broken spec does not hide the others
+            result.update(status="error", detail=str(exc))
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_services(codes: List[str], options: Dict[str, Any], workers: int | None = None) -> List[Dict[str, Any]]:
+    """Audit ``codes`` on a process pool; results keep registry order."""
+    catalogs = read_screen_catalogs()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(codes) or 1))
+    if workers == 1:
+        return [audit_service(code, catalogs, options) for code in codes]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(audit_service, codes, [catalogs] * len(codes), [options] * len(codes)))
+
+
+def stream_services(codes: List[str]) -> Iterator[Dict[str, Any]]:
+    """NDJSON records of every service in turn; catalogs are re-read per service rather than held for all."""
+    for code in codes:
+        profile = service_profile(code)
+        if not profile["openapi"].exists():
+            print(f"{code}: skipped (no spec at {profile['openapi'].relative_to(REPO_ROOT).as_posix()})", file=sys.stderr)
+            continue
+        started = time.perf_counter()
+        yield from stream_records(profile)
+        print(f"{code}: streamed ({time.perf_counter() - started:.2f}s)", file=sys.stderr)
+
+
+def format_ratio(value: float | None) -> str:
+    return "N/A" if value is None else f"{value:.2f}"
+
+
+def render_summary(results: List[Dict[str, Any]]) -> str:
+    lines = [
+        "# Services Audit Summary",
+        "",
+        "| Service | Status | BE Operations | FE Screens | Orphan BE | Orphan FE | TRACE | PARITY | Artifacts |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for result in results:
+        if result["status"] != "ok":
+            lines.append(f"| {result['service']} | {result['status']} | - | - | - | - | - | - | {result['detail']} |")
+            continue
+        lines.append(
+            f"| {result['service']} | ok | {result['be_operations']} | {result['fe_screens']} "
+            f"| {result['orphan_be']} | {result['orphan_fe']} | {format_ratio(result['trace'])} "
+            f"| {format_ratio(result['parity'])} | `{result['dist']}/` |"
+        )
+    lines.append("")
+    return "\n".join(lines)
+
+
+def write_summary(results: List[Dict[str, Any]]) -> Path:
+    SUMMARY_DIR.mkdir(parents=True, exist_ok=True)
+    # timings are left out so unchanged inputs leave the summary untouched
+    stable = [{key: value for key, value in result.items() if key != "seconds"} for result in results]
+    write_artifact(SUMMARY_DIR / f"{SUMMARY_NAME}.json", json.dumps(stable, indent=2, ensure_ascii=False) + "\n")
+    target = SUMMARY_DIR / f"{SUMMARY_NAME}.md"
+    write_artifact(target, render_summary(results))
+    return target
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Audit every registry service in parallel")
+    parser.add_argument("--services", nargs="+", default=None, help="Service codes to audit (default: all in SSOT_INDEX.json)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="Byte-stable artifacts: stamp SOURCE_DATE_EPOCH, or an input digest instead of the wall clock.",
+    )
+    parser.add_argument(
+        "--suggestions",
+        type=int,
+        default=SUGGESTIONS_TOP_K,
+        help="Candidates per orphan in ORPHAN_SUGGESTIONS.csv (0 skips the artifact).",
+    )
+    parser.add_argument("--db", action="store_true", help="Also write dist/<svc>/INVENTORY.sqlite per service.")
+    parser.add_argument(
+        "--delta", action="store_true", help="Also write dist/<svc>/AUDIT_DELTA.json/.md against each service's last snapshot."
+    )
+    parser.add_argument(
+        "--ndjson",
+        metavar="TARGET",
+        default=None,
+        help="Stream every service's records as NDJSON to TARGET ('-' for stdout) instead of writing artifacts.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    codes = [code.upper() for code in args.services] if args.services else registry_services()
+    if args.ndjson:
+        with open_ndjson(args.ndjson) as handle:
+            write_ndjson(stream_services(codes), handle)
+        return 0
+    options = {"reproducible": args.reproducible, "suggestions": args.suggestions, "db": args.db, "delta": args.delta}
+    started = time.perf_counter()
+    results = run_services(codes, options, args.jobs)
+    wall = time.perf_counter() - started
+    summary = write_summary(results)
+    for result in results:
+        print(f"{result['service']}: {result['status']} ({result['seconds']:.2f}s) {result['detail']}".rstrip())
+    print(f"Audited {len(results)} services in {wall:.2f}s; summary at {summary.relative_to(REPO_ROOT).as_posix()}")
+    return 1 if any(result["status"] == "error" for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
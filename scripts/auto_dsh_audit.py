@@ -2,20 +2,48 @@
 """SRV-DSH audit helper.
 
 Generates inventory, parity, and traceability artifacts by reconciling the
-DSH OpenAPI slice with front-end and dashboard screen catalogs.
+DSH OpenAPI slice with front-end and dashboard screen catalogs. The load,
+match and write stages take a service profile (``service_profile``), so
+audit_services.py runs the same engine for every service in the registry.
 """
 
 from __future__ import annotations
 
+import argparse
 import csv
 import datetime as dt
 import json
+import io
+import os
 import re
-from collections import Counter, defaultdict
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
-
-import yaml
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from artifact_sink import open_artifact, write_artifact
+from audit_delta import (
+    DELTA_NAME,
+    SNAPSHOT_NAME,
+    build_snapshot,
+    diff_snapshots,
+    entry_hash,
+    load_snapshot,
+    render_delta_markdown,
+    render_snapshot,
+    unique_keys,
+)
+from audit_records import AuditModel, MatchLinks, Operation, ScreenEntry
+from inventory_store import STORE_NAME, write_store
+from orphan_suggest import split_tokens, suggest
+from pivot_cube import PivotCube, crosstab
+from path_index import build_operation_index, compile_path_trie, match_path, resolve_operations
+from repro import build_datetime, files_digest, source_date_epoch
+from screen_catalogs import discover_catalogs, load_catalogs, read_catalog
+from screen_rules import RuleSet, classify_method, classify_surface, service_rules
+from spec_cache import read_spec
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 OPENAPI_PATH = REPO_ROOT / "oas" / "services" / "dsh" / "openapi.yaml"
@@ -82,6 +110,22 @@ TRACE_DRIFT_HEADER = [
     "note",
 ]
 
+ORPHAN_SUGGESTIONS_HEADER = [
+    "orphan_kind",
+    "surface_id",
+    "orphan_id",
+    "orphan_ref",
+    "rank",
+    "candidate_id",
+    "candidate_ref",
+    "candidate_surface",
+    "score",
+    "shared_tokens",
+]
+
+SUGGESTIONS_TOP_K = 3
+WATCH_INTERVAL = 0.5
+
 SCREENS_CATALOG_HEADER = [
     "surface_id",
     "screen_id",
@@ -170,17 +214,47 @@ RUNTIME_BINDINGS: Dict[str, Dict[str, Any]] = {
 }
 
 
-def read_yaml(path: Path) -> Dict[str, Any]:
-    return yaml.safe_load(path.read_text(encoding="utf-8"))
+SERVICE_OVERRIDES: Dict[str, Dict[str, Any]] = {
+    "DSH": {
+        "path_prefixes": DSH_PATH_PREFIXES,
+        "operation_id_prefixes": ("dls_",),
+        "shared_outputs": True,
+    },
+}
+
+
+def service_profile(code: str) -> Dict[str, Any]:
+    """Inputs and output locations for auditing service ``code``.
+
+    ``shared_outputs`` marks the service that also owns traces/TRACE_TABLE.csv
+    and the aggregated dashboards/screens/SCREENS_CATALOG.csv.
+    """
+    code = code.upper()
+    slug = code.lower()
+    profile = {
+        "code": code,
+        "ssot_ref": f"SRV-{code}",
+        "openapi": REPO_ROOT / "oas" / "services" / slug / "openapi.yaml",
+        "path_prefixes": (),
+        "operation_id_prefixes": (),
+        "dist_dir": REPO_ROOT / "dist" / slug,
+        "inventory_name": f"{code}_INVENTORY.md",
+        "shared_outputs": False,
+    }
+    profile.update(SERVICE_OVERRIDES.get(code, {}))
+    return profile
+
+
+DSH_PROFILE = service_profile("DSH")
 
 
 def list_screen_catalogs() -> Iterable[Path]:
     aggregated = REPO_ROOT / "dashboards" / "screens" / "SCREENS_CATALOG.csv"
-    for base in (APPS_DIR, DASHBOARDS_DIR):
-        for path in base.rglob("SCREENS_CATALOG.csv"):
-            if path == aggregated:
-                continue
-            yield path
+    # discovery is sorted per root: rglob order is filesystem-dependent and decides match precedence
+    for path in discover_catalogs():
+        if path == aggregated:
+            continue
+        yield path
 
 
 def clean_endpoint(value: str) -> str:
@@ -204,44 +278,14 @@ def extract_schema_name(schema_ref: Optional[str]) -> str:
     return schema_ref
 
 
-def infer_surface_from_screen(screen_id: str, default: str = "") -> str:
-    token = (screen_id or "").upper()
-    if token.startswith("APP_USER"):
-        return "APP-USER"
-    if token.startswith("APP_PARTNER"):
-        return "APP-PARTNER"
-    if token.startswith("APP_CAPTAIN") or token.startswith("CAPTAIN_"):
-        return "APP-CAPTAIN"
-    if token.startswith("PARTNER_"):
-        return "APP-PARTNER"
-    if token.startswith("DASH_OPS"):
-        return "DASH-OPS"
-    if token.startswith("DASH_FLEET"):
-        return "DASH-FLEET"
-    if token.startswith("DASH_SUPPORT"):
-        return "DASH-SUPPORT"
-    if token.startswith("DASH_PARTNER"):
-        return "DASH-PARTNER"
-    if token.startswith("DASH_SSO"):
-        return "DASH-SSOT"
-    if token.startswith("FIELD."):
-        return "APP-FIELD"
-    return default
-
-
-def infer_method_hint(screen_id: str, notes: str) -> Optional[str]:
-    marker = f"{screen_id} {notes}".lower()
-    if any(keyword in marker for keyword in ("list", "details", "timeline", "track", "عرض", "قائمة", "تفاصيل")):
-        return "GET"
-    if any(keyword in marker for keyword in ("create", "checkout", "confirm", "issue", "submit", "reorder", "feedback", "upsert", "إصدار", "إرسال", "تأكيد", "بدء", "إضافة")):
-        return "POST"
-    if any(keyword in marker for keyword in ("update", "patch", "set", "تحديث", "تعديل", "ضبط")):
-        return "PATCH"
-    if any(keyword in marker for keyword in ("delete", "remove", "إلغاء", "حذف")):
-        return "DELETE"
-    if any(keyword in marker for keyword in ("accept", "reject", "close", "complete", "verify", "ack", "إقفال", "اعتماد", "تحقق")):
-        return "POST"
-    return None
+def infer_surface_from_screen(screen_id: str, default: str = "", rules: Optional[RuleSet] = None) -> str:
+    fired = classify_surface(screen_id, rules)
+    return fired[0] if fired else default
+
+
+def infer_method_hint(screen_id: str, notes: str, rules: Optional[RuleSet] = None) -> Optional[str]:
+    fired = classify_method(screen_id, notes, rules)
+    return fired[0] if fired else None
 
 
 def parse_guards(guards_str: str) -> List[str]:
@@ -261,62 +305,75 @@ def normalise_action_id(value: str | None) -> str:
     return str(value).strip()
 
 
-def load_fe_entries() -> List[Dict[str, Any]]:
-    entries: List[Dict[str, Any]] = []
-    for csv_path in list_screen_catalogs():
-        try:
-            rows = list(csv.DictReader(csv_path.read_text(encoding="utf-8-sig").splitlines()))
-        except UnicodeDecodeError:
-            rows = list(csv.DictReader(csv_path.read_text(encoding="utf-8").splitlines()))
-        rel_path = csv_path.relative_to(REPO_ROOT).as_posix()
+def read_screen_catalogs() -> List[tuple[str, List[Dict[str, str]]]]:
+    """(repo-relative path, stripped rows) for every screen catalog; parse once, audit many services."""
+    aggregated = REPO_ROOT / "dashboards" / "screens" / "SCREENS_CATALOG.csv"
+    return [strip_catalog(catalog) for catalog in load_catalogs()["catalogs"] if catalog["path"] != aggregated]
+
+
+def strip_catalog(catalog: Dict[str, Any]) -> tuple[str, List[Dict[str, str]]]:
+    return catalog["rel_path"], [{k: (v or "").strip() for k, v in row.items()} for row in catalog["rows"]]
+
+
+def load_fe_entries(
+    profile: Dict[str, Any] = DSH_PROFILE,
+    catalogs: Optional[Iterable[tuple[str, List[Dict[str, str]]]]] = None,
+) -> List[ScreenEntry]:
+    return list(iter_fe_entries(profile, catalogs if catalogs is not None else read_screen_catalogs()))
+
+
+def iter_fe_entries(
+    profile: Dict[str, Any],
+    catalogs: Iterable[tuple[str, List[Dict[str, str]]]],
+) -> Iterator[ScreenEntry]:
+    """Screen entries of ``profile``'s service, catalog by catalog; ``catalogs`` may be a lazy iterable."""
+    code = profile["code"]
+    operation_id_prefixes = profile["operation_id_prefixes"]
+    surface_rules, method_rules = service_rules(code)
+    for rel_path, rows in catalogs:
+        source_file = sys.intern(rel_path)
         for row in rows:
-            row = {k: (v or "").strip() for k, v in row.items()}
             if "related_service" in row:
-                if row.get("related_service", "").upper() != "DSH":
+                if row.get("related_service", "").upper() != code:
                     continue
                 screen_id = row.get("screen_id", "")
-                surface = infer_surface_from_screen(screen_id)
+                surface = infer_surface_from_screen(screen_id, rules=surface_rules)
                 endpoint = clean_endpoint(row.get("main_endpoint", ""))
-                entries.append(
-                    {
-                        "source_file": rel_path,
-                        "screen_id": screen_id,
-                        "surface_id": surface or infer_surface_from_screen("", row.get("role", "")),
-                        "screen_title": row.get("screen_title", ""),
-                        "status": row.get("status", ""),
-                        "notes": row.get("notes", ""),
-                        "endpoint": endpoint,
-                        "operation_id_hint": "",
-                        "action_id_hint": "",
-                        "role": row.get("role", ""),
-                        "method_hint": infer_method_hint(screen_id, row.get("notes", "")),
-                        "related_service": row.get("related_service", "DSH"),
-                    }
+                yield ScreenEntry(
+                    source_file=source_file,
+                    screen_id=screen_id,
+                    surface_id=sys.intern(surface or row.get("role", "")),
+                    screen_title=row.get("screen_title", ""),
+                    status=sys.intern(row.get("status", "")),
+                    notes=row.get("notes", ""),
+                    endpoint=endpoint,
+                    operation_id_hint="",
+                    action_id_hint="",
+                    role=sys.intern(row.get("role", "")),
+                    method_hint=infer_method_hint(screen_id, row.get("notes", ""), method_rules),
+                    related_service=sys.intern(row.get("related_service", code)),
                 )
                 continue
             if "operation_id" in row:
                 operation_id = row.get("operation_id", "")
-                if not operation_id.startswith("dls_"):
+                if not operation_id_prefixes or not operation_id.startswith(operation_id_prefixes):
                     continue
                 screen_id = row.get("screen_id", row.get("surface_id", ""))
-                surface = row.get("surface_id") or infer_surface_from_screen(screen_id)
-                entries.append(
-                    {
-                        "source_file": rel_path,
-                        "screen_id": screen_id,
-                        "surface_id": surface or infer_surface_from_screen(screen_id),
-                        "screen_title": row.get("screen_title_ar", ""),
-                        "status": row.get("status", ""),
-                        "notes": "",
-                        "endpoint": "",
-                        "operation_id_hint": operation_id,
-                        "action_id_hint": row.get("action_id", ""),
-                        "role": "",
-                        "method_hint": None,
-                        "related_service": "DSH",
-                    }
+                surface = row.get("surface_id") or infer_surface_from_screen(screen_id, rules=surface_rules)
+                yield ScreenEntry(
+                    source_file=source_file,
+                    screen_id=screen_id,
+                    surface_id=sys.intern(surface),
+                    screen_title=row.get("screen_title_ar", ""),
+                    status=sys.intern(row.get("status", "")),
+                    notes="",
+                    endpoint="",
+                    operation_id_hint=operation_id,
+                    action_id_hint=row.get("action_id", ""),
+                    role="",
+                    method_hint=None,
+                    related_service=code,
                 )
-    return entries
 
 
 def collect_parameters(path_item: Dict[str, Any], operation: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -378,11 +435,12 @@ def extract_request_schema(operation: Dict[str, Any]) -> str:
     return ""
 
 
-def load_be_operations() -> List[Dict[str, Any]]:
-    doc = read_yaml(OPENAPI_PATH)
-    operations: List[Dict[str, Any]] = []
+def load_be_operations(profile: Dict[str, Any] = DSH_PROFILE) -> List[Operation]:
+    doc = read_spec(profile["openapi"]) or {}
+    prefixes = profile["path_prefixes"]
+    operations: List[Operation] = []
     for path, path_item in (doc.get("paths") or {}).items():
-        if not any(path.startswith(prefix) for prefix in DSH_PATH_PREFIXES):
+        if prefixes and not path.startswith(prefixes):
             continue
         if not isinstance(path_item, dict):
             continue
@@ -391,111 +449,157 @@ def load_be_operations() -> List[Dict[str, Any]]:
                 continue
             if not isinstance(operation, dict):
                 continue
-            operation_id = operation.get("operationId", "")
             params = collect_parameters(path_item, operation)
-            success_schema = extract_schema_ref(first_success_response(operation) or {})
             operations.append(
-                {
-                    "method": method.upper(),
-                    "path": path,
-                    "operation_id": operation_id,
-                    "summary": operation.get("summary", ""),
-                    "description": operation.get("description", ""),
-                    "tags": operation.get("tags", []) or [],
-                    "rbac_role": operation.get("x-rbac-role", ""),
-                    "action_id": normalise_action_id(operation.get("x-action-id")),
-                    "guards": operation.get("x-guards", ""),
-                    "entity_code": normalise_action_id(operation.get("x-entity-code")),
-                    "idempotency": has_idempotency(params),
-                    "pagination": has_pagination(params),
-                    "req_schema": extract_request_schema(operation),
-                    "res_schema": success_schema,
-                    "errors_profile": "Problem" if "default" in (operation.get("responses") or {}) else "",
-                    "parameters": params,
-                    "fe_screens": [],
-                }
+                Operation(
+                    method=sys.intern(method.upper()),
+                    path=path,
+                    operation_id=operation.get("operationId", ""),
+                    summary=operation.get("summary", ""),
+                    description=operation.get("description", ""),
+                    tags=[sys.intern(tag) for tag in operation.get("tags", []) or []],
+                    rbac_role=sys.intern(operation.get("x-rbac-role", "")),
+                    action_id=normalise_action_id(operation.get("x-action-id")),
+                    guards=sys.intern(operation.get("x-guards", "")),
+                    entity_code=normalise_action_id(operation.get("x-entity-code")),
+                    idempotency=has_idempotency(params),
+                    pagination=has_pagination(params),
+                    req_schema=extract_request_schema(operation),
+                    res_schema=extract_schema_ref(first_success_response(operation) or {}),
+                    errors_profile="Problem" if "default" in (operation.get("responses") or {}) else "",
+                    parameters=params,
+                )
             )
     return operations
 
 
-def pick_surface(op: Dict[str, Any]) -> str:
-    for tag in op.get("tags", []):
+def pick_surface(op: Operation) -> str:
+    for tag in op.tags:
         if tag.startswith(("APP-", "DASH-", "OPS", "PARTNER")):
             return tag
-    return op.get("tags", [""])[0] if op.get("tags") else ""
-
-
-def match_fe_to_be(fe_entries: List[Dict[str, Any]], be_operations: List[Dict[str, Any]]) -> None:
-    ops_by_operation_id = {op["operation_id"]: op for op in be_operations if op["operation_id"]}
-    ops_by_path: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    for op in be_operations:
-        ops_by_path[op["path"]].append(op)
-
+    return op.tags[0] if op.tags else ""
+
+
+def build_matcher(be_operations: List[Operation]) -> Dict[str, Any]:
+    return {
+        "by_operation_id": {op.operation_id: op for op in be_operations if op.operation_id},
+        "index": build_operation_index(be_operations),
+        "trie": compile_path_trie(op.path for op in be_operations),
+    }
+
+
+def match_entry(entry: ScreenEntry, matcher: Dict[str, Any]) -> Optional[Operation]:
+    """Resolve ``entry`` against the BE index, fill its resolved fields and return the matched operation."""
+    candidates: List[Operation] = []
+    if entry.operation_id_hint:
+        op = matcher["by_operation_id"].get(entry.operation_id_hint)
+        if op:
+            candidates = [op]
+    elif entry.endpoint:
+        # Concrete ids, other param spellings and query strings resolve to the BE template.
+        path = match_path(matcher["trie"], entry.endpoint)
+        if path:
+            candidates = resolve_operations(matcher["index"], path, entry.surface_id, entry.method_hint)
+    matched_op = candidates[0] if candidates else None
+    entry.trace_link_ok = matched_op is not None
+    if matched_op:
+        entry.operation_id = matched_op.operation_id
+        entry.method = matched_op.method
+        entry.path = matched_op.path
+        entry.rbac_role = matched_op.rbac_role
+        entry.action_id_resolved = matched_op.action_id or entry.action_id_hint
+    else:
+        entry.operation_id = entry.operation_id_hint
+        entry.method = entry.method_hint or ""
+        entry.path = entry.endpoint
+        entry.rbac_role = ""
+        entry.action_id_resolved = entry.action_id_hint
+    return matched_op
+
+
+def match_fe_to_be(
+    fe_entries: List[ScreenEntry],
+    be_operations: List[Operation],
+    matcher: Optional[Dict[str, Any]] = None,
+) -> MatchLinks:
+    matcher = matcher or build_matcher(be_operations)
+    links = MatchLinks()
     for entry in fe_entries:
-        matched_op: Optional[Dict[str, Any]] = None
-        candidates: List[Dict[str, Any]] = []
-        if entry["operation_id_hint"]:
-            op = ops_by_operation_id.get(entry["operation_id_hint"])
-            if op:
-                candidates = [op]
-        elif entry["endpoint"]:
-            candidates = list(ops_by_path.get(entry["endpoint"], []))
-        surface = entry.get("surface_id") or ""
-        if len(candidates) > 1 and surface:
-            tagged = [op for op in candidates if surface in op.get("tags", [])]
-            if tagged:
-                candidates = tagged
-        method_hint = entry.get("method_hint")
-        if len(candidates) > 1 and method_hint:
-            filtered = [op for op in candidates if op["method"] == method_hint]
-            if filtered:
-                candidates = filtered
-        if candidates:
-            matched_op = candidates[0]
-            matched_op.setdefault("fe_screens", []).append(entry)
-        entry["matched_op"] = matched_op
-        entry["trace_link_ok"] = bool(matched_op)
-        if matched_op:
-            entry["operation_id"] = matched_op["operation_id"]
-            entry["method"] = matched_op["method"]
-            entry["path"] = matched_op["path"]
-            entry["rbac_role"] = matched_op.get("rbac_role", "")
-            entry["action_id_resolved"] = matched_op.get("action_id", "") or entry.get("action_id_hint", "")
-        else:
-            entry["operation_id"] = entry.get("operation_id_hint", "")
-            entry["method"] = method_hint or ""
-            entry["path"] = entry.get("endpoint", "")
-            entry["rbac_role"] = ""
-            entry["action_id_resolved"] = entry.get("action_id_hint", "")
+        links.link(entry, match_entry(entry, matcher))
+    links.rebuild(fe_entries)
+    return links
 
 
-def ensure_dist_dir() -> None:
-    DIST_DIR.mkdir(parents=True, exist_ok=True)
+def ensure_dist_dir(profile: Dict[str, Any] = DSH_PROFILE) -> Path:
+    dist_dir = profile["dist_dir"]
+    dist_dir.mkdir(parents=True, exist_ok=True)
+    return dist_dir
 
 
-def ensure_trace_dir() -> None:
+def ensure_trace_dir() -> Path:
     trace_dir = REPO_ROOT / "traces"
     trace_dir.mkdir(parents=True, exist_ok=True)
     return trace_dir
 
 
-def write_inventory(fe_entries: List[Dict[str, Any]], be_operations: List[Dict[str, Any]]) -> None:
-    ensure_dist_dir()
-    total_fe = len(fe_entries)
-    matched_fe = sum(1 for entry in fe_entries if entry["trace_link_ok"])
-    total_be = len(be_operations)
-    matched_be = sum(1 for op in be_operations if op.get("fe_screens"))
-    surface_counter_fe = Counter(entry.get("surface_id", "") for entry in fe_entries)
-    surface_counter_be = Counter(pick_surface(op) for op in be_operations)
+def inventory_stamp(reproducible: bool = False, profile: Dict[str, Any] = DSH_PROFILE) -> str:
+    """Header line for <SVC>_INVENTORY.md; byte-stable for unchanged inputs when reproducible."""
+    if reproducible and source_date_epoch() is None:
+        spec = [profile["openapi"]] if profile["openapi"].exists() else []
+        digest = files_digest([*spec, *list_screen_catalogs()], REPO_ROOT)
+        return f"*Source digest:* `{digest[:16]}`"
+    return f"*Generated at:* {build_datetime(dt.timezone.utc, reproducible).strftime('%Y-%m-%d %H:%M:%SZ')}"
+
+
+def operation_guards(op: Operation) -> tuple[str, ...]:
+    """Guard tokens of ``op``, deduplicated case-insensitively (first spelling kept)."""
+    return tuple({name.casefold(): name for name in parse_guards(op.guards)}.values())
+
+
+def add_to_cube(
+    cube: PivotCube,
+    fe_entries: List[ScreenEntry],
+    be_operations: List[Operation],
+    links: MatchLinks,
+    profile: Dict[str, Any] = DSH_PROFILE,
+) -> PivotCube:
+    """Count every operation and screen of one service into ``cube`` (see pivot_cube.DIMENSIONS / MEASURES)."""
+    code = profile["code"]
+    for op in be_operations:
+        values = (code, pick_surface(op), op.rbac_role, op.method, operation_guards(op), op.idempotency, op.pagination)
+        cube.add(values, (1, 0 if links.screens(op) else 1, 0, 0))
+    for entry in fe_entries:
+        cube.add((code, entry.surface_id, entry.rbac_role, entry.method, (), None, None), (0, 0, 1, 0 if entry.trace_link_ok else 1))
+    return cube
+
+
+def audit_cube(
+    fe_entries: List[ScreenEntry],
+    be_operations: List[Operation],
+    links: MatchLinks,
+    profile: Dict[str, Any] = DSH_PROFILE,
+) -> PivotCube:
+    return add_to_cube(PivotCube(), fe_entries, be_operations, links, profile)
+
+
+def write_inventory(cube: PivotCube, reproducible: bool = False, profile: Dict[str, Any] = DSH_PROFILE) -> None:
+    dist_dir = ensure_dist_dir(profile)
+    code = profile["code"]
+    totals = cube.totals()
+    total_fe = totals["screens"]
+    matched_fe = total_fe - totals["orphan_screens"]
+    total_be = totals["operations"]
+    matched_be = total_be - totals["orphan_operations"]
+    by_surface = cube.rollup(("surface",))
     lines = [
-        "# SRV-DSH Inventory",
+        f"# {profile['ssot_ref']} Inventory",
         "",
-        f"*Generated at:* {dt.datetime.now(dt.timezone.utc).strftime('%Y-%m-%d %H:%M:%SZ')}",
+        inventory_stamp(reproducible, profile),
         "",
         "## Summary",
         "",
-        f"- Total BE operations (DSH namespace): **{total_be}**",
-        f"- Total FE/Dashboard screens mapped to DSH: **{total_fe}**",
+        f"- Total BE operations ({code} namespace): **{total_be}**",
+        f"- Total FE/Dashboard screens mapped to {code}: **{total_fe}**",
         f"- Matched FE↔BE pairs: **{matched_fe}**",
         f"- Orphan BE operations: **{total_be - matched_be}**",
         f"- Orphan FE screens: **{total_fe - matched_fe}**",
@@ -507,37 +611,43 @@ def write_inventory(fe_entries: List[Dict[str, Any]], be_operations: List[Dict[s
         "| Surface | BE Operations | FE Screens |",
         "| --- | --- | --- |",
     ]
-    all_surfaces = sorted(set(surface_counter_be) | set(surface_counter_fe))
-    for surface in all_surfaces:
-        lines.append(
-            f"| {surface or '-'} | {surface_counter_be.get(surface, 0)} | {surface_counter_fe.get(surface, 0)} |"
-        )
+    for (surface,), (operations, _, screens, _) in sorted(by_surface.items()):
+        lines.append(f"| {surface or '-'} | {operations} | {screens} |")
     lines.append("")
     lines.append("## Notes")
     lines.append("")
-    lines.append("- Data derived from `oas/services/dsh/openapi.yaml` and screen catalogs under `apps/` and `dashboards/`.")
+    lines.append(
+        f"- Data derived from `{profile['openapi'].relative_to(REPO_ROOT).as_posix()}` and screen catalogs under `apps/` and `dashboards/`."
+    )
     lines.append("- TRACE ratio requires 1.00 for compliance; investigate orphans listed in parity output below.")
-    DIST_DIR.joinpath("DSH_INVENTORY.md").write_text("\n".join(lines), encoding="utf-8")
-
-
-def write_parity_csv(fe_entries: List[Dict[str, Any]], be_operations: List[Dict[str, Any]]) -> None:
-    ensure_dist_dir()
-    with DIST_DIR.joinpath("PARITY.csv").open("w", encoding="utf-8", newline="") as handle:
+    write_artifact(dist_dir / profile["inventory_name"], "\n".join(lines))
+
+
+def write_parity_csv(
+    fe_entries: List[ScreenEntry],
+    be_operations: List[Operation],
+    links: MatchLinks,
+    ordered: Optional[List[Operation]] = None,
+    profile: Dict[str, Any] = DSH_PROFILE,
+) -> None:
+    dist_dir = ensure_dist_dir(profile)
+    ssot_ref = profile["ssot_ref"]
+    with open_artifact(dist_dir / "PARITY.csv") as handle:
         writer = csv.DictWriter(handle, fieldnames=PARITY_HEADER)
         writer.writeheader()
-        for op in sorted(be_operations, key=lambda item: (item["path"], item["method"])):
-            fe_screens = op.get("fe_screens", [])
+        for op in ordered if ordered is not None else sorted(be_operations, key=route_sort_key):
+            fe_screens = links.screens(op)
             primary_screen = fe_screens[0] if fe_screens else None
             row = {
-                "ssot_ref": op.get("entity_code") or "SRV-DSH",
-                "service_code": "SRV-DSH",
+                "ssot_ref": op.entity_code or ssot_ref,
+                "service_code": ssot_ref,
                 "surface_id": pick_surface(op),
-                "screen_id": primary_screen.get("screen_id") if primary_screen else "",
-                "action_id": op.get("action_id", ""),
-                "operation_id": op.get("operation_id", ""),
-                "method": op.get("method", ""),
-                "path": op.get("path", ""),
-                "rbac_role": op.get("rbac_role", ""),
+                "screen_id": primary_screen.screen_id if primary_screen else "",
+                "action_id": op.action_id,
+                "operation_id": op.operation_id,
+                "method": op.method,
+                "path": op.path,
+                "rbac_role": op.rbac_role,
                 "target_BE": 1,
                 "target_FE": len(fe_screens),
                 "delta_BE": 0 if fe_screens else 1,
@@ -545,30 +655,30 @@ def write_parity_csv(fe_entries: List[Dict[str, Any]], be_operations: List[Dict[
                 "trace_link_ok": bool_str(bool(fe_screens)),
                 "orphan_FE_flag": bool_str(False),
                 "orphan_BE_flag": bool_str(not fe_screens),
-                "idempotency_present": bool_str(op.get("idempotency", False)),
-                "req_schema_ref": op.get("req_schema", ""),
-                "res_schema_ref": op.get("res_schema", ""),
-                "errors_profile_ref": op.get("errors_profile", ""),
-                "pagination_present": bool_str(op.get("pagination", False)),
-                "guards_status": op.get("guards", ""),
-                "desc_ar": primary_screen.get("screen_title") or primary_screen.get("notes") if primary_screen else "",
+                "idempotency_present": bool_str(op.idempotency),
+                "req_schema_ref": op.req_schema,
+                "res_schema_ref": op.res_schema,
+                "errors_profile_ref": op.errors_profile,
+                "pagination_present": bool_str(op.pagination),
+                "guards_status": op.guards,
+                "desc_ar": primary_screen.screen_title or primary_screen.notes if primary_screen else "",
             }
             writer.writerow(row)
         # record FE orphans (no BE mapping)
         for entry in fe_entries:
-            if entry["trace_link_ok"]:
+            if entry.trace_link_ok:
                 continue
             writer.writerow(
                 {
-                    "ssot_ref": "SRV-DSH",
-                    "service_code": "SRV-DSH",
-                    "surface_id": entry.get("surface_id", ""),
-                    "screen_id": entry.get("screen_id", ""),
-                    "action_id": entry.get("action_id_hint", ""),
-                    "operation_id": entry.get("operation_id", ""),
-                    "method": entry.get("method", ""),
-                    "path": entry.get("path", entry.get("endpoint", "")),
-                    "rbac_role": entry.get("rbac_role", ""),
+                    "ssot_ref": ssot_ref,
+                    "service_code": ssot_ref,
+                    "surface_id": entry.surface_id,
+                    "screen_id": entry.screen_id,
+                    "action_id": entry.action_id_hint,
+                    "operation_id": entry.operation_id,
+                    "method": entry.method,
+                    "path": entry.path,
+                    "rbac_role": entry.rbac_role,
                     "target_BE": 0,
                     "target_FE": 1,
                     "delta_BE": 1,
@@ -582,193 +692,777 @@ def write_parity_csv(fe_entries: List[Dict[str, Any]], be_operations: List[Dict[
                     "errors_profile_ref": "",
                     "pagination_present": "",
                     "guards_status": "",
-                    "desc_ar": entry.get("screen_title") or entry.get("notes", ""),
+                    "desc_ar": entry.screen_title or entry.notes,
                 }
             )
 
 
-def write_traceability(fe_entries: List[Dict[str, Any]]) -> None:
-    ensure_dist_dir()
-    ensure_trace_dir()
-    with DIST_DIR.joinpath("TRACEABILITY.csv").open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=TRACEABILITY_HEADER)
-        writer.writeheader()
-        for entry in sorted(fe_entries, key=lambda item: (item.get("surface_id", ""), item.get("screen_id", ""))):
-            writer.writerow(
-                {
-                    "surface_id": entry.get("surface_id", ""),
-                    "screen_id": entry.get("screen_id", ""),
-                    "action_id": entry.get("action_id_resolved", entry.get("action_id_hint", "")),
-                    "operation_id": entry.get("operation_id", ""),
-                    "method": entry.get("method", ""),
-                    "path": entry.get("path", entry.get("endpoint", "")),
-                    "rbac_role": entry.get("rbac_role", ""),
-                    "trace_link_ok": bool_str(entry.get("trace_link_ok", False)),
-                    "notes": entry.get("notes", "") or (entry["source_file"] if not entry.get("trace_link_ok") else ""),
-                }
-            )
-    trace_table_path = ensure_trace_dir() / "TRACE_TABLE.csv"
-    with trace_table_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=TRACEABILITY_HEADER)
-        writer.writeheader()
-        for entry in sorted(fe_entries, key=lambda item: (item.get("surface_id", ""), item.get("screen_id", ""))):
-            writer.writerow(
-                {
-                    "surface_id": entry.get("surface_id", ""),
-                    "screen_id": entry.get("screen_id", ""),
-                    "action_id": entry.get("action_id_resolved", entry.get("action_id_hint", "")),
-                    "operation_id": entry.get("operation_id", ""),
-                    "method": entry.get("method", ""),
-                    "path": entry.get("path", entry.get("endpoint", "")),
-                    "rbac_role": entry.get("rbac_role", ""),
-                    "trace_link_ok": bool_str(entry.get("trace_link_ok", False)),
-                    "notes": entry.get("notes", ""),
-                }
-            )
+def screen_sort_key(entry: ScreenEntry) -> tuple[str, str]:
+    return (entry.surface_id, entry.screen_id)
+
 
+def route_sort_key(op: Operation) -> tuple[str, str]:
+    return (op.path, op.method)
 
-def write_screens_catalog(fe_entries: List[Dict[str, Any]]) -> None:
+
+def write_traceability(
+    fe_entries: List[ScreenEntry],
+    ordered: Optional[List[ScreenEntry]] = None,
+    profile: Dict[str, Any] = DSH_PROFILE,
+) -> None:
+    """Write dist TRACEABILITY.csv and, for the shared-outputs service, traces/TRACE_TABLE.csv in one pass.
+
+    The two files only differ in ``notes`` for orphan screens (the dist copy
+    points at the source catalog), so every other column is built once.
+    """
+    dist_dir = ensure_dist_dir(profile)
+    with ExitStack() as stack:
+        dist_writer = csv.writer(stack.enter_context(open_artifact(dist_dir / "TRACEABILITY.csv")))
+        if profile["shared_outputs"]:
+            trace_table_path = ensure_trace_dir() / "TRACE_TABLE.csv"
+            trace_writer = csv.writer(stack.enter_context(open_artifact(trace_table_path)))
+        else:
+            trace_writer = csv.writer(io.StringIO())
+        dist_writer.writerow(TRACEABILITY_HEADER)
+        trace_writer.writerow(TRACEABILITY_HEADER)
+        for entry in ordered if ordered is not None else sorted(fe_entries, key=screen_sort_key):
+            linked = entry.trace_link_ok
+            notes = entry.notes
+            row = [
+                entry.surface_id,
+                entry.screen_id,
+                entry.action_id_resolved,
+                entry.operation_id,
+                entry.method,
+                entry.path,
+                entry.rbac_role,
+                bool_str(linked),
+                notes,
+            ]
+            trace_writer.writerow(row)
+            if not notes and not linked:
+                row[-1] = entry.source_file
+            dist_writer.writerow(row)
+
+
+def write_screens_catalog(fe_entries: List[ScreenEntry], ordered: Optional[List[ScreenEntry]] = None) -> None:
     catalog_dir = REPO_ROOT / "dashboards" / "screens"
     catalog_dir.mkdir(parents=True, exist_ok=True)
     catalog_path = catalog_dir / "SCREENS_CATALOG.csv"
-    with catalog_path.open("w", encoding="utf-8", newline="") as handle:
+    with open_artifact(catalog_path) as handle:
         writer = csv.DictWriter(handle, fieldnames=SCREENS_CATALOG_HEADER)
         writer.writeheader()
-        for entry in sorted(fe_entries, key=lambda item: (item.get("surface_id", ""), item.get("screen_id", ""))):
+        for entry in ordered if ordered is not None else sorted(fe_entries, key=screen_sort_key):
             writer.writerow(
                 {
-                    "surface_id": entry.get("surface_id", ""),
-                    "screen_id": entry.get("screen_id", ""),
-                    "screen_title": entry.get("screen_title", ""),
-                    "related_service": entry.get("related_service", "DSH"),
-                    "main_endpoint": entry.get("endpoint") or entry.get("path", ""),
-                    "role": entry.get("role", "") or entry.get("rbac_role", ""),
-                    "status": entry.get("status", "") or "DRAFT",
-                    "notes": entry.get("notes", ""),
-                    "source_file": entry.get("source_file", ""),
+                    "surface_id": entry.surface_id,
+                    "screen_id": entry.screen_id,
+                    "screen_title": entry.screen_title,
+                    "related_service": entry.related_service,
+                    "main_endpoint": entry.endpoint or entry.path,
+                    "role": entry.role or entry.rbac_role,
+                    "status": entry.status or "DRAFT",
+                    "notes": entry.notes,
+                    "source_file": entry.source_file,
                 }
             )
 
 
-def write_param_spec(be_operations: List[Dict[str, Any]]) -> None:
-    ensure_dist_dir()
+def write_param_spec(be_operations: List[Operation], profile: Dict[str, Any] = DSH_PROFILE) -> None:
+    dist_dir = ensure_dist_dir(profile)
     spec: Dict[str, Any] = {}
     for op in be_operations:
-        operation_id = op.get("operation_id")
+        operation_id = op.operation_id
         if not operation_id:
             continue
         bindings = RUNTIME_BINDINGS.get(operation_id, {})
         spec[operation_id] = {
             "operationId": operation_id,
-            "method": op.get("method", ""),
-            "path": op.get("path", ""),
+            "method": op.method,
+            "path": op.path,
             "surface": pick_surface(op),
-            "rbac_role": op.get("rbac_role", ""),
+            "rbac_role": op.rbac_role,
             "runtime_vars": bindings.get("runtime_vars", []),
-            "policies": parse_guards(op.get("guards", "")),
+            "policies": parse_guards(op.guards),
             "notes": bindings.get("notes", ""),
         }
-    output_path = DIST_DIR / "PARAM_SPEC.json"
-    output_path.write_text(json.dumps(spec, indent=2, ensure_ascii=False), encoding="utf-8")
-
-
-def write_routes_table(be_operations: List[Dict[str, Any]]) -> None:
-    ensure_dist_dir()
-    target_path = DIST_DIR / "ROUTES_TABLE.csv"
-    with target_path.open("w", encoding="utf-8", newline="") as handle:
+    output_path = dist_dir / "PARAM_SPEC.json"
+    write_artifact(output_path, json.dumps(spec, indent=2, ensure_ascii=False))
+
+
+def write_routes_table(
+    be_operations: List[Operation],
+    ordered: Optional[List[Operation]] = None,
+    profile: Dict[str, Any] = DSH_PROFILE,
+) -> None:
+    dist_dir = ensure_dist_dir(profile)
+    target_path = dist_dir / "ROUTES_TABLE.csv"
+    with open_artifact(target_path) as handle:
         writer = csv.DictWriter(handle, fieldnames=ROUTES_TABLE_HEADER)
         writer.writeheader()
-        for op in sorted(be_operations, key=lambda item: (item.get("path", ""), item.get("method", ""))):
-            tags = op.get("tags", []) or []
+        for op in ordered if ordered is not None else sorted(be_operations, key=route_sort_key):
             writer.writerow(
                 {
                     "surface_id": pick_surface(op),
-                    "operation_id": op.get("operation_id", ""),
-                    "action_id": op.get("action_id", ""),
-                    "method": op.get("method", ""),
-                    "path": op.get("path", ""),
-                    "rbac_role": op.get("rbac_role", ""),
-                    "idempotency": bool_str(op.get("idempotency", False)),
-                    "pagination": bool_str(op.get("pagination", False)),
-                    "guards_status": op.get("guards", ""),
-                    "tags": ",".join(tags),
+                    "operation_id": op.operation_id,
+                    "action_id": op.action_id,
+                    "method": op.method,
+                    "path": op.path,
+                    "rbac_role": op.rbac_role,
+                    "idempotency": bool_str(op.idempotency),
+                    "pagination": bool_str(op.pagination),
+                    "guards_status": op.guards,
+                    "tags": ",".join(op.tags),
                 }
             )
 
 
-def write_trace_drift(fe_entries: List[Dict[str, Any]]) -> None:
-    ensure_dist_dir()
-    drift_rows: List[Dict[str, str]] = []
+DRIFT_STOPWORDS = {"dls", "dl", "orders", "order", "partner", "partners", "user", "app", "captain", "cap", "list", "get", "post", "patch", "put", "timeline", "chat", "read", "ack", "notes", "receipt", "policy", "policies", "zones", "slots", "pickup", "close", "feedback", "create", "intake", "store", "identity", "documents"}
+DRIFT_NOTE = "screen_id naming drift vs operation_id"
 
-    stopwords = {"dls", "dl", "orders", "order", "partner", "partners", "user", "app", "captain", "cap", "list", "get", "post", "patch", "put", "timeline", "chat", "read", "ack", "notes", "receipt", "policy", "policies", "zones", "slots", "pickup", "close", "feedback", "create", "intake", "store", "identity", "documents"}
 
-    def tokens(value: str) -> set[str]:
-        raw = re.split(r"[^a-z0-9]+", value.lower())
-        return {token for token in raw if len(token) >= 3 and token not in stopwords}
+def drift_tokens(value: str) -> set[str]:
+    raw = re.split(r"[^a-z0-9]+", value.lower())
+    return {token for token in raw if len(token) >= 3 and token not in DRIFT_STOPWORDS}
+
+
+def naming_drift(entry: ScreenEntry) -> Optional[Dict[str, str]]:
+    """TRACE_DRIFT row for a matched screen whose id shares no meaningful token with its operationId."""
+    if not entry.trace_link_ok:
+        return None
+    screen = entry.screen_id.strip()
+    operation = entry.operation_id.strip()
+    if not screen or not operation:
+        return None
+    screen_tokens = drift_tokens(screen)
+    if not screen_tokens or screen_tokens & drift_tokens(operation):
+        return None
+    return {"surface_id": entry.surface_id, "screen_id": screen, "operation_id": operation, "note": DRIFT_NOTE}
 
-    for entry in fe_entries:
-        if not entry.get("trace_link_ok"):
-            continue
-        screen = (entry.get("screen_id") or "").strip()
-        operation = (entry.get("operation_id") or "").strip()
-        if not screen or not operation:
-            continue
-        if not tokens(screen):
-            continue
-        if tokens(screen) & tokens(operation):
-            continue
-        drift_rows.append(
-            {
-                "surface_id": entry.get("surface_id", ""),
-                "screen_id": screen,
-                "operation_id": operation,
-                "note": "screen_id naming drift vs operation_id",
-            }
-        )
 
-    target_path = DIST_DIR / "TRACE_DRIFT.csv"
-    with target_path.open("w", encoding="utf-8", newline="") as handle:
+def write_trace_drift(fe_entries: List[ScreenEntry], profile: Dict[str, Any] = DSH_PROFILE) -> None:
+    dist_dir = ensure_dist_dir(profile)
+    drift_rows = [row for row in map(naming_drift, fe_entries) if row is not None]
+
+    target_path = dist_dir / "TRACE_DRIFT.csv"
+    with open_artifact(target_path) as handle:
         writer = csv.DictWriter(handle, fieldnames=TRACE_DRIFT_HEADER)
         writer.writeheader()
         for row in drift_rows:
             writer.writerow(row)
 
 
-def write_rbac_matrix(be_operations: List[Dict[str, Any]]) -> None:
-    ensure_dist_dir()
-    matrix: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    roles_set: set[str] = set()
-    for op in be_operations:
-        surface = pick_surface(op) or "UNSPECIFIED"
-        role = (op.get("rbac_role") or "unspecified").strip() or "unspecified"
-        roles_set.add(role)
-        matrix[surface][role] += 1
-        matrix[surface]["TOTAL"] += 1
-    roles = sorted(role for role in roles_set)
-    header = ["surface_id", "TOTAL", *roles]
-    target_path = DIST_DIR / "RBAC_MATRIX.csv"
-    with target_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=header)
+def operation_tokens(op: Operation) -> set[str]:
+    return split_tokens(op.operation_id, op.action_id, op.path)
+
+
+def screen_tokens(entry: ScreenEntry) -> set[str]:
+    return split_tokens(
+        entry.screen_id,
+        entry.endpoint,
+        entry.operation_id_hint,
+        entry.action_id_hint,
+    )
+
+
+def write_orphan_suggestions(
+    fe_entries: List[ScreenEntry],
+    be_operations: List[Operation],
+    links: MatchLinks,
+    top_k: int = SUGGESTIONS_TOP_K,
+    profile: Dict[str, Any] = DSH_PROFILE,
+) -> None:
+    """Top-k BE operations per orphan screen and top-k screens per orphan operation."""
+    dist_dir = ensure_dist_dir(profile)
+    op_documents = {position: operation_tokens(op) for position, op in enumerate(be_operations)}
+    op_surfaces = {position: pick_surface(op) for position, op in enumerate(be_operations)}
+    screen_documents = {position: screen_tokens(entry) for position, entry in enumerate(fe_entries)}
+    screen_surfaces = {position: entry.surface_id for position, entry in enumerate(fe_entries)}
+
+    fe_orphans = [
+        (position, screen_documents[position], screen_surfaces[position])
+        for position, entry in enumerate(fe_entries)
+        if not entry.trace_link_ok
+    ]
+    be_orphans = [
+        (position, op_documents[position], op_surfaces[position])
+        for position, op in enumerate(be_operations)
+        if op not in links.op_screens
+    ]
+    fe_suggestions = suggest(fe_orphans, op_documents, op_surfaces, top_k)
+    be_suggestions = suggest(be_orphans, screen_documents, screen_surfaces, top_k)
+
+    def op_ref(op: Operation) -> str:
+        return f"{op.method} {op.path}"
+
+    rows: List[Dict[str, Any]] = []
+    for position, ranked in fe_suggestions.items():
+        entry = fe_entries[position]
+        for rank_number, (candidate, score, shared) in enumerate(ranked, start=1):
+            op = be_operations[candidate]
+            rows.append(
+                {
+                    "orphan_kind": "FE",
+                    "surface_id": entry.surface_id,
+                    "orphan_id": entry.screen_id,
+                    "orphan_ref": entry.endpoint or entry.operation_id_hint,
+                    "rank": rank_number,
+                    "candidate_id": op.operation_id,
+                    "candidate_ref": op_ref(op),
+                    "candidate_surface": op_surfaces[candidate],
+                    "score": f"{score:.3f}",
+                    "shared_tokens": " ".join(shared),
+                }
+            )
+    ordered_be = sorted(be_suggestions.items(), key=lambda item: route_sort_key(be_operations[item[0]]))
+    for position, ranked in ordered_be:
+        op = be_operations[position]
+        for rank_number, (candidate, score, shared) in enumerate(ranked, start=1):
+            entry = fe_entries[candidate]
+            rows.append(
+                {
+                    "orphan_kind": "BE",
+                    "surface_id": op_surfaces[position],
+                    "orphan_id": op.operation_id,
+                    "orphan_ref": op_ref(op),
+                    "rank": rank_number,
+                    "candidate_id": entry.screen_id,
+                    "candidate_ref": entry.endpoint or entry.operation_id_hint,
+                    "candidate_surface": entry.surface_id,
+                    "score": f"{score:.3f}",
+                    "shared_tokens": " ".join(shared),
+                }
+            )
+
+    with open_artifact(dist_dir / "ORPHAN_SUGGESTIONS.csv") as handle:
+        writer = csv.DictWriter(handle, fieldnames=ORPHAN_SUGGESTIONS_HEADER)
         writer.writeheader()
-        for surface in sorted(matrix.keys()):
-            row = {"surface_id": surface, "TOTAL": matrix[surface].get("TOTAL", 0)}
-            for role in roles:
-                row[role] = matrix[surface].get(role, 0)
-            writer.writerow(row)
+        writer.writerows(rows)
+
+
+RBAC_LABELS = {
+    "surface": lambda surface: surface or "UNSPECIFIED",
+    "role": lambda role: (role or "unspecified").strip() or "unspecified",
+}
+
+
+def write_rbac_matrix(cube: PivotCube, profile: Dict[str, Any] = DSH_PROFILE) -> None:
+    dist_dir = ensure_dist_dir(profile)
+    roles, rows = crosstab(cube, "surface", "role", "operations", RBAC_LABELS)
+    with open_artifact(dist_dir / "RBAC_MATRIX.csv") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["surface_id", "TOTAL", *roles])
+        for surface, total, counts in rows:
+            writer.writerow([surface, total, *(counts.get(role, 0) for role in roles)])
+
+
+def write_inventory_db(
+    fe_entries: List[ScreenEntry],
+    be_operations: List[Operation],
+    links: MatchLinks,
+    profile: Dict[str, Any] = DSH_PROFILE,
+) -> None:
+    """Write INVENTORY.sqlite: operations, screens, links, guards and tags with indexed filter columns."""
+    dist_dir = ensure_dist_dir(profile)
+    op_ids = {op: number for number, op in enumerate(be_operations, start=1)}
+    screen_ids = {entry: number for number, entry in enumerate(fe_entries, start=1)}
+    tables: Dict[str, List[tuple]] = {
+        "meta": [
+            ("service", profile["code"]),
+            ("ssot_ref", profile["ssot_ref"]),
+            ("openapi", profile["openapi"].relative_to(REPO_ROOT).as_posix()),
+        ],
+        "operations": [
+            (
+                op_ids[op],
+                op.operation_id,
+                op.method,
+                op.path,
+                pick_surface(op),
+                op.rbac_role,
+                op.action_id,
+                op.guards,
+                op.entity_code,
+                int(op.idempotency),
+                int(op.pagination),
+                op.req_schema,
+                op.res_schema,
+                op.errors_profile,
+                len(links.screens(op)),
+            )
+            for op in be_operations
+        ],
+        "screens": [
+            (
+                screen_ids[entry],
+                entry.screen_id,
+                entry.surface_id,
+                entry.screen_title,
+                entry.status,
+                entry.role,
+                entry.endpoint,
+                entry.operation_id,
+                entry.method,
+                entry.path,
+                entry.rbac_role,
+                entry.action_id_resolved,
+                int(entry.trace_link_ok),
+                entry.source_file,
+            )
+            for entry in fe_entries
+        ],
+        "links": [(screen_ids[entry], op_ids[op]) for entry, op in links.screen_op.items()],
+        "guards": [
+            (op_ids[op], guard)
+            for op in be_operations
+            # guard names compare case-insensitively in the store
+            for guard in operation_guards(op)
+        ],
+        "tags": [(op_ids[op], tag) for op in be_operations for tag in dict.fromkeys(op.tags)],
+    }
+    write_store(dist_dir / STORE_NAME, tables)
+
+
+def audit_snapshot(
+    fe_entries: List[ScreenEntry],
+    be_operations: List[Operation],
+    links: MatchLinks,
+    profile: Dict[str, Any] = DSH_PROFILE,
+) -> Dict[str, Any]:
+    """Per-entry hashes of everything the artifacts show, keyed by route and by catalog/screen id."""
+    screen_keys = dict(zip(fe_entries, unique_keys(f"{entry.source_file}:{entry.screen_id}" for entry in fe_entries)))
+    operations = {}
+    for op in be_operations:
+        surface = pick_surface(op)
+        linked = [screen_keys[entry] for entry in links.screens(op)]
+        fields = (
+            op.operation_id,
+            surface,
+            op.rbac_role,
+            op.action_id,
+            op.guards,
+            op.entity_code,
+            op.idempotency,
+            op.pagination,
+            op.req_schema,
+            op.res_schema,
+            op.errors_profile,
+            ",".join(op.tags),
+            *linked,
+        )
+        operations[f"{op.method} {op.path}"] = [surface, op.operation_id, int(bool(linked)), entry_hash(fields)]
+    screens = {}
+    for entry, key in screen_keys.items():
+        fields = (
+            entry.surface_id,
+            entry.screen_title,
+            entry.status,
+            entry.role,
+            entry.notes,
+            entry.endpoint,
+            entry.operation_id_hint,
+            entry.action_id_hint,
+            entry.operation_id,
+            entry.method,
+            entry.path,
+            entry.rbac_role,
+            entry.action_id_resolved,
+            entry.trace_link_ok,
+        )
+        screens[key] = [entry.surface_id, entry.screen_id, int(entry.trace_link_ok), entry_hash(fields)]
+    return build_snapshot(profile["code"], operations, screens)
+
+
+def write_audit_delta(
+    fe_entries: List[ScreenEntry],
+    be_operations: List[Operation],
+    links: MatchLinks,
+    baseline: Path,
+    profile: Dict[str, Any] = DSH_PROFILE,
+) -> None:
+    """Diff this run against the ``baseline`` snapshot into AUDIT_DELTA.json/.md, then store this run's snapshot."""
+    dist_dir = ensure_dist_dir(profile)
+    snapshot = audit_snapshot(fe_entries, be_operations, links, profile)
+    delta = diff_snapshots(load_snapshot(baseline), snapshot)
+    write_artifact(dist_dir / f"{DELTA_NAME}.json", json.dumps(delta, indent=2, ensure_ascii=False) + "\n")
+    write_artifact(dist_dir / f"{DELTA_NAME}.md", render_delta_markdown(delta))
+    write_artifact(dist_dir / SNAPSHOT_NAME, render_snapshot(snapshot))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate SRV-DSH inventory, parity and traceability artifacts")
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="Byte-stable artifacts: stamp SOURCE_DATE_EPOCH, or an input digest instead of the wall clock.",
+    )
+    parser.add_argument(
+        "--suggestions",
+        type=int,
+        default=SUGGESTIONS_TOP_K,
+        help="Candidates per orphan in ORPHAN_SUGGESTIONS.csv (0 skips the artifact).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Artifact writer threads (default: one per artifact; 1 writes serially).",
+    )
+    parser.add_argument(
+        "--db",
+        action="store_true",
+        help=f"Also write an indexed SQLite inventory ({STORE_NAME}) for scripts/query_inventory.py.",
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help=f"Also write {DELTA_NAME}.json/.md: changes since the previous run's {SNAPSHOT_NAME}.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        help=f"Snapshot to diff against with --delta (default: the last run's dist/dsh/{SNAPSHOT_NAME}).",
+    )
+    parser.add_argument(
+        "--ndjson",
+        metavar="TARGET",
+        default=None,
+        help="Stream link/orphan/drift records as NDJSON to TARGET ('-' for stdout) instead of writing the artifacts.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: re-audit incrementally whenever the spec or a screen catalog changes.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=WATCH_INTERVAL,
+        help="Polling interval in seconds for --watch.",
+    )
+    args = parser.parse_args()
+    if args.ndjson and args.watch:
+        parser.error("--ndjson streams a single run; it cannot be combined with --watch")
+    return args
+
+
+def write_artifacts(
+    fe_entries: List[ScreenEntry],
+    be_operations: List[Operation],
+    links: MatchLinks,
+    reproducible: bool = False,
+    suggestions: int = SUGGESTIONS_TOP_K,
+    jobs: int | None = None,
+    profile: Dict[str, Any] = DSH_PROFILE,
+    fe_only: bool = False,
+    inventory_db: bool = False,
+    delta_baseline: Optional[Path] = None,
+) -> None:
+    """Sort each collection once and run the independent writers on a thread pool.
+
+    Writers only read the matched entries and each owns its output file, so
+    they can run in any order; the first writer error is re-raised. With
+    ``fe_only`` the artifacts built purely from BE operations are skipped;
+    ``inventory_db`` adds INVENTORY.sqlite and ``delta_baseline`` the
+    AUDIT_DELTA report against that snapshot.
+    """
+    ensure_dist_dir(profile)
+    screens_ordered = sorted(fe_entries, key=screen_sort_key)
+    routes_ordered = sorted(be_operations, key=route_sort_key)
+    cube = audit_cube(fe_entries, be_operations, links, profile)
+    writers: List[Callable[[], None]] = [
+        lambda: write_inventory(cube, reproducible, profile),
+        lambda: write_parity_csv(fe_entries, be_operations, links, routes_ordered, profile),
+        lambda: write_traceability(fe_entries, screens_ordered, profile),
+        lambda: write_trace_drift(fe_entries, profile),
+    ]
+    if profile["shared_outputs"]:
+        writers.append(lambda: write_screens_catalog(fe_entries, screens_ordered))
+    if suggestions > 0:
+        writers.append(lambda: write_orphan_suggestions(fe_entries, be_operations, links, suggestions, profile))
+    if inventory_db:
+        writers.append(lambda: write_inventory_db(fe_entries, be_operations, links, profile))
+    if delta_baseline is not None:
+        writers.append(lambda: write_audit_delta(fe_entries, be_operations, links, delta_baseline, profile))
+    if not fe_only:
+        writers += [
+            lambda: write_param_spec(be_operations, profile),
+            lambda: write_routes_table(be_operations, routes_ordered, profile),
+            lambda: write_rbac_matrix(cube, profile),
+        ]
+
+    workers = max(1, min(jobs or len(writers), len(writers)))
+    if workers == 1:
+        for writer in writers:
+            writer()
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(writer) for writer in writers]:
+            future.result()
+
+
+def coverage_counts(total_be: int, total_fe: int, matched_be: int, matched_fe: int) -> Dict[str, Any]:
+    return {
+        "be_operations": total_be,
+        "fe_screens": total_fe,
+        "orphan_be": total_be - matched_be,
+        "orphan_fe": total_fe - matched_fe,
+        "trace": round(matched_fe / total_fe, 4) if total_fe else None,
+        "parity": round(matched_be / total_be, 4) if total_be else None,
+    }
+
+
+def audit_counts(fe_entries: List[ScreenEntry], be_operations: List[Operation], links: MatchLinks) -> Dict[str, Any]:
+    matched_fe = sum(1 for entry in fe_entries if entry.trace_link_ok)
+    return coverage_counts(len(be_operations), len(fe_entries), len(links.op_screens), matched_fe)
+
+
+def audit_model(
+    profile: Dict[str, Any] = DSH_PROFILE,
+    catalogs: Optional[List[tuple[str, List[Dict[str, str]]]]] = None,
+) -> AuditModel:
+    """Load and match one service without writing anything.
+
+    The importable entry point for in-process consumers such as
+    enforce_dsh_hard_gates.py, which evaluate the model directly instead of
+    re-reading the CSV artifacts; ``write_artifacts`` serialises the same model.
+    """
+    be_operations = load_be_operations(profile)
+    fe_entries = load_fe_entries(profile, catalogs)
+    return AuditModel(profile, fe_entries, be_operations, match_fe_to_be(fe_entries, be_operations))
+
+
+def run_audit(
+    profile: Dict[str, Any] = DSH_PROFILE,
+    catalogs: Optional[List[tuple[str, List[Dict[str, str]]]]] = None,
+    reproducible: bool = False,
+    suggestions: int = SUGGESTIONS_TOP_K,
+    jobs: int | None = None,
+    inventory_db: bool = False,
+    delta_baseline: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Load, match and write one service's artifacts; returns its coverage counts."""
+    model = audit_model(profile, catalogs)
+    write_artifacts(
+        model.fe_entries,
+        model.be_operations,
+        model.links,
+        reproducible,
+        suggestions,
+        jobs,
+        profile,
+        inventory_db=inventory_db,
+        delta_baseline=delta_baseline,
+    )
+    return audit_counts(model.fe_entries, model.be_operations, model.links)
+
+
+def iter_catalog_files() -> Iterator[tuple[str, List[Dict[str, str]]]]:
+    """Screen catalogs read one file at a time, so only the file being matched is held in memory."""
+    for path in list_screen_catalogs():
+        yield strip_catalog(read_catalog(path))
+
+
+def stream_records(
+    profile: Dict[str, Any] = DSH_PROFILE,
+    catalogs: Optional[Iterable[tuple[str, List[Dict[str, str]]]]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Audit records as soon as each is known.
+
+    While the catalogs are read, every screen yields a ``link`` or
+    ``orphan_fe`` record (plus a ``drift`` record for naming drift); screens
+    are not kept. Once all screens are matched, unmatched operations follow as
+    ``orphan_be`` records and a ``summary`` closes the service.
+    """
+    service = profile["code"]
+    be_operations = load_be_operations(profile)
+    matcher = build_matcher(be_operations)
+    matched_ops: set[Operation] = set()
+    total_fe = matched_fe = 0
+    for entry in iter_fe_entries(profile, catalogs if catalogs is not None else iter_catalog_files()):
+        op = match_entry(entry, matcher)
+        total_fe += 1
+        screen = {"service": service, "surface_id": entry.surface_id, "screen_id": entry.screen_id}
+        if op is None:
+            yield {
+                "type": "orphan_fe",
+                **screen,
+                "operation_id": entry.operation_id,
+                "method": entry.method,
+                "path": entry.path,
+                "source_file": entry.source_file,
+            }
+            continue
+        matched_fe += 1
+        matched_ops.add(op)
+        yield {
+            "type": "link",
+            **screen,
+            "operation_id": op.operation_id,
+            "method": op.method,
+            "path": op.path,
+            "rbac_role": op.rbac_role,
+            "action_id": entry.action_id_resolved,
+            "source_file": entry.source_file,
+        }
+        drift = naming_drift(entry)
+        if drift is not None:
+            yield {"type": "drift", "service": service, **drift}
+    for op in be_operations:
+        if op not in matched_ops:
+            yield {
+                "type": "orphan_be",
+                "service": service,
+                "surface_id": pick_surface(op),
+                "operation_id": op.operation_id,
+                "method": op.method,
+                "path": op.path,
+                "rbac_role": op.rbac_role,
+                "guards_status": op.guards,
+            }
+    yield {"type": "summary", "service": service, **coverage_counts(len(be_operations), total_fe, len(matched_ops), matched_fe)}
+
+
+def write_ndjson(records: Iterable[Dict[str, Any]], handle: TextIO) -> int:
+    """Write one JSON object per line, flushing each so a reader on a pipe sees it immediately."""
+    count = 0
+    for record in records:
+        handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        handle.flush()
+        count += 1
+    return count
+
+
+@contextmanager
+def open_ndjson(target: str) -> Iterator[TextIO]:
+    """``target`` opened for streaming (``-`` is stdout); a reader closing the pipe ends the stream quietly."""
+    try:
+        if target == "-":
+            yield sys.stdout
+        else:
+            with Path(target).open("w", encoding="utf-8", newline="\n") as handle:
+                yield handle
+    except BrokenPipeError:
+        # e.g. `| head`: point stdout at devnull so the interpreter's final flush does not raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+
+def file_signature(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_catalog_entries(path: Path, profile: Dict[str, Any] = DSH_PROFILE) -> List[ScreenEntry]:
+    return load_fe_entries(profile, [strip_catalog(read_catalog(path))])
+
+
+def watch(
+    profile: Dict[str, Any] = DSH_PROFILE,
+    interval: float = WATCH_INTERVAL,
+    reproducible: bool = False,
+    suggestions: int = SUGGESTIONS_TOP_K,
+    jobs: int | None = None,
+    inventory_db: bool = False,
+    delta_baseline: Optional[Path] = None,
+) -> None:
+    """Audit once, then poll the spec and catalogs and redo only what an edit touches.
+
+    A catalog edit reloads that file and re-matches its entries against the
+    in-memory BE index; BE-only artifacts are left alone. A spec edit reloads
+    the operations and re-matches everything. A file that fails to load is
+    reported and the previous state is kept until the next edit.
+    """
+    spec_path = profile["openapi"]
+    be_operations = load_be_operations(profile)
+    matcher = build_matcher(be_operations)
+    catalogs = list(list_screen_catalogs())
+    entries_by_catalog = {path: load_catalog_entries(path, profile) for path in catalogs}
+    fe_entries = [entry for path in catalogs for entry in entries_by_catalog[path]]
+    links = match_fe_to_be(fe_entries, be_operations, matcher)
+    write_artifacts(
+        fe_entries,
+        be_operations,
+        links,
+        reproducible,
+        suggestions,
+        jobs,
+        profile,
+        inventory_db=inventory_db,
+        delta_baseline=delta_baseline,
+    )
+    signatures = {path: file_signature(path) for path in [spec_path, *catalogs]}
+    print(f"Watching {spec_path.relative_to(REPO_ROOT).as_posix()} and {len(catalogs)} screen catalogs (Ctrl+C to stop)")
+
+    try:
+        while True:
+            time.sleep(interval)
+            current = list(list_screen_catalogs())
+            watched = [spec_path, *current]
+            changed = [path for path in watched if file_signature(path) != signatures.get(path)]
+            removed = [path for path in catalogs if path not in current]
+            if not changed and not removed:
+                continue
+            started = time.perf_counter()
+            signatures = {path: file_signature(path) for path in watched}
+            names = [path.relative_to(REPO_ROOT).as_posix() for path in changed + removed]
+            try:
+                spec_changed = spec_path in changed
+                new_operations = load_be_operations(profile) if spec_changed else be_operations
+                reloaded = {path: load_catalog_entries(path, profile) for path in changed if path != spec_path}
+            except Exception as exc:  # half-saved YAML/CSV: keep the last good state
+                print(f"[{time.strftime('%H:%M:%S')}] {', '.join(names)}: load failed ({exc}); keeping previous state")
+                continue
+
+            for path in removed:
+                entries_by_catalog.pop(path, None)
+            entries_by_catalog.update(reloaded)
+            catalogs = current
+            fe_entries = [entry for path in catalogs for entry in entries_by_catalog.get(path, [])]
+            if spec_changed:
+                be_operations = new_operations
+                matcher = build_matcher(be_operations)
+                rematch = fe_entries
+                links = match_fe_to_be(fe_entries, be_operations, matcher)
+            else:
+                rematch = [entry for entries in reloaded.values() for entry in entries]
+                for entry in rematch:
+                    links.link(entry, match_entry(entry, matcher))
+                links.rebuild(fe_entries)
+            write_artifacts(
+                fe_entries,
+                be_operations,
+                links,
+                reproducible,
+                suggestions,
+                jobs,
+                profile,
+                fe_only=not spec_changed,
+                inventory_db=inventory_db,
+                delta_baseline=delta_baseline,
+            )
+            print(
+                f"[{time.strftime('%H:%M:%S')}] {', '.join(names)}: re-matched {len(rematch)} entries, "
+                f"artifacts refreshed in {time.perf_counter() - started:.2f}s"
+            )
+    except KeyboardInterrupt:
+        print("Stopped watching")
 
 
 def main() -> None:
-    be_operations = load_be_operations()
-    fe_entries = load_fe_entries()
-    match_fe_to_be(fe_entries, be_operations)
-    write_inventory(fe_entries, be_operations)
-    write_parity_csv(fe_entries, be_operations)
-    write_traceability(fe_entries)
-    write_screens_catalog(fe_entries)
-    write_param_spec(be_operations)
-    write_routes_table(be_operations)
-    write_trace_drift(fe_entries)
-    write_rbac_matrix(be_operations)
+    args = parse_args()
+    if args.ndjson:
+        with open_ndjson(args.ndjson) as handle:
+            write_ndjson(stream_records(DSH_PROFILE), handle)
+        return
+    delta_baseline = (args.baseline or DSH_PROFILE["dist_dir"] / SNAPSHOT_NAME) if args.delta else None
+    if args.watch:
+        watch(DSH_PROFILE, args.interval, args.reproducible, args.suggestions, args.jobs, args.db, delta_baseline)
+        return
+    run_audit(DSH_PROFILE, None, args.reproducible, args.suggestions, args.jobs, args.db, delta_baseline)
     print(f"Generated inventory artifacts in {DIST_DIR}")
 
 
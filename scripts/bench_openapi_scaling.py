@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Scaling benchmark for generate_dsh_openapi.build_openapi and apply_baseline.
+
+For each catalog size a synthetic routes CSV is generated (synth_routes.py)
+and measured in a fresh subprocess, so peak RSS is per size. The report lists
+wall time per stage, rows per second, peak RSS and the scaling exponent
+between consecutive sizes (1.0 = linear). ``--max-exponent`` turns a
+super-linear regression into a non-zero exit for CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from generate_dsh_openapi import apply_baseline, build_openapi, load_routes
+from synth_routes import write_routes_csv
+
+# 1_000_000 rows needs ~10 GB for the in-memory build; pass it via --sizes.
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows runners
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def curated_baseline(doc: Dict) -> Dict:
+    """Baseline with a curated definition for every other schema, like the real spec."""
+    schemas = {}
+    for index, name in enumerate(doc["components"]["schemas"]):
+        if index % 2 == 0:
+            schemas[name] = {"type": "object", "properties": {"id": {"type": "string"}}}
+    return {"components": {"schemas": schemas}}
+
+
+def measure(csv_path: Path) -> Dict:
+    started = time.perf_counter()
+    rows = load_routes(csv_path)
+    loaded = time.perf_counter()
+    doc, operations = build_openapi(rows, None)
+    built = time.perf_counter()
+    baseline = curated_baseline(doc)
+    baseline_ready = time.perf_counter()
+    apply_baseline(doc, baseline)
+    applied = time.perf_counter()
+    return {
+        "rows": len(rows),
+        "paths": len(doc["paths"]),
+        "operations": operations,
+        "load_s": loaded - started,
+        "build_s": built - loaded,
+        "baseline_s": applied - baseline_ready,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_size(size: int, seed: int, data_dir: Path) -> Dict:
+    csv_path = data_dir / f"routes_{size}.csv"
+    if not csv_path.exists():
+        write_routes_csv(csv_path, size, seed)
+    completed = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--child", str(csv_path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def add_scaling(results: List[Dict]) -> None:
+    previous = None
+    for result in results:
+        work = result["build_s"] + result["baseline_s"]
+        result["rows_per_s"] = result["rows"] / work if work else float("inf")
+        result["exponent"] = None
+        if previous and work and previous[1] and result["rows"] > previous[0]:
+            result["exponent"] = math.log(work / previous[1]) / math.log(result["rows"] / previous[0])
+        previous = (result["rows"], work)
+
+
+def print_report(results: List[Dict]) -> None:
+    print("| Rows | Paths | Load (s) | build_openapi (s) | apply_baseline (s) | Rows/s | Peak RSS (MB) | Exponent |")
+    print("| --- | --- | --- | --- | --- | --- | --- | --- |")
+    for result in results:
+        rss = f"{result['peak_rss_mb']:.1f}" if result["peak_rss_mb"] is not None else "n/a"
+        exponent = f"{result['exponent']:.2f}" if result["exponent"] is not None else "-"
+        print(
+            f"| {result['rows']} | {result['paths']} | {result['load_s']:.3f} | {result['build_s']:.3f} "
+            f"| {result['baseline_s']:.4f} | {result['rows_per_s']:,.0f} | {rss} | {exponent} |"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure OpenAPI generator scaling on synthetic catalogs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Catalog sizes in rows")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for synth_routes")
+    parser.add_argument("--data-dir", type=Path, default=None, help="Keep generated CSVs here (default: temp dir)")
+    parser.add_argument("--json", type=Path, default=None, help="Also write raw results to this JSON file")
+    parser.add_argument(
+        "--max-exponent",
+        type=float,
+        default=None,
+        help="Fail when time grows faster than rows^N between consecutive sizes (e.g. 1.3)",
+    )
+    parser.add_argument("--child", type=Path, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child)))
+        return 0
+
+    with tempfile.TemporaryDirectory(prefix="openapi-bench-") as scratch:
+        data_dir = args.data_dir or Path(scratch)
+        data_dir.mkdir(parents=True, exist_ok=True)
+        results = [run_size(size, args.seed, data_dir) for size in sorted(args.sizes)]
+
+    add_scaling(results)
+    print_report(results)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    worst = max((result["exponent"] for result in results if result["exponent"] is not None), default=None)
+    if args.max_exponent is not None and worst is not None and worst > args.max_exponent:
+        print(f"Super-linear scaling detected: exponent {worst:.2f} > {args.max_exponent:.2f}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: compiled screen rules vs the per-keyword scan they replaced.
+
+Classifies the (screen_id, notes) pair of every row in the real screen
+catalogs, with the default rule tables and with ``--extra-rules`` synthetic
+rules added to each table (the cost of per-service extensions). The legacy
+engine is the old ``startswith`` chain / ``any(keyword in text)`` loop run
+over the same tables; both engines must agree on every row.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Callable, List, Optional, Tuple
+
+from screen_catalogs import load_catalogs
+from screen_rules import METHOD_RULES, SURFACE_RULES, Rule, RuleSet
+
+Pair = Tuple[str, str]
+
+
+def catalog_pairs() -> List[Pair]:
+    return [
+        ((row.get("screen_id") or "").strip(), (row.get("notes") or "").strip())
+        for catalog in load_catalogs()["catalogs"]
+        for row in catalog["rows"]
+    ]
+
+
+def synthetic_rules(prefix: str, count: int, upper: bool) -> Tuple[Rule, ...]:
+    rules = []
+    for number in range(count):
+        patterns = tuple(f"{prefix}{number}_{variant}" for variant in ("alpha", "beta", "gamma", "delta", "omega"))
+        rules.append((f"{prefix}{number}", f"X-{number}", tuple(p.upper() if upper else p for p in patterns)))
+    return tuple(rules)
+
+
+def legacy_surface(rules: Tuple[Rule, ...], screen_id: str) -> Optional[str]:
+    token = (screen_id or "").upper()
+    for _, value, prefixes in rules:
+        if token.startswith(prefixes):
+            return value
+    return None
+
+
+def legacy_method(rules: Tuple[Rule, ...], screen_id: str, notes: str) -> Optional[str]:
+    marker = f"{screen_id} {notes}".lower()
+    for _, value, keywords in rules:
+        if any(keyword in marker for keyword in keywords):
+            return value
+    return None
+
+
+def compiled_surface(rules: RuleSet, screen_id: str) -> Optional[str]:
+    fired = rules.match_prefix((screen_id or "").upper())
+    return fired[0] if fired else None
+
+
+def compiled_method(rules: RuleSet, screen_id: str, notes: str) -> Optional[str]:
+    fired = rules.search(f"{screen_id} {notes}".lower())
+    return fired[0] if fired else None
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compiled screen surface/method rules")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case; the best time is reported")
+    parser.add_argument("--copies", type=int, default=20, help="Times the catalog rows are repeated per run")
+    parser.add_argument("--extra-rules", type=int, nargs="+", default=[0, 50, 200], help="Synthetic rules per table")
+    args = parser.parse_args()
+
+    pairs = catalog_pairs() * args.copies
+    print(f"{len(pairs)} classifications per run ({len(pairs) // args.copies} catalog rows x {args.copies})")
+    print("| Rules per table (surface / method) | legacy (us/row) | compiled (us/row) | Speedup |")
+    print("| --- | --- | --- | --- |")
+    for extra in args.extra_rules:
+        surface_rules = SURFACE_RULES + synthetic_rules("SYN_", extra, upper=True)
+        method_rules = METHOD_RULES + synthetic_rules("syn", extra, upper=False)
+        surface_set = RuleSet(surface_rules)
+        method_set = RuleSet(method_rules)
+
+        def legacy() -> List[Tuple[Optional[str], Optional[str]]]:
+            return [(legacy_surface(surface_rules, s), legacy_method(method_rules, s, n)) for s, n in pairs]
+
+        def compiled() -> List[Tuple[Optional[str], Optional[str]]]:
+            return [(compiled_surface(surface_set, s), compiled_method(method_set, s, n)) for s, n in pairs]
+
+        if legacy() != compiled():
+            print(f"Engines disagree with {extra} extra rules", file=sys.stderr)
+            return 1
+        legacy_time = best_of(args.repeat, legacy) / len(pairs) * 1e6
+        compiled_time = best_of(args.repeat, compiled) / len(pairs) * 1e6
+        print(
+            f"| {len(surface_rules)} / {len(method_rules)} | {legacy_time:.2f} | {compiled_time:.2f} "
+            f"| {legacy_time / compiled_time:.1f}x |"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark pure-Python vs libyaml YAML I/O for each spec-reading script.
+
+Times the YAML work each script does on the real specs:
+
+- auto_dsh_audit: load oas/services/dsh/openapi.yaml
+- generate_explainar: load every oas/services/*/openapi.yaml
+- generate_dsh_openapi: load the --baseline spec and dump the generated spec
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import yaml
+
+from yaml_io import DUMP_DEFAULTS, HAS_LIBYAML, pick_dumper
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SERVICES_DIR = REPO_ROOT / "oas" / "services"
+DSH_SPEC = SERVICES_DIR / "dsh" / "openapi.yaml"
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def build_cases(texts: Dict[Path, str], loader: type, dumper: Callable[[object], type]) -> Dict[str, Callable[[], object]]:
+    dsh_text = texts[DSH_SPEC]
+    dsh_doc = yaml.load(dsh_text, Loader=yaml.SafeLoader)
+
+    def audit() -> object:
+        return yaml.load(dsh_text, Loader=loader)
+
+    def explainar() -> object:
+        return [yaml.load(text, Loader=loader) for text in texts.values()]
+
+    def generator() -> object:
+        yaml.load(dsh_text, Loader=loader)
+        return yaml.dump(dsh_doc, Dumper=dumper(dsh_doc), **DUMP_DEFAULTS)
+
+    return {
+        "auto_dsh_audit (spec load)": audit,
+        "generate_explainar (all service specs)": explainar,
+        "generate_dsh_openapi (baseline load + dump)": generator,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark libyaml-backed YAML I/O per script")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the best time is reported")
+    args = parser.parse_args()
+    if not HAS_LIBYAML:
+        print("PyYAML was built without libyaml; only the pure-Python path is available.", file=sys.stderr)
+        return 1
+
+    texts = {path: path.read_text(encoding="utf-8") for path in sorted(SERVICES_DIR.glob("*/openapi.yaml"))}
+    pure_cases = build_cases(texts, yaml.SafeLoader, lambda doc: yaml.SafeDumper)
+    fast_cases = build_cases(texts, yaml.CSafeLoader, pick_dumper)
+
+    print("| Script | pure-Python (s) | libyaml (s) | Speedup |")
+    print("| --- | --- | --- | --- |")
+    for name, pure in pure_cases.items():
+        pure_time = best_of(args.repeat, pure)
+        fast_time = best_of(args.repeat, fast_cases[name])
+        print(f"| {name} | {pure_time:.3f} | {fast_time:.3f} | {pure_time / fast_time:.1f}x |")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
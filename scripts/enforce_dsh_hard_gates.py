@@ -1,96 +1,98 @@
 #!/usr/bin/env python3
-"""Enforce SRV-DSH Wave 00 hard gates before declaring GO."""
+"""Enforce SRV-DSH Wave 00 hard gates before declaring GO.
+
+The gates are the thresholds declared in dashboards/guards/hard_gates.yml
+(or any gate file passed with ``--gates``), compiled and evaluated by
+scripts/gate_engine.py in one pass per artifact. By default the service's
+audit runs in this process (``auto_dsh_audit.audit_model``) and the
+PARITY.csv / TRACE_TABLE.csv gates read the matched model instead of
+re-parsing the CSVs. With ``--artifacts``, or when the audit cannot run here
+(PyYAML or the service spec missing), the written files are read instead;
+the source used is noted on stderr. ``--write`` also writes the audit
+artifacts from the same model and fails rather than falling back. The guard
+statuses always come from the guards report, which the audit does not produce.
+"""
 
 from __future__ import annotations
 
-import csv
-import re
+import argparse
 import sys
 from pathlib import Path
-
-if hasattr(sys.stdout, "reconfigure"):
-    sys.stdout.reconfigure(encoding="utf-8")
-
-REPO_ROOT = Path(__file__).resolve().parent.parent
-PARITY_PATH = REPO_ROOT / "dist" / "dsh" / "PARITY.csv"
-TRACE_TABLE_PATH = REPO_ROOT / "traces" / "TRACE_TABLE.csv"
-GUARDS_REPORT_PATH = REPO_ROOT / "dist" / "dsh" / "DSH_GUARDS_REPORT.md"
-GATES_DEF_PATH = REPO_ROOT / "dashboards" / "guards" / "hard_gates.yml"
-
-
-def read_csv(path: Path) -> list[dict[str, str]]:
-    if not path.exists():
-        raise FileNotFoundError(f"Missing required artifact: {path}")
-    with path.open("r", encoding="utf-8-sig") as handle:
-        return list(csv.DictReader(handle))
-
-
-def check_parity(rows: list[dict[str, str]]) -> list[str]:
-    issues: list[str] = []
-    be_rows = [row for row in rows if row.get("target_BE", "").strip() == "1"]
-    fe_only_rows = [row for row in rows if row.get("target_BE", "").strip() == "0"]
-    if not be_rows:
-        issues.append("Parity check: no backend rows found in PARITY.csv")
-        return issues
-    unmatched = [row for row in be_rows if row.get("trace_link_ok", "").upper() != "TRUE"]
-    orphan_be = [row for row in be_rows if row.get("orphan_BE_flag", "").upper() == "TRUE"]
-    orphan_fe = [row for row in fe_only_rows if row.get("orphan_FE_flag", "").upper() == "TRUE"]
-    ratio = (len(be_rows) - len(unmatched)) / len(be_rows)
-    if ratio < 1.0:
-        issues.append(f"Parity ratio {ratio:.2f} < 1.0")
-    if orphan_be:
-        issues.append(f"Found {len(orphan_be)} backend orphan rows (see PARITY.csv)")
-    if orphan_fe:
-        issues.append(f"Found {len(orphan_fe)} front-end orphan rows (see PARITY.csv)")
-    return issues
-
-
-def check_trace_table() -> list[str]:
-    issues: list[str] = []
-    rows = read_csv(TRACE_TABLE_PATH)
-    missing = [row for row in rows if row.get("trace_link_ok", "").upper() != "TRUE"]
-    if missing:
-        issues.append(f"TRACE table contains {len(missing)} missing links (TRACE_TABLE.csv)")
-    return issues
-
-
-def parse_guard_statuses(text: str) -> dict[str, str]:
-    guard_status: dict[str, str] = {}
-    table_section = False
-    for line in text.splitlines():
-        if line.strip().startswith("| Guard"):
-            table_section = True
-            continue
-        if table_section:
-            if not line.strip() or not line.strip().startswith("|"):
-                break
-            cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
-            if len(cells) < 2 or cells[0] in ("Guard", "---"):
-                continue
-            guard_status[cells[0]] = cells[1]
-    return guard_status
-
-
-def check_guards() -> list[str]:
-    if not GUARDS_REPORT_PATH.exists():
-        return ["Guard report missing: dist/dsh/DSH_GUARDS_REPORT.md"]
-    text = GUARDS_REPORT_PATH.read_text(encoding="utf-8")
-    statuses = parse_guard_statuses(text)
-    failing = {name: status for name, status in statuses.items() if "✅" not in status}
-    if failing:
-        return [
-            "Non-pass guard statuses detected: "
-            + ", ".join(f"{name} -> {status}" for name, status in failing.items())
-        ]
-    return []
+from typing import Any, Dict, Optional
+
+from gate_engine import DEFAULT_GATES_PATH, RowSource, evaluate, load_gates, model_sources
+
+
+def load_model(service: str, write: bool) -> Optional[Any]:
+    """The audit model of ``service`` (``SRV-DSH`` or ``DSH``), or None (with a note) when it cannot run here.
+
+    With ``write`` the audit must run: a missing dependency or input exits
+    instead of silently leaving the artifacts stale.
+    """
+    code = service.upper().removeprefix("SRV-") or "DSH"
+    try:
+        from auto_dsh_audit import audit_model, service_profile, write_artifacts
+
+        model = audit_model(service_profile(code))
+    except (ImportError, FileNotFoundError) as exc:
+        if write:
+            raise SystemExit(f"--write needs the in-process audit of {code}: {exc}")
+        print(f"{code}: in-process audit unavailable ({exc}); gates read the written artifacts.", file=sys.stderr)
+        return None
+    if write:
+        write_artifacts(model.fe_entries, model.be_operations, model.links, profile=model.profile)
+    print(f"{code}: gates read the in-process audit model.", file=sys.stderr)
+    return model
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Enforce the hard gates declared in gate files")
+    parser.add_argument(
+        "--gates",
+        type=Path,
+        nargs="+",
+        default=[DEFAULT_GATES_PATH],
+        help="Gate files to enforce, e.g. one per service (default: dashboards/guards/hard_gates.yml).",
+    )
+    parser.add_argument("--fail-fast", action="store_true", help="Stop at the first failing gate.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--artifacts",
+        action="store_true",
+        help="Evaluate the written PARITY.csv / TRACE_TABLE.csv instead of running the audit in-process.",
+    )
+    source.add_argument(
+        "--write", action="store_true", help="Also write the audit artifacts from the in-process model."
+    )
+    return parser.parse_args()
 
 
 def main() -> int:
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+    args = parse_args()
     errors: list[str] = []
-    parity_rows = read_csv(PARITY_PATH)
-    errors.extend(check_parity(parity_rows))
-    errors.extend(check_trace_table())
-    errors.extend(check_guards())
+    passed: list[str] = []
+    for gates_path in args.gates:
+        try:
+            service, gates = load_gates(gates_path)
+        except (OSError, ValueError) as exc:
+            print(f"Invalid gate file: {exc}", file=sys.stderr)
+            return 2
+        sources: Dict[Path, RowSource] = {}
+        if args.artifacts:
+            print(f"{service or gates_path.name}: gates read the written artifacts.", file=sys.stderr)
+        else:
+            model = load_model(service, args.write)
+            if model is not None:
+                sources = model_sources(model)
+        for gate, issue in evaluate(gates, sources, args.fail_fast):
+            if issue:
+                errors.append(issue)
+            else:
+                passed.append(f"{service or gates_path.name}:{gate.name}")
+        if errors and args.fail_fast:
+            break
 
     if errors:
         print("HARD GATES FAILED:")
@@ -98,7 +100,7 @@ def main() -> int:
             print(f"- {issue}")
         return 1
 
-    print("All hard gates satisfied (PARITY=1.00, TRACE=1.00, guard statuses PASS).")
+    print(f"All hard gates satisfied ({', '.join(passed)}).")
     return 0
 
 
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Hard gates compiled from a gate file such as dashboards/guards/hard_gates.yml.
+
+Every entry under ``thresholds`` becomes a ``Gate``: its kind (the entry name,
+or an explicit ``kind:``) supplies a scope predicate, a violation predicate
+and the verdict, and the entry supplies the limit (``target`` ratio,
+``allowed`` count or ``required_status``) and the ``artifact`` to read. A
+ratio gate fails on an artifact with no rows in scope unless it sets
+``allow_empty: true``. Gates
+on the same artifact share one streaming pass over its rows, so PARITY.csv is
+read once for the parity and orphan gates. Another service only needs its
+own gate file pointing at its artifacts.
+
+Rows come from the artifact on disk, or from ``model_sources`` when the audit
+model is already in memory; both use the CSV column names.
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from yaml_io import read_yaml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_GATES_PATH = REPO_ROOT / "dashboards" / "guards" / "hard_gates.yml"
+
+Row = Dict[str, str]
+RowSource = Callable[[], Iterator[Row]]
+
+# required_status -> markers of a satisfied guard in DSH_GUARDS_REPORT.md. Word
+# markers must be a whole token; symbol markers such as the emoji match anywhere.
+STATUS_MARKERS = {"pass": ("✅",)}
+STATUS_TOKEN = re.compile(r"[^\s/,;:()\[\]]+")
+WORD_MARKER = re.compile(r"\w+")
+
+
+def flag(row: Row, column: str) -> bool:
+    return (row.get(column) or "").strip().upper() == "TRUE"
+
+
+def be_row(row: Row) -> bool:
+    return (row.get("target_BE") or "").strip() == "1"
+
+
+def fe_only_row(row: Row) -> bool:
+    return (row.get("target_BE") or "").strip() == "0"
+
+
+def any_row(row: Row) -> bool:
+    return True
+
+
+def status_tokens(status: str) -> Set[str]:
+    """Whole tokens of a status cell, so "BYPASS" never reads as "PASS"."""
+    return {token.upper() for token in STATUS_TOKEN.findall(status)}
+
+
+def status_matches(status: str, markers: Set[str]) -> bool:
+    """True when ``status`` carries a marker: a word marker as a whole token, a symbol marker anywhere."""
+    if any(marker in status for marker in markers if not WORD_MARKER.fullmatch(marker)):
+        return True
+    return bool(status_tokens(status) & markers)
+
+
+@dataclass(slots=True)
+class Gate:
+    """One compiled threshold: counts in-scope rows and violations while its artifact streams past."""
+
+    name: str
+    artifact: Path
+    description: str
+    applies: Callable[[Row], bool]
+    violates: Callable[[Row], bool]
+    verdict: Callable[["Gate"], Optional[str]]
+    limit: float
+    noun: str
+    label: Optional[Callable[[Row], str]] = None
+    allow_empty: bool = False
+    seen: int = 0
+    violations: int = 0
+    stopped: int = 0
+    examples: List[str] = field(default_factory=list)
+
+    def feed(self, row: Row) -> None:
+        if not self.applies(row):
+            return
+        self.seen += 1
+        if self.violates(row):
+            self.violations += 1
+            if self.label is not None:
+                self.examples.append(self.label(row))
+
+    def failed_early(self) -> bool:
+        """True once no further rows can make the gate pass."""
+        if self.verdict is ratio_verdict:
+            return self.limit >= 1.0 and self.violations > 0
+        return self.violations > self.limit
+
+    def issue(self) -> Optional[str]:
+        return self.verdict(self)
+
+
+def ratio_verdict(gate: Gate) -> Optional[str]:
+    if not gate.seen:
+        if gate.allow_empty:
+            return None
+        return f"{gate.name.upper()} check: no {gate.noun} rows found in {gate.artifact.name}"
+    if gate.stopped:
+        return (
+            f"{gate.name.upper()} below {gate.limit}: at least {gate.violations} {gate.noun} rows unlinked "
+            f"(stopped early after {gate.stopped} rows of {gate.artifact.name})"
+        )
+    ratio = (gate.seen - gate.violations) / gate.seen
+    if ratio >= gate.limit:
+        return None
+    return (
+        f"{gate.name.upper()} ratio {ratio:.2f} < {gate.limit}: "
+        f"{gate.violations} of {gate.seen} {gate.noun} rows unlinked ({gate.artifact.name})"
+    )
+
+
+def count_verdict(gate: Gate) -> Optional[str]:
+    if gate.violations <= gate.limit:
+        return None
+    if gate.stopped:
+        return f"Found at least {gate.violations} {gate.noun} rows (stopped early; see {gate.artifact.name})"
+    return f"Found {gate.violations} {gate.noun} rows (see {gate.artifact.name})"
+
+
+def guards_verdict(gate: Gate) -> Optional[str]:
+    if gate.violations <= gate.limit:
+        return None
+    suffix = " (stopped early)" if gate.stopped else ""
+    return f"Non-pass guard statuses detected{suffix}: " + ", ".join(gate.examples)
+
+
+def compile_ratio(
+    applies: Callable[[Row], bool], violates: Callable[[Row], bool], noun: str
+) -> Callable[..., Gate]:
+    def build(name: str, artifact: Path, description: str, spec: Dict[str, Any]) -> Gate:
+        target = float(spec.get("target", 1.0))
+        return Gate(
+            name, artifact, description, applies, violates, ratio_verdict, target, noun,
+            allow_empty=bool(spec.get("allow_empty", False)),
+        )
+
+    return build
+
+
+def compile_count(
+    applies: Callable[[Row], bool], violates: Callable[[Row], bool], noun: str
+) -> Callable[..., Gate]:
+    def build(name: str, artifact: Path, description: str, spec: Dict[str, Any]) -> Gate:
+        return Gate(name, artifact, description, applies, violates, count_verdict, int(spec.get("allowed", 0)), noun)
+
+    return build
+
+
+def compile_guards(name: str, artifact: Path, description: str, spec: Dict[str, Any]) -> Gate:
+    required = str(spec.get("required_status", "pass")).lower()
+    markers = {marker.upper() for marker in STATUS_MARKERS.get(required, (required,))}
+    return Gate(
+        name,
+        artifact,
+        description,
+        any_row,
+        lambda row: not status_matches(row["status"], markers),
+        guards_verdict,
+        int(spec.get("allowed", 0)),
+        "guard",
+        label=lambda row: f"{row['guard']} -> {row['status']}",
+    )
+
+
+GATE_KINDS: Dict[str, Callable[..., Gate]] = {
+    "parity": compile_ratio(be_row, lambda row: not flag(row, "trace_link_ok"), "backend"),
+    "trace": compile_ratio(any_row, lambda row: not flag(row, "trace_link_ok"), "screen"),
+    "orphan_be": compile_count(be_row, lambda row: flag(row, "orphan_BE_flag"), "backend orphan"),
+    "orphan_fe": compile_count(fe_only_row, lambda row: flag(row, "orphan_FE_flag"), "front-end orphan"),
+    "guards": compile_guards,
+}
+
+
+def load_gates(path: Path = DEFAULT_GATES_PATH) -> Tuple[str, List[Gate]]:
+    """(service, compiled gates) from a gate file; ``ValueError`` on an unknown kind or missing artifact."""
+    document = read_yaml(path) or {}
+    gates = []
+    for name, spec in (document.get("thresholds") or {}).items():
+        spec = spec or {}
+        kind = spec.get("kind", name)
+        if kind not in GATE_KINDS:
+            raise ValueError(f"{path}: unknown gate kind {kind!r} for {name!r} (known: {', '.join(GATE_KINDS)})")
+        if not spec.get("artifact"):
+            raise ValueError(f"{path}: gate {name!r} has no artifact")
+        gates.append(GATE_KINDS[kind](name, REPO_ROOT / spec["artifact"], spec.get("description", ""), spec))
+    return str(document.get("service", "")), gates
+
+
+def read_csv_rows(path: Path) -> Iterator[Row]:
+    with path.open("r", encoding="utf-8-sig") as handle:
+        yield from csv.DictReader(handle)
+
+
+def read_guard_rows(path: Path) -> Iterator[Row]:
+    """``{"guard", "status"}`` rows of the first ``| Guard | Status |`` table in a guards report."""
+    table_section = False
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if line.startswith("| Guard"):
+                table_section = True
+                continue
+            if not table_section:
+                continue
+            if not line.startswith("|"):
+                return
+            cells = [cell.strip() for cell in line.strip("|").split("|")]
+            if len(cells) < 2 or cells[0] in ("Guard", "---"):
+                continue
+            yield {"guard": cells[0], "status": cells[1]}
+
+
+READERS: Dict[str, Callable[[Path], Iterator[Row]]] = {".csv": read_csv_rows, ".md": read_guard_rows}
+
+
+def model_sources(model: Any) -> Dict[Path, RowSource]:
+    """Rows an ``AuditModel`` would write to PARITY.csv (and TRACE_TABLE.csv), keyed by artifact path."""
+
+    def parity_rows() -> Iterator[Row]:
+        for op in model.be_operations:
+            linked = op in model.links.op_screens
+            yield {"target_BE": "1", "trace_link_ok": str(linked).upper(), "orphan_BE_flag": str(not linked).upper()}
+        for _ in model.orphan_screens():
+            yield {"target_BE": "0", "trace_link_ok": "FALSE", "orphan_FE_flag": "TRUE"}
+
+    def trace_rows() -> Iterator[Row]:
+        for entry in model.fe_entries:
+            yield {"trace_link_ok": str(entry.trace_link_ok).upper()}
+
+    sources: Dict[Path, RowSource] = {model.profile["dist_dir"] / "PARITY.csv": parity_rows}
+    if model.profile["shared_outputs"]:
+        sources[REPO_ROOT / "traces" / "TRACE_TABLE.csv"] = trace_rows
+    return sources
+
+
+def evaluate(
+    gates: List[Gate], sources: Optional[Dict[Path, RowSource]] = None, fail_fast: bool = False
+) -> List[Tuple[Gate, Optional[str]]]:
+    """(gate, issue or None) per evaluated gate, one pass per artifact.
+
+    With ``fail_fast`` the pass stops as soon as a gate can no longer pass and
+    only the results up to that gate are returned; its counts then cover the
+    rows read so far, which its issue reports as a lower bound.
+    """
+    sources = sources or {}
+    by_artifact: Dict[Path, List[Gate]] = {}
+    for gate in gates:
+        by_artifact.setdefault(gate.artifact, []).append(gate)
+    results: List[Tuple[Gate, Optional[str]]] = []
+    for artifact, group in by_artifact.items():
+        source = sources.get(artifact)
+        if source is None and not artifact.exists():
+            shown = artifact.relative_to(REPO_ROOT).as_posix() if artifact.is_relative_to(REPO_ROOT) else artifact
+            missing = f"Missing required artifact: {shown}"
+            if fail_fast:
+                return results + [(group[0], missing)]
+            results += [(gate, missing) for gate in group]
+            continue
+        reader = READERS.get(artifact.suffix.lower(), read_csv_rows)
+        stopped = 0
+        for count, row in enumerate(source() if source is not None else reader(artifact), start=1):
+            for gate in group:
+                gate.feed(row)
+            if fail_fast and any(gate.failed_early() for gate in group):
+                stopped = count
+                break
+        for gate in group:
+            if stopped and not gate.failed_early():
+                continue
+            gate.stopped = stopped
+            issue = gate.issue()
+            results.append((gate, issue))
+            if fail_fast and issue:
+                return results
+    return results
@@ -5,18 +5,40 @@ from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
+import io
 import json
+import os
 import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, TextIO
+from urllib.parse import quote
 
-import yaml
+from artifact_sink import write_artifact
+from repro import build_datetime, content_digest, source_date_epoch
+from spec_cache import read_spec
+from yaml_io import dump_yaml
 
 METHOD_ORDER = ["get", "post", "put", "patch", "delete", "head", "options"]
 IDEMPOTENCY_METHODS = {"post", "put", "patch", "delete"}
 SCHEMA_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+$")
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DESCRIPTION_EXTRA = "Hosts:\\n- api.bthwani.com -- DSH API (consumed by app.bthwani.com).\\n- app.bthwani.com -- customer web app (APP-USER).\\n- bthwani.com -- marketing site (read-only via cached GET)."
+MANIFEST_VERSION = 2
+SHARD_MANIFEST_VERSION = 1
+ROW_HASH_LENGTH = 16
+PARALLEL_MIN_ROWS = 20000
+PARTITIONS_PER_WORKER = 4
+CHECK_REPORT_LIMIT = 50
+SHARD_COMPONENTS_FILE = "components.yaml"
+SHARD_PATHS_DIR = "paths"
+UNTAGGED_SHARD = "untagged"
+# Opening words of every generated info.description; a spec without them is hand-written.
+GENERATOR_MARKER = "Aggregated OpenAPI specification generated from"
+MARKER_SCAN_LINES = 40
 
 HOST_POLICY = {
     "https://api.bthwani.com": {
@@ -42,6 +64,8 @@ HOST_POLICY = {
         ]
     }
 }
+# x-host-policy per service; services without an entry get no x-host-policy.
+HOST_POLICIES = {"DSH": HOST_POLICY}
 
 def extract_schema(ref_value: str) -> str | None:
     value = ref_value.strip()
@@ -60,170 +84,175 @@ def load_routes(csv_path: Path) -> List[Dict[str, str]]:
         reader = csv.DictReader(handle)
         return [row for row in reader]
 
-def build_openapi(rows: List[Dict[str, str]], description_extra: str | None) -> tuple[Dict, int]:
-    paths: Dict[str, Dict[str, Dict]] = {}
-    schema_names: set[str] = set()
-    tag_set: set[str] = set()
+def row_key(row: Dict[str, str]) -> tuple[str, str, str] | None:
+    path = (row.get("path") or "").strip()
+    method = (row.get("method") or "").strip().lower()
+    operation_id = (row.get("operation_id") or "").strip()
+    if not path or method not in METHOD_ORDER or not operation_id:
+        return None
+    return path, method, operation_id
 
-    for row in rows:
-        path = (row.get("path") or "").strip()
-        method = (row.get("method") or "").strip().lower()
-        operation_id = (row.get("operation_id") or "").strip()
-        if not path or method not in METHOD_ORDER or not operation_id:
-            continue
+def build_operation(row: Dict[str, str], schema_names: set[str], tag_set: set[str]) -> tuple[str, str, Dict] | None:
+    key = row_key(row)
+    if key is None:
+        return None
+    path, method, operation_id = key
 
-        summary = (row.get("description in english") or "").strip()
-        rbac_role = (row.get("rbac_role") or "").strip()
-        surface_id = (row.get("surface_id") or "").strip()
-        guards = (row.get("guards_status") or "").strip()
-        action_id = (row.get("action_id") or "").strip()
-        entity_code = (row.get("entity_code") or "").strip()
-        idempotency_flag = (row.get("idempotency_present") or "").strip().upper() == "TRUE"
-        pagination_flag = (row.get("pagination_present") or "").strip().upper() == "TRUE"
-        req_ref = (row.get("req_schema_ref") or "").strip()
-        res_ref = (row.get("res_schema_ref") or "").strip()
-        error_ref = (row.get("errors_profile_ref") or "").strip()
-
-        for candidate in (req_ref, res_ref, error_ref):
-            schema = extract_schema(candidate)
-            if schema:
-                schema_names.add(schema)
-
-        path_entry = paths.setdefault(path, {})
-
-        parameters: List[Dict] = []
-        for param in re.findall(r"{([^}]+)}", path):
-            parameters.append({
-                "name": param,
-                "in": "path",
-                "required": True,
-                "schema": {"type": "string"}
-            })
-        if pagination_flag:
-            parameters.append({
-                "name": "cursor",
-                "in": "query",
-                "required": False,
-                "schema": {"type": "string"}
-            })
-            parameters.append({
-                "name": "limit",
-                "in": "query",
-                "required": False,
-                "schema": {"type": "integer", "minimum": 1, "maximum": 200}
-            })
-        if idempotency_flag and method in IDEMPOTENCY_METHODS:
-            parameters.append({"$ref": "#/components/parameters/Idempotency-Key"})
-
-        security = [] if "system" in rbac_role.lower() else [{"bearerAuth": []}]
-
-        def schema_obj(ref_string: str) -> Dict | None:
-            schema = extract_schema(ref_string)
-            if not schema:
-                return None
-            return {"$ref": f"#/components/schemas/{schema}"}
-
-        request_body = None
-        if method in {"post", "put", "patch"}:
-            req_schema = schema_obj(req_ref)
-            if req_schema:
-                request_body = {
-                    "required": True,
-                    "content": {
-                        "application/json": {
-                            "schema": req_schema
-                        }
-                    }
-                }
+    summary = (row.get("description in english") or "").strip()
+    rbac_role = (row.get("rbac_role") or "").strip()
+    surface_id = (row.get("surface_id") or "").strip()
+    guards = (row.get("guards_status") or "").strip()
+    action_id = (row.get("action_id") or "").strip()
+    entity_code = (row.get("entity_code") or "").strip()
+    idempotency_flag = (row.get("idempotency_present") or "").strip().upper() == "TRUE"
+    pagination_flag = (row.get("pagination_present") or "").strip().upper() == "TRUE"
+    req_ref = (row.get("req_schema_ref") or "").strip()
+    res_ref = (row.get("res_schema_ref") or "").strip()
+    error_ref = (row.get("errors_profile_ref") or "").strip()
 
-        success_code = "200"
-        lower_op = operation_id.lower()
-        if method == "post" and any(token in lower_op for token in ["create", "start", "generate", "build", "issue", "import", "export", "queue"]):
-            success_code = "201"
-        elif method == "post" and any(token in lower_op for token in ["run", "scan", "trigger"]):
-            success_code = "202"
-        elif method == "delete":
-            success_code = "204"
-
-        responses = {
-            success_code: {"description": summary or "Success"},
-            "default": {
-                "description": "Error response",
+    for candidate in (req_ref, res_ref, error_ref):
+        schema = extract_schema(candidate)
+        if schema:
+            schema_names.add(schema)
+
+    parameters: List[Dict] = []
+    for param in re.findall(r"{([^}]+)}", path):
+        parameters.append({
+            "name": param,
+            "in": "path",
+            "required": True,
+            "schema": {"type": "string"}
+        })
+    if pagination_flag:
+        parameters.append({
+            "name": "cursor",
+            "in": "query",
+            "required": False,
+            "schema": {"type": "string"}
+        })
+        parameters.append({
+            "name": "limit",
+            "in": "query",
+            "required": False,
+            "schema": {"type": "integer", "minimum": 1, "maximum": 200}
+        })
+    if idempotency_flag and method in IDEMPOTENCY_METHODS:
+        parameters.append({"$ref": "#/components/parameters/Idempotency-Key"})
+
+    security = [] if "system" in rbac_role.lower() else [{"bearerAuth": []}]
+
+    def schema_obj(ref_string: str) -> Dict | None:
+        schema = extract_schema(ref_string)
+        if not schema:
+            return None
+        return {"$ref": f"#/components/schemas/{schema}"}
+
+    request_body = None
+    if method in {"post", "put", "patch"}:
+        req_schema = schema_obj(req_ref)
+        if req_schema:
+            request_body = {
+                "required": True,
                 "content": {
                     "application/json": {
-                        "schema": {"$ref": "#/components/schemas/Problem"}
+                        "schema": req_schema
                     }
                 }
             }
-        }
-        res_schema = schema_obj(res_ref)
-        if success_code != "204" and res_schema:
-            responses[success_code]["content"] = {
+
+    success_code = "200"
+    lower_op = operation_id.lower()
+    if method == "post" and any(token in lower_op for token in ["create", "start", "generate", "build", "issue", "import", "export", "queue"]):
+        success_code = "201"
+    elif method == "post" and any(token in lower_op for token in ["run", "scan", "trigger"]):
+        success_code = "202"
+    elif method == "delete":
+        success_code = "204"
+
+    responses = {
+        success_code: {"description": summary or "Success"},
+        "default": {
+            "description": "Error response",
+            "content": {
                 "application/json": {
-                    "schema": res_schema
+                    "schema": {"$ref": "#/components/schemas/Problem"}
                 }
             }
-
-        base_operation = {
-            "operationId": operation_id,
-            "responses": responses,
-            "security": security
         }
-        if surface_id:
-            base_operation["tags"] = [surface_id]
-            tag_set.add(surface_id)
-        if summary:
-            base_operation["summary"] = summary
-            base_operation["description"] = summary
-        if action_id:
-            base_operation["x-action-id"] = action_id
-        if entity_code:
-            base_operation["x-entity-code"] = entity_code
-        if guards:
-            base_operation["x-guards"] = guards
-        if rbac_role:
-            base_operation["x-rbac-role"] = rbac_role
-        if parameters:
-            base_operation["parameters"] = parameters
-        if request_body:
-            base_operation["requestBody"] = request_body
-
-        existing = path_entry.get(method)
-        if not existing:
-            path_entry[method] = base_operation
-            continue
+    }
+    res_schema = schema_obj(res_ref)
+    if success_code != "204" and res_schema:
+        responses[success_code]["content"] = {
+            "application/json": {
+                "schema": res_schema
+            }
+        }
 
-        if existing.get("operationId") == operation_id:
-            tags = existing.setdefault("tags", [])
-            if surface_id and surface_id not in tags:
-                tags.append(surface_id)
-                tag_set.add(surface_id)
-            if guards and guards not in (existing.get("x-guards") or ""):
-                merged = {existing.get("x-guards"), guards}
-                existing["x-guards"] = " | ".join(sorted(filter(None, merged)))
-            if rbac_role:
-                existing_roles = set(filter(None, (existing.get("x-rbac-role") or "").split(",")))
-                if rbac_role not in existing_roles:
-                    existing_roles.add(rbac_role)
-                    existing["x-rbac-role"] = ",".join(sorted(existing_roles))
-            continue
+    base_operation = {
+        "operationId": operation_id,
+        "responses": responses,
+        "security": security
+    }
+    if surface_id:
+        base_operation["tags"] = [surface_id]
+        tag_set.add(surface_id)
+    if summary:
+        base_operation["summary"] = summary
+        base_operation["description"] = summary
+    if action_id:
+        base_operation["x-action-id"] = action_id
+    if entity_code:
+        base_operation["x-entity-code"] = entity_code
+    if guards:
+        base_operation["x-guards"] = guards
+    if rbac_role:
+        base_operation["x-rbac-role"] = rbac_role
+    if parameters:
+        base_operation["parameters"] = parameters
+    if request_body:
+        base_operation["requestBody"] = request_body
+    return path, method, base_operation
 
-        alias_entry = {
-            "operationId": operation_id,
-            "summary": summary,
-            "surface": surface_id,
-            "rbac_role": rbac_role,
-            "guards": guards,
-            "action_id": action_id,
-            "entity_code": entity_code
-        }
-        aliases = existing.setdefault("x-alternate-operations", [])
-        aliases.append(alias_entry)
+def merge_operation(path_entry: Dict[str, Dict], method: str, operation: Dict) -> None:
+    existing = path_entry.get(method)
+    if not existing:
+        path_entry[method] = operation
+        return
 
-    ordered_paths = {}
-    for path_key, method_map in sorted(paths.items(), key=lambda item: item[0]):
-        ordered_paths[path_key] = {meth: method_map[meth] for meth in METHOD_ORDER if meth in method_map}
+    operation_id = operation["operationId"]
+    surface_id = (operation.get("tags") or [""])[0]
+    guards = operation.get("x-guards", "")
+    rbac_role = operation.get("x-rbac-role", "")
+    if existing.get("operationId") == operation_id:
+        tags = existing.setdefault("tags", [])
+        if surface_id and surface_id not in tags:
+            tags.append(surface_id)
+        if guards and guards not in (existing.get("x-guards") or ""):
+            merged = {existing.get("x-guards"), guards}
+            existing["x-guards"] = " | ".join(sorted(filter(None, merged)))
+        if rbac_role:
+            existing_roles = set(filter(None, (existing.get("x-rbac-role") or "").split(",")))
+            if rbac_role not in existing_roles:
+                existing_roles.add(rbac_role)
+                existing["x-rbac-role"] = ",".join(sorted(existing_roles))
+        return
+
+    alias_entry = {
+        "operationId": operation_id,
+        "summary": operation.get("summary", ""),
+        "surface": surface_id,
+        "rbac_role": rbac_role,
+        "guards": guards,
+        "action_id": operation.get("x-action-id", ""),
+        "entity_code": operation.get("x-entity-code", "")
+    }
+    aliases = existing.setdefault("x-alternate-operations", [])
+    aliases.append(alias_entry)
+
+def order_methods(method_map: Dict[str, Dict]) -> Dict[str, Dict]:
+    return {meth: method_map[meth] for meth in METHOD_ORDER if meth in method_map}
 
+def build_components(schema_names: set[str]) -> Dict:
     schema_names.add("Problem")
     components_schemas: Dict[str, Dict] = {}
     for name in sorted(schema_names):
@@ -244,15 +273,36 @@ def build_openapi(rows: List[Dict[str, str]], description_extra: str | None) ->
         else:
             components_schemas[name] = {"type": "object", "description": f"Placeholder schema for {name}."}
 
-    info_description = "Aggregated OpenAPI specification generated from DSH routes catalog."
+    return {
+        "securitySchemes": {
+            "bearerAuth": {
+                "type": "http",
+                "scheme": "bearer",
+                "bearerFormat": "JWT"
+            }
+        },
+        "parameters": {
+            "Idempotency-Key": {
+                "name": "Idempotency-Key",
+                "in": "header",
+                "required": False,
+                "schema": {"type": "string"},
+                "description": "Idempotency key for safely retrying requests."
+            }
+        },
+        "schemas": components_schemas
+    }
+
+def build_header(tag_set: set[str], description_extra: str | None, service: str = "DSH", version: str | None = None) -> Dict:
+    info_description = f"{GENERATOR_MARKER} {service} routes catalog."
     if description_extra:
         info_description = info_description + "\n\n" + description_extra
 
-    openapi_doc = {
+    return {
         "openapi": "3.0.3",
         "info": {
-            "title": "BThwani — DSH Service API",
-            "version": time.strftime("%Y-%m-%d"),
+            "title": f"BThwani — {service} Service API",
+            "version": version or build_datetime().strftime("%Y-%m-%d"),
             "description": info_description
         },
         "servers": [
@@ -260,39 +310,467 @@ def build_openapi(rows: List[Dict[str, str]], description_extra: str | None) ->
             {"url": "https://api-stage.bthwani.com"},
             {"url": "https://api.bthwani.com"}
         ],
-        "tags": [{"name": tag} for tag in sorted(tag_set)],
-        "paths": ordered_paths,
-        "components": {
-            "securitySchemes": {
-                "bearerAuth": {
-                    "type": "http",
-                    "scheme": "bearer",
-                    "bearerFormat": "JWT"
-                }
-            },
-            "parameters": {
-                "Idempotency-Key": {
-                    "name": "Idempotency-Key",
-                    "in": "header",
-                    "required": False,
-                    "schema": {"type": "string"},
-                    "description": "Idempotency key for safely retrying requests."
-                }
-            },
-            "schemas": components_schemas
-        }
+        "tags": [{"name": tag} for tag in sorted(tag_set)]
     }
 
-    openapi_doc["x-host-policy"] = HOST_POLICY
+def build_openapi(
+    rows: List[Dict[str, str]],
+    description_extra: str | None,
+    service: str = "DSH",
+    version: str | None = None,
+) -> tuple[Dict, int]:
+    paths: Dict[str, Dict[str, Dict]] = {}
+    schema_names: set[str] = set()
+    tag_set: set[str] = set()
+
+    for row in rows:
+        built = build_operation(row, schema_names, tag_set)
+        if built is None:
+            continue
+        path, method, operation = built
+        merge_operation(paths.setdefault(path, {}), method, operation)
+
+    ordered_paths = {}
+    for path_key, method_map in sorted(paths.items(), key=lambda item: item[0]):
+        ordered_paths[path_key] = order_methods(method_map)
+    return assemble_document(ordered_paths, schema_names, tag_set, description_extra, service, version)
+
+def assemble_document(
+    ordered_paths: Dict[str, Dict],
+    schema_names: set[str],
+    tag_set: set[str],
+    description_extra: str | None,
+    service: str = "DSH",
+    version: str | None = None,
+) -> tuple[Dict, int]:
+    openapi_doc = build_header(tag_set, description_extra, service, version)
+    openapi_doc["paths"] = ordered_paths
+    openapi_doc["components"] = build_components(schema_names)
+    if service in HOST_POLICIES:
+        openapi_doc["x-host-policy"] = HOST_POLICIES[service]
 
     serializable_doc = json.loads(json.dumps(openapi_doc))
     operation_total = sum(len(method_map) for method_map in serializable_doc["paths"].values())
     return serializable_doc, operation_total
 
+def read_raw_records(csv_path: Path) -> tuple[str, List[tuple[str, str]]]:
+    """The header text and ``(path, raw text)`` of every non-blank record of a routes CSV.
+
+    Records are cut by the same reader ``load_routes`` uses, so a quoted field
+    spanning lines stays inside its record.
+    """
+    lines: List[str] = []
+
+    def captured(handle: TextIO) -> Iterator[str]:
+        for line in handle:
+            lines.append(line)
+            yield line
+
+    records: List[tuple[str, str]] = []
+    with csv_path.open("r", encoding="utf-8") as handle:
+        reader = csv.reader(captured(handle))
+        fields = next(reader, [])
+        header = "".join(lines)
+        lines.clear()
+        column = fields.index("path") if "path" in fields else None
+        for record in reader:
+            raw = "".join(lines)
+            lines.clear()
+            if not record:
+                continue
+            if not raw.endswith("\n"):
+                # Last record of a file without a final newline: terminate it so it
+                # cannot merge with the record after it once partitions are joined.
+                raw += "\n"
+            path = record[column].strip() if column is not None and column < len(record) else ""
+            records.append((path, raw))
+    return header, records
+
+def build_partition(chunk: str) -> tuple[List[tuple[str, Dict]], set[str], set[str]]:
+    """Parse one partition of raw CSV text (header included) and build its path items."""
+    schema_names: set[str] = set()
+    tag_set: set[str] = set()
+    groups = group_rows_by_path(list(csv.DictReader(io.StringIO(chunk))))
+    items = [(path, build_path_item(path_rows, schema_names, tag_set)) for path, path_rows in groups.items()]
+    return items, schema_names, tag_set
+
+def partition_paths(groups: Dict[str, List[str]], parts: int) -> List[List[tuple[str, List[str]]]]:
+    """Split path groups into contiguous runs of roughly equal row counts.
+
+    A path never spans two partitions, so every merge decision stays inside one
+    worker, and contiguity keeps the concatenated result in sorted path order.
+    """
+    total_rows = sum(len(records) for records in groups.values())
+    target = max(1, -(-total_rows // max(1, parts)))
+    partitions: List[List[tuple[str, List[str]]]] = [[]]
+    filled = 0
+    for path, records in groups.items():
+        if filled >= target:
+            partitions.append([])
+            filled = 0
+        partitions[-1].append((path, records))
+        filled += len(records)
+    return [partition for partition in partitions if partition]
+
+def build_openapi_parallel(
+    routes: Path,
+    rows: List[Dict[str, str]],
+    description_extra: str | None,
+    service: str = "DSH",
+    workers: int | None = None,
+    version: str | None = None,
+) -> tuple[Dict, int]:
+    """Same document as ``build_openapi``, with path groups built across processes.
+
+    Each worker receives one string: the CSV header plus the raw records of a
+    contiguous run of paths, which it parses itself, so no row dicts are
+    pickled. Workers are capped at ``os.cpu_count()``; small catalogs (under
+    ``PARALLEL_MIN_ROWS``) or a single worker use the serial build on ``rows``,
+    where process start-up would dominate.
+    """
+    workers = min(workers or os.cpu_count() or 1, os.cpu_count() or 1)
+    if workers <= 1 or len(rows) < PARALLEL_MIN_ROWS:
+        return build_openapi(rows, description_extra, service, version)
+
+    header, records = read_raw_records(routes)
+    groups: Dict[str, List[str]] = {}
+    for path, raw in records:
+        groups.setdefault(path, []).append(raw)
+    partitions = partition_paths(dict(sorted(groups.items())), workers * PARTITIONS_PER_WORKER)
+    chunks = [header + "".join(raw for _, raws in partition for raw in raws) for partition in partitions]
+    ordered_paths: Dict[str, Dict] = {}
+    schema_names: set[str] = set()
+    tag_set: set[str] = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for items, partial_schemas, partial_tags in pool.map(build_partition, chunks):
+            ordered_paths.update(items)
+            schema_names |= partial_schemas
+            tag_set |= partial_tags
+    return assemble_document(ordered_paths, schema_names, tag_set, description_extra, service, version)
+
+
+def group_rows_by_path(rows: List[Dict[str, str]]) -> Dict[str, List[Dict[str, str]]]:
+    """Group valid rows by path in output order, keeping CSV order within a path."""
+    groups: Dict[str, List[Dict[str, str]]] = {}
+    for row in rows:
+        key = row_key(row)
+        if key is not None:
+            groups.setdefault(key[0], []).append(row)
+    return dict(sorted(groups.items(), key=lambda item: item[0]))
+
+def build_path_item(path_rows: List[Dict[str, str]], schema_names: set[str], tag_set: set[str]) -> Dict[str, Dict]:
+    path_entry: Dict[str, Dict] = {}
+    for row in path_rows:
+        built = build_operation(row, schema_names, tag_set)
+        if built is not None:
+            merge_operation(path_entry, built[1], built[2])
+    return order_methods(path_entry)
+
+def iter_path_items(rows: List[Dict[str, str]], schema_names: set[str], tag_set: set[str]) -> Iterator[tuple[str, Dict[str, Dict]]]:
+    """Yield finalized ``(path, path_item)`` pairs in output order.
+
+    Rows are visited grouped by path (CSV order within a path, so alias/merge
+    order matches ``build_openapi``) and only one path item is alive at a time.
+    """
+    for path, path_rows in group_rows_by_path(rows).items():
+        yield path, build_path_item(path_rows, schema_names, tag_set)
+
+def render_section(key: str, value: object) -> str:
+    return dump_yaml({key: value})
+
+def render_path_fragment(path: str, path_item: Dict[str, Dict]) -> str:
+    """Serialize one path item exactly as it appears under ``paths:`` in the full dump."""
+    return render_section("paths", {path: path_item}).split("\n", 1)[1]
+
+def surface_tags(rows: List[Dict[str, str]]) -> set[str]:
+    tag_set = {(row.get("surface_id") or "").strip() for row in rows if row_key(row) is not None}
+    tag_set.discard("")
+    return tag_set
+
+def write_openapi_stream(
+    rows: List[Dict[str, str]],
+    description_extra: str | None,
+    handle: TextIO,
+    baseline: Dict | None = None,
+    service: str = "DSH",
+    version: str | None = None,
+) -> tuple[int, int]:
+    """Emit the same YAML as ``build_openapi`` + ``apply_baseline`` path by path.
+
+    Each path item is serialized and released before the next one is built, and
+    the JSON round-trip is skipped because no object is shared between entries.
+    ``rows`` is still held in full (paths need grouping before any is emitted),
+    so this saves the document, not the CSV, from memory. Returns ``(path_count, operation_count)``.
+    """
+    dump_yaml(build_header(surface_tags(rows), description_extra, service, version), handle)
+
+    schema_names: set[str] = set()
+    path_total = 0
+    operation_total = 0
+    for path, path_item in iter_path_items(rows, schema_names, set()):
+        if not path_total:
+            handle.write("paths:\n")
+        handle.write(render_path_fragment(path, path_item))
+        path_total += 1
+        operation_total += len(path_item)
+    if not path_total:
+        dump_yaml({"paths": {}}, handle)
+
+    components_doc = apply_baseline({"components": build_components(schema_names)}, baseline)
+    dump_yaml(components_doc, handle)
+    if service in HOST_POLICIES:
+        dump_yaml({"x-host-policy": HOST_POLICIES[service]}, handle)
+    return path_total, operation_total
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def hash_row(row: Dict[str, str]) -> str:
+    payload = json.dumps(row, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return sha256_text(payload)[:ROW_HASH_LENGTH]
+
+def default_manifest_path(output: Path) -> Path:
+    return output.with_suffix(".manifest.json")
+
+def shard_manifest_path(output: Path) -> Path:
+    return output.with_suffix(".shards.json")
+
+def hash_path_rows(path_rows: List[Dict[str, str]]) -> str:
+    """One digest over a path's rows in CSV order; the column names are recorded once in the manifest."""
+    digest = hashlib.sha256()
+    for row in path_rows:
+        digest.update("\x1f".join(map(str, row.values())).encode("utf-8"))
+        digest.update(b"\x1e")
+    return digest.hexdigest()[:ROW_HASH_LENGTH]
+
+def cached_span(text: str, span: object) -> str | None:
+    """``text[start:end]`` for a ``[start, end]`` span recorded in the manifest, or None when it is unusable."""
+    if not isinstance(span, list) or len(span) != 2:
+        return None
+    start, end = span
+    if not isinstance(start, int) or not isinstance(end, int) or not 0 <= start <= end <= len(text):
+        return None
+    return text[start:end]
+
+def load_manifest(manifest_path: Path, version: int = MANIFEST_VERSION) -> Dict | None:
+    if not manifest_path.exists():
+        return None
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != version:
+        return None
+    return manifest
+
+def file_sha256(path: Path | None) -> str:
+    if not path or not path.exists():
+        return ""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+def write_openapi_incremental(
+    rows: List[Dict[str, str]],
+    description_extra: str | None,
+    output: Path,
+    manifest_path: Path,
+    baseline_path: Path | None = None,
+    service: str = "DSH",
+    version: str | None = None,
+) -> tuple[int, int, int]:
+    """Rebuild only the path items whose rows changed and splice them into ``output``.
+
+    The sidecar manifest records, per path, one digest of its rows, its schema
+    names and tags and the span of its rendered fragment in the output, plus
+    the spans of the header and components and the hash of the whole output.
+    Unchanged paths are sliced verbatim from the existing file; the header and
+    components are reused unless their inputs changed. Falls back to a full
+    rebuild when the output no longer matches the manifest. The spec and then
+    the manifest are replaced atomically, so an interrupted run leaves a
+    manifest that no longer matches and forces a full rebuild next time.
+    Returns ``(path_count, operation_count, rebuilt)``.
+    """
+    columns = list(rows[0]) if rows else []
+    previous = load_manifest(manifest_path) or {}
+    text = ""
+    if previous and previous.get("columns") == columns and output.exists():
+        text = output.read_text(encoding="utf-8")
+        if previous.get("output_sha256") != sha256_text(text):
+            text = ""
+    old_paths: Dict[str, Dict] = previous.get("paths", {}) if text else {}
+
+    entries: Dict[str, Dict] = {}
+    fragments: List[str] = []
+    rebuilt = 0
+    for path, path_rows in group_rows_by_path(rows).items():
+        rows_digest = hash_path_rows(path_rows)
+        old_entry = old_paths.get(path)
+        if old_entry and old_entry.get("rows") == rows_digest:
+            fragment = cached_span(text, old_entry.get("span"))
+            if fragment is not None:
+                entries[path] = dict(old_entry)
+                fragments.append(fragment)
+                continue
+        schema_names: set[str] = set()
+        tag_set: set[str] = set()
+        path_item = build_path_item(path_rows, schema_names, tag_set)
+        fragments.append(render_path_fragment(path, path_item))
+        entries[path] = {
+            "rows": rows_digest,
+            "operations": len(path_item),
+            "schemas": sorted(schema_names),
+            "tags": sorted(tag_set),
+        }
+        rebuilt += 1
+
+    all_schemas: set[str] = set()
+    all_tags: set[str] = set()
+    for entry in entries.values():
+        all_schemas.update(entry["schemas"])
+        all_tags.update(entry["tags"])
+
+    header = build_header(all_tags, description_extra, service, version)
+    header_sha = sha256_text(json.dumps(header, ensure_ascii=False, sort_keys=True))
+    header_text = cached_span(text, previous.get("header_span")) if previous.get("header_sha256") == header_sha else None
+    if header_text is None:
+        header_text = dump_yaml(header)
+
+    # A spec regenerated over itself already carries the baseline schemas, and
+    # its hash is checked above, so the file does not need hashing again.
+    if baseline_path and baseline_path.resolve() == output.resolve():
+        baseline_sha = "output"
+    else:
+        baseline_sha = file_sha256(baseline_path)
+    components_text = None
+    if previous.get("schemas") == sorted(all_schemas) and previous.get("baseline_sha256") == baseline_sha:
+        components_text = cached_span(text, previous.get("components_span"))
+    if components_text is None:
+        components_doc = apply_baseline({"components": build_components(set(all_schemas))}, load_baseline(baseline_path))
+        components_text = render_section("components", components_doc["components"])
+
+    parts = [header_text, "paths:\n" if fragments else render_section("paths", {})]
+    offset = len(header_text) + len(parts[1])
+    for entry, fragment in zip(entries.values(), fragments):
+        entry["span"] = [offset, offset + len(fragment)]
+        offset += len(fragment)
+    parts += fragments
+    parts.append(components_text)
+    if service in HOST_POLICIES:
+        parts.append(render_section("x-host-policy", HOST_POLICIES[service]))
+    text = "".join(parts)
+
+    write_artifact(output, text)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "output_sha256": sha256_text(text),
+        "baseline_sha256": baseline_sha,
+        "columns": columns,
+        "header_sha256": header_sha,
+        "header_span": [0, len(header_text)],
+        "components_span": [offset, offset + len(components_text)],
+        "schemas": sorted(all_schemas),
+        "paths": entries,
+    }
+    write_artifact(manifest_path, json.dumps(manifest, ensure_ascii=False, separators=(",", ":")))
+    operation_total = sum(entry["operations"] for entry in entries.values())
+    return len(entries), operation_total, rebuilt
+
+def path_item_tag(path_item: Dict[str, Dict]) -> str:
+    """Surface tag of the first operation in method order; it decides the shard a path lands in."""
+    for method in METHOD_ORDER:
+        tags = (path_item.get(method) or {}).get("tags") or []
+        if tags:
+            return tags[0]
+    return UNTAGGED_SHARD
+
+def shard_file_name(tag: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", tag) + ".yaml"
+
+def pointer_token(key: str) -> str:
+    """JSON-pointer token (RFC 6901) percent-encoded for use in a URI fragment."""
+    return quote(key.replace("~", "~0").replace("/", "~1"), safe="~")
+
+def relocate_refs(value: object, prefix: str) -> object:
+    """Copy ``value`` with local ``#/...`` refs pointing into the file at ``prefix``."""
+    if isinstance(value, dict):
+        return {
+            key: prefix + item if key == "$ref" and isinstance(item, str) and item.startswith("#/") else relocate_refs(item, prefix)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [relocate_refs(item, prefix) for item in value]
+    return value
+
+def build_shards(doc: Dict) -> Dict[str, Dict]:
+    """Split a built spec into ``{relative file: document}`` with a thin ``$ref`` root.
+
+    Every path item goes to ``paths/<TAG>.yaml`` for its primary surface tag, the
+    components go to ``components.yaml`` and the root only holds the header,
+    ``$ref``s and ``x-host-policy``. Bundling the root reproduces the full spec.
+    """
+    shards: Dict[str, Dict[str, Dict]] = {}
+    root_paths: Dict[str, Dict] = {}
+    shard_ref_prefix = f"../{SHARD_COMPONENTS_FILE}"
+    for path, path_item in doc["paths"].items():
+        relative = f"{SHARD_PATHS_DIR}/{shard_file_name(path_item_tag(path_item))}"
+        shards.setdefault(relative, {})[path] = relocate_refs(path_item, shard_ref_prefix)
+        root_paths[path] = {"$ref": f"{relative}#/{pointer_token(path)}"}
+
+    root_components = {
+        section: {
+            name: {"$ref": f"{SHARD_COMPONENTS_FILE}#/components/{section}/{pointer_token(name)}"}
+            for name in entries
+        }
+        for section, entries in doc["components"].items()
+    }
+    root = {key: value for key, value in doc.items() if key not in {"paths", "components", "x-host-policy"}}
+    root["paths"] = root_paths
+    root["components"] = root_components
+    if "x-host-policy" in doc:
+        root["x-host-policy"] = doc["x-host-policy"]
+
+    files: Dict[str, Dict] = {SHARD_COMPONENTS_FILE: {"components": doc["components"]}}
+    files.update(sorted(shards.items()))
+    files[""] = root
+    return files
+
+def render_shard(item: tuple[str, Dict]) -> tuple[str, str]:
+    name, data = item
+    return name, dump_yaml(data)
+
+def write_openapi_sharded(doc: Dict, output: Path, workers: int | None = None) -> tuple[int, int]:
+    """Write ``doc`` as a root file at ``output`` plus shards beside it.
+
+    Shards whose text is unchanged are left untouched. The shards written are
+    listed in ``<output>.shards.json``; those the previous manifest listed that
+    no longer exist are removed, and nothing else under ``paths/`` is touched.
+    Returns (files written, files total).
+    """
+    files = build_shards(doc)
+    items = list(files.items())
+    if workers and workers > 1 and len(items) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(render_shard, items))
+    else:
+        rendered = [render_shard(item) for item in items]
+
+    base = output.parent
+    manifest_path = shard_manifest_path(output)
+    previous = (load_manifest(manifest_path, SHARD_MANIFEST_VERSION) or {}).get("shards", [])
+    written = 0
+    for name, text in rendered:
+        written += write_artifact(base / name if name else output, text)
+    shards = sorted(name for name in files if name)
+    for name in set(previous) - set(shards):
+        stale = base / name
+        if name.startswith(f"{SHARD_PATHS_DIR}/") and stale.parent == base / SHARD_PATHS_DIR and stale.exists():
+            stale.unlink()
+    write_artifact(manifest_path, json.dumps({"version": SHARD_MANIFEST_VERSION, "shards": shards}, indent=1, ensure_ascii=False))
+    return written, len(files)
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate DSH OpenAPI from a routes CSV")
-    parser.add_argument("--routes", required=True, type=Path, help="Path to DSH_routes_complete.csv")
-    parser.add_argument("--output", required=True, type=Path, help="Destination OpenAPI YAML path")
+    parser.add_argument("--routes", type=Path, help="Path to DSH_routes_complete.csv")
+    parser.add_argument("--output", type=Path, help="Destination OpenAPI YAML path")
     parser.add_argument(
         "--baseline",
         type=Path,
@@ -301,10 +779,71 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--description-extra",
-        default="Hosts:\\n- api.bthwani.com -- DSH API (consumed by app.bthwani.com).\\n- app.bthwani.com -- customer web app (APP-USER).\\n- bthwani.com -- marketing site (read-only via cached GET).",
+        default=DEFAULT_DESCRIPTION_EXTRA,
         help="Extra text appended to the info.description"
     )
-    return parser.parse_args()
+    # One output layout per run; --check (below) combines only with --sharded.
+    layout = parser.add_mutually_exclusive_group()
+    layout.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write the spec path by path instead of materializing the whole document (same output; the routes rows are still loaded up front)."
+    )
+    layout.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Rebuild only paths whose CSV rows changed since the last run and splice them into --output."
+    )
+    layout.add_argument(
+        "--sharded",
+        action="store_true",
+        help="Write --output as a thin $ref root plus components.yaml and paths/<TAG>.yaml shards beside it."
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help="Sidecar row-hash manifest for --incremental (default: <output>.manifest.json)."
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        default=None,
+        help="JSON manifest of {service, routes, output, baseline} entries to generate in parallel."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: CPU count)."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Partition one full build by path across this many processes (large catalogs only)."
+    )
+    parser.add_argument(
+        "--reproducible",
+        action="store_true",
+        help="Byte-stable output: info.version from SOURCE_DATE_EPOCH, else from a digest of the routes rows."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not write; exit 1 and list differing paths/operations if --output (or, with --sharded, its shards) is out of date."
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="With --check, stop at the first difference (pass/fail only)."
+    )
+    args = parser.parse_args()
+    if not args.batch and not (args.routes and args.output):
+        parser.error("--routes and --output are required unless --batch is given")
+    if args.check and (args.stream or args.incremental):
+        parser.error("--check cannot be combined with --stream or --incremental (use it alone, or with --sharded)")
+    return args
 
 
 def apply_baseline(doc: Dict, baseline: Dict | None) -> Dict:
@@ -319,25 +858,351 @@ def apply_baseline(doc: Dict, baseline: Dict | None) -> Dict:
             target_components[name] = definition
     return doc
 
-def main() -> None:
-    args = parse_args()
-    rows = load_routes(args.routes)
+def load_baseline(path: Path | None) -> Dict | None:
+    """Baseline spec; for a sharded root its schemas are read from the ``components.yaml`` beside it."""
+    if not path or not path.exists():
+        return None
+    components = path.parent / SHARD_COMPONENTS_FILE
+    if shard_manifest_path(path).exists() and components.exists():
+        return read_spec(components) or {}
+    return read_spec(path) or {}
+
+def generate_spec(
+    routes: Path,
+    output: Path,
+    baseline: Path | None = None,
+    description_extra: str | None = None,
+    mode: str = "full",
+    manifest: Path | None = None,
+    service: str = "DSH",
+    workers: int | None = None,
+    reproducible: bool = False,
+) -> Dict[str, int]:
+    """Generate one spec in ``full``, ``stream``, ``incremental`` or ``sharded`` mode and return its counts."""
+    rows = load_routes(routes)
     if not rows:
-        print(f"No rows read from {args.routes}", file=sys.stderr)
-        sys.exit(1)
+        raise ValueError(f"No rows read from {routes}")
+    version = reproducible_version(rows, description_extra, service) if reproducible else None
+
+    if mode == "incremental":
+        path_count, op_count, rebuilt = write_openapi_incremental(
+            rows, description_extra, output, manifest or default_manifest_path(output), baseline, service, version
+        )
+        return {"paths": path_count, "operations": op_count, "rebuilt": rebuilt}
+
+    baseline_doc = load_baseline(baseline)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if mode == "stream":
+        with output.open("w", encoding="utf-8") as handle:
+            path_count, op_count = write_openapi_stream(rows, description_extra, handle, baseline_doc, service, version)
+    else:
+        if workers and workers > 1:
+            doc, op_count = build_openapi_parallel(routes, rows, description_extra, service, workers, version)
+        else:
+            doc, op_count = build_openapi(rows, description_extra, service, version)
+        doc = apply_baseline(doc, baseline_doc)
+        path_count = len(doc["paths"])
+        if mode == "sharded":
+            written, files = write_openapi_sharded(doc, output, workers)
+            return {"paths": path_count, "operations": op_count, "shards": files, "rewritten": written}
+        with output.open("w", encoding="utf-8") as handle:
+            dump_yaml(doc, handle)
+    return {"paths": path_count, "operations": op_count}
+
+def ensure_generated(output: Path) -> None:
+    """Refuse to overwrite a spec this generator did not write (no ``GENERATOR_MARKER`` in its header).
+
+    Only ``--batch`` checks this; a single-spec run writes wherever ``--output`` points.
+    """
+    if not output.exists():
+        return
+    with output.open("r", encoding="utf-8") as handle:
+        for _, line in zip(range(MARKER_SCAN_LINES), handle):
+            if GENERATOR_MARKER in line:
+                return
+    raise ValueError(
+        f"Refusing to overwrite {output}: it has no '{GENERATOR_MARKER}' header, so it was not written by this "
+        "generator. Move it aside first if it should be generated from a routes CSV from now on."
+    )
+
+def reproducible_version(rows: List[Dict[str, str]], description_extra: str | None, service: str) -> str:
+    """``info.version`` that only changes when the inputs do.
+
+    Uses the ``SOURCE_DATE_EPOCH`` date when set, otherwise a digest of the rows.
+    """
+    if source_date_epoch() is not None:
+        return build_datetime(reproducible=True).strftime("%Y-%m-%d")
+    digest = content_digest([service, description_extra or "", *(hash_row(row) for row in rows)])
+    return f"0.0.0+src.{digest[:12]}"
+
+def describe_path_changes(path: str, expected: Dict[str, Dict], current: object) -> Iterator[str]:
+    if not isinstance(current, dict):
+        yield f"+ {path} ({', '.join(method.upper() for method in expected)})"
+        return
+    for method in METHOD_ORDER:
+        wanted = expected.get(method)
+        present = current.get(method)
+        if wanted == present:
+            continue
+        if present is None:
+            yield f"+ {method.upper()} {path} ({wanted.get('operationId', '')})"
+        elif wanted is None:
+            yield f"- {method.upper()} {path} ({present.get('operationId', '') if isinstance(present, dict) else ''})"
+        else:
+            yield f"~ {method.upper()} {path} ({wanted.get('operationId', '')})"
+    extra = sorted(str(key) for key in current if key not in METHOD_ORDER)
+    if extra:
+        yield f"~ {path} (unexpected keys: {', '.join(extra)})"
 
-    baseline_doc = None
-    if args.baseline and args.baseline.exists():
-        with args.baseline.open("r", encoding="utf-8") as handle:
-            baseline_doc = yaml.safe_load(handle) or {}
+def describe_mapping_changes(label: str, expected: Dict, current: object) -> Iterator[str]:
+    if not isinstance(current, dict):
+        yield f"+ {label}"
+        return
+    for key, value in expected.items():
+        if key not in current:
+            yield f"+ {label}.{key}"
+        elif current[key] != value:
+            yield f"~ {label}.{key}"
+    for key in current:
+        if key not in expected:
+            yield f"- {label}.{key}"
 
-    doc, op_count = build_openapi(rows, args.description_extra)
-    doc = apply_baseline(doc, baseline_doc)
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    with args.output.open("w", encoding="utf-8") as handle:
-        yaml.safe_dump(doc, handle, sort_keys=False, allow_unicode=True)
+def iter_spec_differences(
+    rows: List[Dict[str, str]],
+    existing: Dict,
+    description_extra: str | None,
+    baseline: Dict | None = None,
+    service: str = "DSH",
+) -> Iterator[str]:
+    """Yield compact ``+``/``-``/``~`` lines for every place ``existing`` differs from a fresh build.
 
-    print(f"OpenAPI written to {args.output} (paths={len(doc['paths'])}, operations={op_count})")
+    Path items are built and compared one at a time, so a consumer that stops
+    at the first line never builds the rest of the spec. ``info.version`` is
+    ignored because it is a build stamp, not catalog content.
+    """
+    header = build_header(surface_tags(rows), description_extra, service)
+    for key, value in header.items():
+        current = existing.get(key)
+        if key == "info" and isinstance(current, dict):
+            value = {name: item for name, item in value.items() if name != "version"}
+            current = {name: item for name, item in current.items() if name != "version"}
+        if current != value:
+            yield f"~ {key}"
+
+    existing_paths = existing.get("paths") or {}
+    seen: set[str] = set()
+    schema_names: set[str] = set()
+    for path, path_item in iter_path_items(rows, schema_names, set()):
+        seen.add(path)
+        current = existing_paths.get(path)
+        if current != path_item:
+            yield from describe_path_changes(path, path_item, current)
+    for path in existing_paths:
+        if path not in seen:
+            yield f"- {path}"
+
+    components = apply_baseline({"components": build_components(schema_names)}, baseline)["components"]
+    current_components = existing.get("components") or {}
+    for section, expected in components.items():
+        yield from describe_mapping_changes(f"components.{section}", expected, current_components.get(section))
+    if existing.get("x-host-policy") != HOST_POLICIES.get(service):
+        yield "~ x-host-policy"
+
+def iter_sharded_differences(expected_files: Dict[str, Dict], output: Path) -> Iterator[str]:
+    """Yield ``+``/``-``/``~`` lines for every shard of ``build_shards`` output that differs on disk.
+
+    The root (``""``) is compared key by key with ``info.version`` ignored, path
+    shards path by path, ``components.yaml`` section by section; shards the
+    previous run listed in ``<output>.shards.json`` that would no longer be
+    written are reported as stale.
+    """
+    for name, expected in expected_files.items():
+        target = output.parent / name if name else output
+        if not target.exists():
+            yield f"+ {target.relative_to(output.parent).as_posix()} (missing)"
+            continue
+        current = read_spec(target) or {}
+        if not name:
+            for key, value in expected.items():
+                present = current.get(key)
+                if key == "info" and isinstance(present, dict):
+                    value = {item: entry for item, entry in value.items() if item != "version"}
+                    present = {item: entry for item, entry in present.items() if item != "version"}
+                if present != value:
+                    yield f"~ {output.name}: {key}"
+            for key in current:
+                if key not in expected:
+                    yield f"- {output.name}: {key}"
+        elif name == SHARD_COMPONENTS_FILE:
+            current_components = current.get("components") or {}
+            for section, entries in expected["components"].items():
+                yield from describe_mapping_changes(f"components.{section}", entries, current_components.get(section))
+        else:
+            for path, path_item in expected.items():
+                if current.get(path) != path_item:
+                    yield from describe_path_changes(path, path_item, current.get(path))
+            for path in current:
+                if path not in expected:
+                    yield f"- {path} ({name})"
+    previous = (load_manifest(shard_manifest_path(output), SHARD_MANIFEST_VERSION) or {}).get("shards", [])
+    for name in previous:
+        if name not in expected_files and (output.parent / name).exists():
+            yield f"- {name} (stale shard)"
+
+def check_spec(
+    routes: Path,
+    output: Path,
+    baseline: Path | None = None,
+    description_extra: str | None = None,
+    service: str = "DSH",
+    fail_fast: bool = False,
+    sharded: bool = False,
+) -> List[str]:
+    """Compare what the generator would write with ``output`` without writing anything.
+
+    A sharded output (``sharded`` or an existing ``<output>.shards.json``) is
+    compared shard by shard against ``build_shards``; the thin root alone says
+    nothing about the paths.
+    """
+    rows = load_routes(routes)
+    if not rows:
+        raise ValueError(f"No rows read from {routes}")
+    if not output.exists():
+        return [f"+ {output} (missing)"]
+    if sharded or shard_manifest_path(output).exists():
+        doc, _ = build_openapi(rows, description_extra, service)
+        doc = apply_baseline(doc, load_baseline(baseline))
+        lines = iter_sharded_differences(build_shards(doc), output)
+    else:
+        existing = read_spec(output) or {}
+        same_file = baseline is not None and baseline.exists() and baseline.resolve() == output.resolve()
+        baseline_doc = existing if same_file else load_baseline(baseline)
+        lines = iter_spec_differences(rows, existing, description_extra, baseline_doc, service)
+    differences: List[str] = []
+    for line in lines:
+        differences.append(line)
+        if fail_fast:
+            break
+    return differences
+
+def print_differences(output: Path, differences: List[str], limit: int = CHECK_REPORT_LIMIT) -> None:
+    print(f"{output} is out of date with the routes CSV:")
+    for line in differences[:limit]:
+        print(f"  {line}")
+    if len(differences) > limit:
+        print(f"  ... and {len(differences) - limit} more")
+
+def load_batch_manifest(path: Path) -> List[Dict]:
+    """Read batch entries; relative paths are resolved against the repo root."""
+    data = json.loads(path.read_text(encoding="utf-8-sig"))
+    jobs: List[Dict] = []
+    for entry in data.get("services", []):
+        if not entry.get("routes") or not entry.get("output"):
+            raise ValueError(f"Batch entry needs routes and output: {entry}")
+        jobs.append({
+            "service": entry.get("service") or Path(entry["output"]).parent.name.upper(),
+            "routes": REPO_ROOT / entry["routes"],
+            "output": REPO_ROOT / entry["output"],
+            "baseline": REPO_ROOT / entry["baseline"] if entry.get("baseline") else None,
+            "description_extra": entry.get("description_extra"),
+        })
+    return jobs
+
+def run_batch_job(job: Dict, options: Dict) -> Dict:
+    started = time.perf_counter()
+    result = {"service": job["service"], "status": "ok", "paths": 0, "operations": 0, "detail": ""}
+    if not job["routes"].exists():
+        result.update(status="skipped", detail=f"routes CSV missing: {job['routes']}")
+    else:
+        try:
+            if options["mode"] == "check":
+                differences = check_spec(
+                    job["routes"], job["output"], job["baseline"], job["description_extra"],
+                    job["service"], options.get("fail_fast", False), options.get("sharded", False),
+                )
+                if differences:
+                    result.update(status="drift", detail="; ".join(differences[:3]))
+            else:
+                ensure_generated(job["output"])
+                counts = generate_spec(
+                    job["routes"], job["output"], job["baseline"], job["description_extra"], options["mode"],
+                    service=job["service"], reproducible=options.get("reproducible", False),
+                )
+                result.update(counts)
+        except Exception as exc:  # reported per service so one bad CSV does not hide the others
+            result.update(status="error", detail=str(exc))
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+def run_batch(jobs: List[Dict], options: Dict, workers: int | None = None) -> List[Dict]:
+    """Run every job on a process pool; results keep manifest order."""
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    if workers == 1:
+        return [run_batch_job(job, options) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_batch_job, jobs, [options] * len(jobs)))
+
+def print_batch_report(results: List[Dict], wall: float) -> None:
+    print("| Service | Status | Paths | Operations | Seconds | Detail |")
+    print("| --- | --- | --- | --- | --- | --- |")
+    for result in results:
+        print(
+            f"| {result['service']} | {result['status']} | {result['paths']} | {result['operations']} "
+            f"| {result['seconds']:.2f} | {result['detail']} |"
+        )
+    slowest = max((result["seconds"] for result in results), default=0.0)
+    print(f"Batch finished in {wall:.2f}s (slowest service {slowest:.2f}s, {len(results)} services)")
+
+def main() -> None:
+    args = parse_args()
+    if args.check:
+        mode = "check"
+    elif args.incremental:
+        mode = "incremental"
+    elif args.sharded:
+        mode = "sharded"
+    elif args.stream:
+        mode = "stream"
+    else:
+        mode = "full"
+
+    if args.batch:
+        jobs = load_batch_manifest(args.batch)
+        options = {
+            "mode": mode, "reproducible": args.reproducible, "fail_fast": args.fail_fast, "sharded": args.sharded,
+        }
+        started = time.perf_counter()
+        results = run_batch(jobs, options, args.jobs)
+        print_batch_report(results, time.perf_counter() - started)
+        if any(result["status"] in {"error", "drift"} for result in results):
+            sys.exit(1)
+        return
+
+    try:
+        if mode == "check":
+            differences = check_spec(
+                args.routes, args.output, args.baseline, args.description_extra,
+                fail_fast=args.fail_fast, sharded=args.sharded,
+            )
+            if differences:
+                print_differences(args.output, differences)
+                sys.exit(1)
+            print(f"{args.output} is up to date with {args.routes}")
+            return
+        counts = generate_spec(
+            args.routes, args.output, args.baseline, args.description_extra, mode, args.manifest,
+            workers=args.workers,
+            reproducible=args.reproducible,
+        )
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        sys.exit(1)
+    summary = f"paths={counts['paths']}, operations={counts['operations']}"
+    if "rebuilt" in counts:
+        summary += f", rebuilt={counts['rebuilt']}"
+    if "shards" in counts:
+        summary += f", files={counts['shards']}, rewritten={counts['rewritten']}"
+    print(f"OpenAPI written to {args.output} ({summary})")
 
 if __name__ == "__main__":
     main()
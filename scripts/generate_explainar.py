@@ -3,13 +3,13 @@
 
 from __future__ import annotations
 
-import csv
 import hashlib
 import json
 from pathlib import Path
 from typing import Dict, List
 
-import yaml
+from screen_catalogs import load_catalogs
+from spec_cache import read_spec
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 EXPLAINAR_ROOT = REPO_ROOT / "docs" / "explainar"
@@ -31,8 +31,7 @@ def gather_service_paths(service_code: str) -> List[Dict[str, str]]:
     service_path = SERVICES_DIR / service_code.lower() / "openapi.yaml"
     if not service_path.exists():
         return []
-    with service_path.open("r", encoding="utf-8") as handle:
-        doc = yaml.safe_load(handle)
+    doc = read_spec(service_path)
     results: List[Dict[str, str]] = []
     for path, methods in doc.get("paths", {}).items():
         if not isinstance(methods, dict):
@@ -50,16 +49,14 @@ def gather_service_paths(service_code: str) -> List[Dict[str, str]]:
 
 def gather_screens(entity_code: str, root: Path) -> List[Dict[str, str]]:
     results: List[Dict[str, str]] = []
-    for csv_file in root.rglob("SCREENS_CATALOG.csv"):
-        with csv_file.open("r", encoding="utf-8-sig") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                if row.get("service_code") == entity_code:
-                    results.append({
-                        "screen_id": row.get("screen_id", ""),
-                        "name": row.get("screen_name_ar", row.get("screen_name_en", "")),
-                        "file": str(csv_file.relative_to(REPO_ROOT))
-                    })
+    for catalog, row in load_catalogs()["by_service"].get(entity_code.upper(), []):
+        if row.get("service_code") != entity_code or not catalog["path"].is_relative_to(root):
+            continue
+        results.append({
+            "screen_id": row.get("screen_id", ""),
+            "name": row.get("screen_name_ar", row.get("screen_name_en", "")),
+            "file": str(catalog["path"].relative_to(REPO_ROOT))
+        })
     return results
 
 
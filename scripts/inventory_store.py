@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""SQLite inventory of one audit run: operations, screens, links, guards, tags and roles.
+
+``auto_dsh_audit.py --db`` writes ``dist/<svc>/INVENTORY.sqlite`` next to the
+CSV artifacts. Every column query_inventory.py filters on is indexed, so a
+question such as "orphan operations on DASH-OPS guarded by Step-Up" is an
+index lookup instead of a scan of PARITY.csv and ROUTES_TABLE.csv. The
+database is built in a scratch file and handed to artifact_sink, so an
+unchanged audit leaves the file (and its mtime) alone.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence
+
+from artifact_sink import write_artifact
+
+STORE_NAME = "INVENTORY.sqlite"
+
+TABLE_COLUMNS: Dict[str, Sequence[str]] = {
+    "meta": ("key", "value"),
+    "operations": (
+        "id",
+        "operation_id",
+        "method",
+        "path",
+        "surface_id",
+        "rbac_role",
+        "action_id",
+        "guards_status",
+        "entity_code",
+        "idempotency",
+        "pagination",
+        "req_schema",
+        "res_schema",
+        "errors_profile",
+        "screen_count",
+    ),
+    "screens": (
+        "id",
+        "screen_id",
+        "surface_id",
+        "screen_title",
+        "status",
+        "role",
+        "endpoint",
+        "operation_id",
+        "method",
+        "path",
+        "rbac_role",
+        "action_id",
+        "trace_link_ok",
+        "source_file",
+    ),
+    "links": ("screen", "operation"),
+    "guards": ("operation", "guard"),
+    "tags": ("operation", "tag"),
+}
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE operations (
+    id INTEGER PRIMARY KEY,
+    operation_id TEXT NOT NULL,
+    method TEXT NOT NULL,
+    path TEXT NOT NULL,
+    surface_id TEXT NOT NULL,
+    rbac_role TEXT NOT NULL,
+    action_id TEXT NOT NULL,
+    guards_status TEXT NOT NULL,
+    entity_code TEXT NOT NULL,
+    idempotency INTEGER NOT NULL,
+    pagination INTEGER NOT NULL,
+    req_schema TEXT NOT NULL,
+    res_schema TEXT NOT NULL,
+    errors_profile TEXT NOT NULL,
+    screen_count INTEGER NOT NULL
+);
+CREATE TABLE screens (
+    id INTEGER PRIMARY KEY,
+    screen_id TEXT NOT NULL,
+    surface_id TEXT NOT NULL,
+    screen_title TEXT NOT NULL,
+    status TEXT NOT NULL,
+    role TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    operation_id TEXT NOT NULL,
+    method TEXT NOT NULL,
+    path TEXT NOT NULL,
+    rbac_role TEXT NOT NULL,
+    action_id TEXT NOT NULL,
+    trace_link_ok INTEGER NOT NULL,
+    source_file TEXT NOT NULL
+);
+CREATE TABLE links (
+    screen INTEGER PRIMARY KEY REFERENCES screens (id),
+    operation INTEGER NOT NULL REFERENCES operations (id)
+);
+CREATE TABLE guards (
+    operation INTEGER NOT NULL REFERENCES operations (id),
+    guard TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (guard, operation)
+) WITHOUT ROWID;
+CREATE TABLE tags (
+    operation INTEGER NOT NULL REFERENCES operations (id),
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, operation)
+) WITHOUT ROWID;
+"""
+
+# Created after the bulk insert: one sort per index instead of per-row maintenance.
+INDEXES = """
+CREATE INDEX operations_surface ON operations (surface_id, screen_count);
+CREATE INDEX operations_role ON operations (rbac_role);
+CREATE INDEX operations_operation_id ON operations (operation_id);
+CREATE INDEX operations_route ON operations (path, method);
+CREATE INDEX screens_surface ON screens (surface_id, trace_link_ok);
+CREATE INDEX screens_screen_id ON screens (screen_id);
+CREATE INDEX screens_source ON screens (source_file);
+CREATE INDEX links_operation ON links (operation);
+CREATE VIEW roles AS
+    SELECT rbac_role AS role, surface_id, COUNT(*) AS operations, SUM(screen_count = 0) AS orphan_operations
+    FROM operations GROUP BY rbac_role, surface_id;
+"""
+
+
+def insert_rows(connection: sqlite3.Connection, table: str, rows: Iterable[Sequence]) -> None:
+    columns = TABLE_COLUMNS[table]
+    placeholders = ", ".join("?" for _ in columns)
+    connection.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+
+
+def write_store(path: Path, tables: Dict[str, List[Sequence]]) -> bool:
+    """Build the inventory from ``tables`` (table name -> rows in ``TABLE_COLUMNS`` order); True when written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, scratch = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".build")
+    os.close(fd)
+    try:
+        connection = sqlite3.connect(scratch)
+        try:
+            # Throwaway build file: no journal, no fsync.
+            connection.execute("PRAGMA journal_mode = OFF")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.executescript(SCHEMA)
+            for table in TABLE_COLUMNS:
+                insert_rows(connection, table, tables.get(table, []))
+            connection.executescript(INDEXES)
+            connection.commit()
+        finally:
+            connection.close()
+        return write_artifact(path, Path(scratch).read_bytes())
+    finally:
+        Path(scratch).unlink(missing_ok=True)
+
+
+def open_store(path: Path) -> sqlite3.Connection:
+    """Read-only connection to an inventory written by ``write_store``."""
+    if not path.exists():
+        raise FileNotFoundError(f"Missing inventory database: {path} (run auto_dsh_audit.py --db)")
+    connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    connection.row_factory = sqlite3.Row
+    return connection
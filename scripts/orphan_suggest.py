@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Inverted-index suggester that pairs orphan FE screens with BE operations and back.
+
+Each side is indexed once: a document is the token set of an operation
+(``operation_id``, ``action_id``, path segments) or of a screen
+(``screen_id``, endpoint, operation/action hints). A query only visits the
+postings of its own tokens, rarest first and capped at ``CANDIDATE_POOL``
+documents, and candidates are ranked by IDF-weighted cosine
+similarity, so rare shared tokens (``settlement``, ``slots``) outweigh ones
+every entry carries (``api``, ``dls``); a token present in every document
+scores zero. Candidates on the same surface get a small bonus to break ties
+and matches below ``MIN_SCORE`` are dropped as noise.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+TOKEN_SPLIT = re.compile(r"[\W_]+")
+SURFACE_BONUS = 0.1
+MIN_SCORE = 0.05
+CANDIDATE_POOL = 128
+
+
+def split_tokens(*values: str) -> set[str]:
+    """Lower-cased word tokens of ``values`` (camelCase aware), with a plural ``s`` folded away."""
+    found: set[str] = set()
+    for value in values:
+        for token in TOKEN_SPLIT.split(CAMEL_BOUNDARY.sub(" ", value or "").lower()):
+            if len(token) < 2 or token.isdigit():
+                continue
+            if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+                token = token[:-1]
+            found.add(token)
+    return found
+
+
+def build_index(documents: Dict[Hashable, set[str]]) -> Dict:
+    """Postings, IDF (and squared) weights and vector norms for ``documents`` (key -> token set)."""
+    postings: Dict[str, List[Hashable]] = defaultdict(list)
+    for key, tokens in documents.items():
+        for token in tokens:
+            postings[token].append(key)
+    total = len(documents)
+    idf = {token: math.log(total / len(keys)) for token, keys in postings.items()}
+    weights = {token: value * value for token, value in idf.items()}
+    norms = {key: math.sqrt(sum(weights[token] for token in tokens)) or 1.0 for key, tokens in documents.items()}
+    return {"postings": dict(postings), "idf": idf, "weights": weights, "norms": norms, "documents": documents}
+
+
+def rank(
+    index: Dict,
+    query: set[str],
+    top_k: int,
+    surface: str = "",
+    surfaces: Dict[Hashable, str] | None = None,
+    order: Dict[Hashable, int] | None = None,
+) -> List[Tuple[Hashable, float, List[str]]]:
+    """Top ``top_k`` (key, score, shared tokens) for ``query``; ties keep ``order``."""
+    idf = index["idf"]
+    postings = index["postings"]
+    weights = index["weights"]
+    documents = index["documents"]
+    norms = index["norms"]
+    known = [token for token in query if idf.get(token)]
+    if not known:
+        return []
+    query_norm = math.sqrt(sum(weights[token] for token in known))
+    # Rarest tokens first: their postings are short and hold the likely matches,
+    # so common tokens are only scanned while the pool is still small.
+    known.sort(key=lambda token: len(postings[token]))
+    pool: Dict[Hashable, None] = {}
+    for token in known:
+        pool.update(dict.fromkeys(postings[token][: CANDIDATE_POOL - len(pool)]))
+        if len(pool) >= CANDIDATE_POOL:
+            break
+    weighted = set(known)
+    position = order or {}
+    scored = []
+    for key in pool:
+        score = sum(weights[token] for token in weighted & documents[key]) / (query_norm * norms[key])
+        if score < MIN_SCORE:
+            continue
+        if surface and surfaces and surfaces.get(key) == surface:
+            score += SURFACE_BONUS
+        scored.append((score, -position.get(key, 0), key))
+    best = heapq.nlargest(top_k, scored, key=lambda item: item[:2])
+    return [(key, score, sorted(query & documents[key])) for score, _, key in best]
+
+
+def suggest(
+    orphans: Iterable[Tuple[Hashable, set[str], str]],
+    candidates: Dict[Hashable, set[str]],
+    candidate_surfaces: Dict[Hashable, str],
+    top_k: int,
+) -> Dict[Hashable, List[Tuple[Hashable, float, List[str]]]]:
+    """Rank ``candidates`` for every (key, tokens, surface) orphan against one shared index."""
+    index = build_index(candidates)
+    order = {key: position for position, key in enumerate(candidates)}
+    return {
+        key: rank(index, tokens, top_k, surface, candidate_surfaces, order)
+        for key, tokens, surface in orphans
+    }
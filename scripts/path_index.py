@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Path-template trie and composite operation index used to match FE endpoints to BE operations.
+
+Screen catalogs reference endpoints in several shapes: the exact OpenAPI
+template (``/api/dls/orders/{order_id}``), a concrete URL
+(``/api/dls/orders/123/timeline``), another parameter spelling
+(``/api/dls/orders/:id``) or any of those with a query string. The trie
+resolves all of them to the BE path template by walking one node per
+segment, preferring a literal segment over a parameter one, so lookup cost
+depends on the endpoint depth and not on the catalog size.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from audit_records import Operation
+
+PARAM_SEGMENT = re.compile(r"^(\{[^{}]+\}|:[A-Za-z_][A-Za-z0-9_]*|<[^<>]+>)$")
+
+OperationKey = Tuple[str, ...]
+
+
+def normalise_endpoint(endpoint: str) -> str:
+    """Path part of ``endpoint``: no scheme/host, query, fragment, duplicate or trailing slash."""
+    value = (endpoint or "").strip()
+    if not value:
+        return ""
+    if "://" in value:
+        value = urlsplit(value).path
+    value = value.split("#", 1)[0].split("?", 1)[0]
+    value = re.sub(r"//+", "/", value)
+    if len(value) > 1:
+        value = value.rstrip("/")
+    return value
+
+
+def is_param_segment(segment: str) -> bool:
+    return bool(PARAM_SEGMENT.match(segment))
+
+
+def split_segments(path: str) -> List[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def new_node() -> Dict[str, Any]:
+    return {"static": {}, "param": None, "path": None}
+
+
+def compile_path_trie(paths: Iterable[str]) -> Dict[str, Any]:
+    """Trie over path templates; every parameter segment shares one ``param`` child.
+
+    When two templates differ only in parameter names the first one wins, the
+    same way the first candidate wins in ``match_fe_to_be``. Templates are
+    walked in normalised form, so one carrying a query string is still
+    reachable; the root's ``exact`` map keeps every template verbatim for
+    ``match_path`` to try first.
+    """
+    root = new_node()
+    root["exact"] = {}
+    for path in paths:
+        root["exact"].setdefault(path, path)
+        node = root
+        for segment in split_segments(normalise_endpoint(path)):
+            if is_param_segment(segment):
+                if node["param"] is None:
+                    node["param"] = new_node()
+                node = node["param"]
+            else:
+                node = node["static"].setdefault(segment, new_node())
+        if node["path"] is None:
+            node["path"] = path
+    return root
+
+
+def _walk(node: Dict[str, Any], segments: List[str], index: int) -> Optional[str]:
+    if index == len(segments):
+        return node["path"]
+    segment = segments[index]
+    if not is_param_segment(segment):
+        child = node["static"].get(segment)
+        if child is not None:
+            found = _walk(child, segments, index + 1)
+            if found is not None:
+                return found
+    if node["param"] is not None:
+        return _walk(node["param"], segments, index + 1)
+    return None
+
+
+def match_path(trie: Dict[str, Any], endpoint: str) -> Optional[str]:
+    """BE path template that ``endpoint`` resolves to, or ``None``.
+
+    A template equal to ``endpoint`` wins outright, as the old exact lookup did.
+    """
+    exact = trie.get("exact", {}).get((endpoint or "").strip())
+    if exact is not None:
+        return exact
+    path = normalise_endpoint(endpoint)
+    if not path:
+        return None
+    return _walk(trie, split_segments(path), 0)
+
+
+def build_operation_index(operations: Iterable[Operation]) -> Dict[OperationKey, List[Operation]]:
+    """Composite index over (path), (path, method), (path, surface) and (path, surface, method).
+
+    Each list keeps the order of ``operations``, so narrowing through the index
+    picks the same operation as filtering the per-path candidate list would.
+    """
+    index: Dict[OperationKey, List[Operation]] = {}
+    for op in operations:
+        path = op.path
+        method = op.method
+        keys: List[OperationKey] = [(path,), (path, method)]
+        for surface in dict.fromkeys(op.tags):
+            keys.append((path, surface))
+            keys.append((path, surface, method))
+        for key in keys:
+            index.setdefault(key, []).append(op)
+    return index
+
+
+def resolve_operations(
+    index: Dict[OperationKey, List[Operation]],
+    path: str,
+    surface: str = "",
+    method: str | None = None,
+) -> List[Operation]:
+    """Candidates for ``path`` narrowed by surface, then by method, skipping a filter that would empty the list."""
+    candidates = index.get((path,), [])
+    scope: OperationKey = (path,)
+    if len(candidates) > 1 and surface and (path, surface) in index:
+        scope = (path, surface)
+        candidates = index[scope]
+    if len(candidates) > 1 and method and (*scope, method) in index:
+        candidates = index[(*scope, method)]
+    return candidates
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""One-pass pivot of the audit model over any combination of dimensions.
+
+Every operation (and every screen, with its service, surface and resolved
+role and method) is added once to a ``PivotCube``: its dimension values are replaced by
+small integer codes and the measures are summed per code tuple. Summary
+tables such as RBAC_MATRIX.csv or the inventory's coverage-by-surface are
+roll-ups of those cells, so they cost a pass over the distinct combinations
+instead of another scan of the operations per report.
+
+``guard`` is multi-valued: an operation counts once under each of its guard
+tokens, so totals across guards exceed the number of operations.
+
+    python scripts/pivot_cube.py --by surface role
+    python scripts/pivot_cube.py --by surface --columns guard --format markdown
+    python scripts/pivot_cube.py --services DSH KWD --by service method --measures operations orphan_operations
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import sys
+from itertools import product
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DIMENSIONS = ("service", "surface", "role", "method", "guard", "idempotency", "pagination")
+MEASURES = ("operations", "orphan_operations", "screens", "orphan_screens")
+MULTI_VALUED = frozenset({"guard"})
+
+Labels = Dict[str, Callable[[Any], Any]]
+Rollup = Dict[Tuple[Any, ...], List[int]]
+
+
+class Codebook:
+    """Dense integer codes for the distinct values of one dimension."""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self) -> None:
+        self.codes: Dict[Any, int] = {}
+        self.values: List[Any] = []
+
+    def code(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class PivotCube:
+    """Measures summed per combination of all ``DIMENSIONS``, keyed by integer code tuples."""
+
+    __slots__ = ("codebooks", "cells")
+
+    def __init__(self) -> None:
+        self.codebooks = tuple(Codebook() for _ in DIMENSIONS)
+        self.cells: Dict[Tuple[int, ...], List[int]] = {}
+
+    def add(self, values: Sequence[Any], measures: Sequence[int]) -> None:
+        """Count one fact; ``values`` follow ``DIMENSIONS`` (a tuple of tokens for ``guard``), ``measures`` follow ``MEASURES``."""
+        key = tuple(book.code(value) for book, value in zip(self.codebooks, values))
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = list(measures)
+        else:
+            for position, amount in enumerate(measures):
+                cell[position] += amount
+
+    def rollup(self, dims: Sequence[str], labels: Optional[Labels] = None) -> Rollup:
+        """Measures per combination of ``dims`` values, after mapping values through ``labels``."""
+        labels = labels or {}
+        positions = [DIMENSIONS.index(dim) for dim in dims]
+        decoders = []
+        for dim, position in zip(dims, positions):
+            values = self.codebooks[position].values
+            label = labels.get(dim, lambda value: value)
+            if dim in MULTI_VALUED:
+                decoded = [tuple(dict.fromkeys(label(token) for token in value or ("",))) for value in values]
+            else:
+                decoded = [(label(value),) for value in values]
+            decoders.append(decoded)
+        result: Rollup = {}
+        for key, measures in self.cells.items():
+            for combo in product(*(decoded[key[position]] for decoded, position in zip(decoders, positions))):
+                totals = result.get(combo)
+                if totals is None:
+                    result[combo] = list(measures)
+                else:
+                    for index, amount in enumerate(measures):
+                        totals[index] += amount
+        return result
+
+    def totals(self) -> Dict[str, int]:
+        return dict(zip(MEASURES, self.rollup(()).get((), [0] * len(MEASURES))))
+
+
+def select_rows(rollup: Rollup, measures: Sequence[str]) -> List[Tuple[Tuple[Any, ...], List[int]]]:
+    """Rows of ``rollup`` sorted by key with only ``measures``; rows where they are all zero are dropped."""
+    positions = [MEASURES.index(measure) for measure in measures]
+    rows = []
+    for key in sorted(rollup, key=lambda values: tuple(map(cell, values))):
+        picked = [rollup[key][position] for position in positions]
+        if any(picked):
+            rows.append((key, picked))
+    return rows
+
+
+def crosstab(
+    cube: PivotCube, row_dim: str, column_dim: str, measure: str, labels: Optional[Labels] = None
+) -> Tuple[List[Any], List[Tuple[Any, int, Dict[Any, int]]]]:
+    """Wide table of ``measure``: (sorted column values, [(row value, row total, {column: count})])."""
+    position = MEASURES.index(measure)
+    row_totals = cube.rollup((row_dim,), labels)
+    grid: Dict[Any, Dict[Any, int]] = {}
+    columns = set()
+    for (row, column), measures in cube.rollup((row_dim, column_dim), labels).items():
+        if measures[position]:
+            grid.setdefault(row, {})[column] = measures[position]
+            columns.add(column)
+    rows = [(row, row_totals[(row,)][position], grid[row]) for row in sorted(grid, key=cell)]
+    return sorted(columns, key=cell), rows
+
+
+def cell(value: Any) -> str:
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    return "" if value is None else str(value)
+
+
+def render_csv(header: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    writer.writerows([cell(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+
+def render_markdown(header: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    lines = ["| " + " | ".join(header) + " |", "| " + " | ".join("---" for _ in header) + " |"]
+    lines += ["| " + " | ".join(cell(value) or "-" for value in row) + " |" for row in rows]
+    return "\n".join(lines) + "\n"
+
+
+RENDERERS = {"csv": render_csv, "markdown": render_markdown}
+
+
+def render_cube(
+    cube: PivotCube,
+    dims: Sequence[str],
+    measures: Sequence[str] = ("operations",),
+    columns: Optional[str] = None,
+    fmt: str = "csv",
+    labels: Optional[Labels] = None,
+) -> str:
+    """``dims`` x ``measures`` as a long table, or ``dims[0]`` x ``columns`` values for ``measures[0]``."""
+    if columns:
+        values, rows = crosstab(cube, dims[0], columns, measures[0], labels)
+        header = [dims[0], "TOTAL", *(cell(value) or "-" for value in values)]
+        table = [[row, total, *(counts.get(value, 0) for value in values)] for row, total, counts in rows]
+    else:
+        header = [*dims, *measures]
+        table = [[*key, *picked] for key, picked in select_rows(cube.rollup(dims, labels), measures)]
+    return RENDERERS[fmt](header, table)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pivot audited operations and screens over any dimensions")
+    parser.add_argument("--services", nargs="+", default=["DSH"], help="Service codes to audit into one cube (default: DSH)")
+    parser.add_argument("--by", nargs="+", choices=DIMENSIONS, default=["surface"], help="Row dimensions")
+    parser.add_argument("--columns", choices=DIMENSIONS, default=None, help="Spread this dimension across columns")
+    parser.add_argument("--measures", nargs="+", choices=MEASURES, default=["operations"], help="Measures to report")
+    parser.add_argument("--format", choices=sorted(RENDERERS), default="csv")
+    args = parser.parse_args()
+    if args.columns and len(args.by) != 1:
+        parser.error("--columns needs exactly one --by dimension")
+    return args
+
+
+def main() -> int:
+    # imported here: auto_dsh_audit itself imports this module
+    from auto_dsh_audit import add_to_cube, load_be_operations, load_fe_entries, match_fe_to_be, read_screen_catalogs, service_profile
+
+    args = parse_args()
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+    catalogs = read_screen_catalogs()
+    cube = PivotCube()
+    for code in (code.upper() for code in args.services):
+        profile = service_profile(code)
+        if not profile["openapi"].exists():
+            print(f"{code}: skipped (no spec)", file=sys.stderr)
+            continue
+        fe_entries = load_fe_entries(profile, catalogs)
+        be_operations = load_be_operations(profile)
+        add_to_cube(cube, fe_entries, be_operations, match_fe_to_be(fe_entries, be_operations), profile)
+    sys.stdout.write(render_cube(cube, args.by, args.measures, args.columns, args.format))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Query the SQLite inventory written by ``auto_dsh_audit.py --db``.
+
+Examples::
+
+    python scripts/query_inventory.py ops --surface DASH-OPS --guard Step-Up --orphan
+    python scripts/query_inventory.py screens --surface APP-USER --orphan --format csv
+    python scripts/query_inventory.py ops --operation-id dls_orders_create --with-screens
+    python scripts/query_inventory.py roles --service KWD
+    python scripts/query_inventory.py sql "SELECT guard, COUNT(*) FROM guards GROUP BY guard"
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, List, Sequence, Tuple
+
+from inventory_store import STORE_NAME, open_store
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+OPERATION_COLUMNS = ("surface_id", "method", "path", "operation_id", "rbac_role", "guards_status", "screen_count")
+SCREEN_COLUMNS = ("surface_id", "screen_id", "method", "path", "operation_id", "trace_link_ok", "source_file")
+
+
+def store_path(args: argparse.Namespace) -> Path:
+    if args.db:
+        return Path(args.db)
+    return REPO_ROOT / "dist" / args.service.lower() / STORE_NAME
+
+
+def linked_filter(args: argparse.Namespace, column: str) -> List[str]:
+    if args.orphan:
+        return [f"{column} = 0"]
+    if args.linked:
+        return [f"{column} > 0"]
+    return []
+
+
+def operations_query(args: argparse.Namespace) -> Tuple[str, List[Any]]:
+    where = linked_filter(args, "o.screen_count")
+    params: List[Any] = []
+    for column, value in (
+        ("o.surface_id", args.surface),
+        ("o.rbac_role", args.role),
+        ("o.method", args.method and args.method.upper()),
+        ("o.operation_id", args.operation_id),
+    ):
+        if value:
+            where.append(f"{column} = ?")
+            params.append(value)
+    for guard in args.guard or []:
+        where.append("EXISTS (SELECT 1 FROM guards g WHERE g.operation = o.id AND g.guard = ?)")
+        params.append(guard)
+    if args.tag:
+        where.append("EXISTS (SELECT 1 FROM tags t WHERE t.operation = o.id AND t.tag = ?)")
+        params.append(args.tag)
+    columns = ", ".join(f"o.{column}" for column in OPERATION_COLUMNS)
+    if args.with_screens:
+        columns += ", GROUP_CONCAT(s.screen_id, ' ') AS screens"
+        source = "operations o LEFT JOIN links l ON l.operation = o.id LEFT JOIN screens s ON s.id = l.screen"
+    else:
+        source = "operations o"
+    sql = f"SELECT {columns} FROM {source}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    if args.with_screens:
+        sql += " GROUP BY o.id"
+    return sql + " ORDER BY o.path, o.method", params
+
+
+def screens_query(args: argparse.Namespace) -> Tuple[str, List[Any]]:
+    where = linked_filter(args, "s.trace_link_ok")
+    params: List[Any] = []
+    for column, value in (
+        ("s.surface_id", args.surface),
+        ("s.screen_id", args.screen_id),
+        ("s.source_file", args.source),
+    ):
+        if value:
+            where.append(f"{column} = ?")
+            params.append(value)
+    if args.operation_id:
+        where.append("s.id IN (SELECT l.screen FROM links l JOIN operations o ON o.id = l.operation WHERE o.operation_id = ?)")
+        params.append(args.operation_id)
+    sql = f"SELECT {', '.join(f's.{column}' for column in SCREEN_COLUMNS)} FROM screens s"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return sql + " ORDER BY s.surface_id, s.screen_id", params
+
+
+def roles_query(args: argparse.Namespace) -> Tuple[str, List[Any]]:
+    sql = "SELECT role, surface_id, operations, orphan_operations FROM roles"
+    if args.surface:
+        return sql + " WHERE surface_id = ? ORDER BY role", [args.surface]
+    return sql + " ORDER BY role, surface_id", []
+
+
+QUERIES = {"ops": operations_query, "screens": screens_query, "roles": roles_query}
+
+
+def render(columns: Sequence[str], rows: List[Sequence[Any]], fmt: str) -> str:
+    if fmt == "json":
+        return json.dumps([dict(zip(columns, row)) for row in rows], indent=2, ensure_ascii=False)
+    if fmt == "csv":
+        buffer = io.StringIO(newline="")
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        writer.writerows(rows)
+        return buffer.getvalue().rstrip("\n")
+    cells = [list(map(str, columns))] + [["" if value is None else str(value) for value in row] for row in rows]
+    widths = [max(len(row[index]) for row in cells) for index in range(len(columns))]
+    lines = ["  ".join(value.ljust(width) for value, width in zip(row, widths)).rstrip() for row in cells]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--service", default="DSH", help="Service whose dist/<svc>/INVENTORY.sqlite to read (default: DSH)")
+    common.add_argument("--db", default=None, help="Explicit path to an inventory database")
+    common.add_argument("--format", choices=("table", "csv", "json"), default="table")
+
+    parser = argparse.ArgumentParser(description="Indexed queries over the audit inventory database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ops = commands.add_parser("ops", parents=[common], help="BE operations")
+    ops.add_argument("--surface", help="Surface tag, e.g. DASH-OPS")
+    ops.add_argument("--guard", action="append", help="Required guard (repeatable, case-insensitive), e.g. Step-Up")
+    ops.add_argument("--role", help="x-rbac-role")
+    ops.add_argument("--method", help="HTTP method")
+    ops.add_argument("--tag", help="OpenAPI tag")
+    ops.add_argument("--operation-id", help="operationId")
+    ops.add_argument("--with-screens", action="store_true", help="List the linked screen ids")
+
+    screens = commands.add_parser("screens", parents=[common], help="FE screens")
+    screens.add_argument("--surface", help="Surface id, e.g. APP-USER")
+    screens.add_argument("--screen-id", help="Screen id")
+    screens.add_argument("--source", help="Repo-relative screen catalog path")
+    screens.add_argument("--operation-id", help="Screens linked to this operationId")
+
+    for command in (ops, screens):
+        linked = command.add_mutually_exclusive_group()
+        linked.add_argument("--orphan", action="store_true", help="Only entries without a match")
+        linked.add_argument("--linked", action="store_true", help="Only matched entries")
+
+    roles = commands.add_parser("roles", parents=[common], help="Operations and orphans per RBAC role and surface")
+    roles.add_argument("--surface", help="Surface tag")
+
+    sql = commands.add_parser("sql", parents=[common], help="Run a read-only SQL statement")
+    sql.add_argument("statement")
+    return parser.parse_args()
+
+
+def main() -> int:
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+    args = parse_args()
+    try:
+        connection = open_store(store_path(args))
+    except FileNotFoundError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    if args.command == "sql":
+        statement, params = args.statement, []
+    else:
+        statement, params = QUERIES[args.command](args)
+    try:
+        cursor = connection.execute(statement, params)
+        columns = [column[0] for column in cursor.description or []]
+        rows = [tuple(row) for row in cursor.fetchall()]
+    except sqlite3.Error as exc:
+        print(f"Query failed: {exc}", file=sys.stderr)
+        return 2
+    finally:
+        connection.close()
+    try:
+        print(render(columns, rows, args.format))
+        if args.format == "table":
+            print(f"({len(rows)} rows)")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # e.g. `| head`: point stdout at devnull so the interpreter's final flush does not raise again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Reproducible-output helpers shared by the spec and audit scripts.
+
+In reproducible mode timestamps honour ``SOURCE_DATE_EPOCH``
+(https://reproducible-builds.org/specs/source-date-epoch/) so identical inputs
+produce identical bytes; otherwise the wall clock is used as before, whatever
+the environment says. ``content_digest`` gives a stable stand-in for a timestamp when no
+epoch is provided but output still has to be byte-stable.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import os
+from pathlib import Path
+from typing import Iterable
+
+
+def source_date_epoch() -> int | None:
+    value = os.environ.get("SOURCE_DATE_EPOCH", "").strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise SystemExit(f"SOURCE_DATE_EPOCH must be an integer, got {value!r}")
+
+
+def build_datetime(tz: dt.tzinfo | None = None, reproducible: bool = False) -> dt.datetime:
+    """``SOURCE_DATE_EPOCH`` as UTC when ``reproducible`` and set, otherwise ``datetime.now(tz)``."""
+    epoch = source_date_epoch() if reproducible else None
+    if epoch is not None:
+        return dt.datetime.fromtimestamp(epoch, dt.timezone.utc)
+    return dt.datetime.now(tz)
+
+
+def content_digest(parts: Iterable[str | bytes]) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def files_digest(paths: Iterable[Path], root: Path) -> str:
+    """Digest over (relative path, bytes) of ``paths`` in sorted order."""
+    parts: list[str | bytes] = []
+    for path in sorted(paths):
+        parts.append(path.relative_to(root).as_posix())
+        parts.append(path.read_bytes())
+    return content_digest(parts)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Shared loader for the SCREENS_CATALOG.csv files under apps/ and dashboards/.
+
+Discovery walks the roots once and caches the file list in
+``.cache/screen_catalogs.json`` together with the mtime of every directory it
+visited; adding, removing or renaming a catalog changes its directory's mtime,
+so the cached list is reused only while the tree shape is unchanged. Each file
+is read and decoded once (UTF-8 with or without BOM, else cp1256 with a warning
+on stderr naming the file). Parsing stays serial: it is pure Python and holds
+the GIL, so threads would not help; the cached discovery is what saves time.
+Rows are kept per catalog and indexed under each distinct service code they
+carry (``related_service`` and ``service_code``) for every consumer.
+
+Set ``CATALOG_CACHE=0`` to skip the discovery cache.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from artifact_sink import write_artifact
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CATALOG_NAME = "SCREENS_CATALOG.csv"
+DEFAULT_ROOTS = ("apps", "dashboards")
+SERVICE_COLUMNS = ("related_service", "service_code")
+FALLBACK_ENCODING = "cp1256"
+DISCOVERY_CACHE_VERSION = 1
+
+
+def discovery_cache_path() -> Path:
+    return REPO_ROOT / ".cache" / "screen_catalogs.json"
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("CATALOG_CACHE", "1") not in {"0", "false", "FALSE"}
+
+
+def walk_root(root: Path) -> Tuple[List[Path], Dict[str, int]]:
+    """Catalog files under ``root`` (sorted, like ``sorted(rglob)``) and the mtime of each directory walked."""
+    files: List[Path] = []
+    directories: Dict[str, int] = {}
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            directories[directory.relative_to(REPO_ROOT).as_posix()] = directory.stat().st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.name == CATALOG_NAME and entry.is_file():
+                        files.append(Path(entry.path))
+        except OSError:
+            continue
+    return sorted(files), directories
+
+
+def cached_files(roots: Tuple[str, ...]) -> List[Path] | None:
+    try:
+        cached = json.loads(discovery_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if cached.get("version") != DISCOVERY_CACHE_VERSION or cached.get("roots") != list(roots):
+        return None
+    for directory, mtime in cached.get("directories", {}).items():
+        try:
+            if (REPO_ROOT / directory).stat().st_mtime_ns != mtime:
+                return None
+        except OSError:
+            return None
+    return [REPO_ROOT / name for name in cached.get("files", [])]
+
+
+def discover_catalogs(roots: Tuple[str, ...] = DEFAULT_ROOTS) -> List[Path]:
+    """Catalog paths, root by root in ``roots`` order, served from the discovery cache when valid."""
+    if cache_enabled():
+        files = cached_files(roots)
+        if files is not None:
+            return files
+    files = []
+    directories: Dict[str, int] = {}
+    for root in roots:
+        root_files, root_directories = walk_root(REPO_ROOT / root)
+        files.extend(root_files)
+        directories.update(root_directories)
+    if cache_enabled():
+        payload = {
+            "version": DISCOVERY_CACHE_VERSION,
+            "roots": list(roots),
+            "directories": directories,
+            "files": [path.relative_to(REPO_ROOT).as_posix() for path in files],
+        }
+        try:
+            write_artifact(discovery_cache_path(), json.dumps(payload, indent=1))
+        except OSError:
+            # A read-only cache directory must never break a pipeline step.
+            pass
+    return files
+
+
+def decode_catalog(data: bytes, name: str = "<catalog>") -> Tuple[str, str]:
+    """Text and encoding of a catalog; a file that is not UTF-8 is decoded as cp1256 with a warning on stderr."""
+    try:
+        return data.decode("utf-8-sig"), "utf-8-sig"
+    except UnicodeDecodeError as exc:
+        print(
+            f"warning: {name} is not valid UTF-8 (byte 0x{data[exc.start]:02x} at offset {exc.start}); "
+            f"decoding it as {FALLBACK_ENCODING}, check its screen ids and paths",
+            file=sys.stderr,
+        )
+    return data.decode(FALLBACK_ENCODING), FALLBACK_ENCODING
+
+
+def read_catalog(path: Path) -> Dict[str, Any]:
+    rel_path = path.relative_to(REPO_ROOT).as_posix()
+    text, encoding = decode_catalog(path.read_bytes(), rel_path)
+    return {
+        "path": path,
+        "rel_path": rel_path,
+        "encoding": encoding,
+        "rows": list(csv.DictReader(io.StringIO(text, newline=""))),
+    }
+
+
+def row_services(row: Dict[str, str]) -> List[str]:
+    """Distinct upper-cased service codes of ``row``, in ``SERVICE_COLUMNS`` order."""
+    codes = ((row.get(column) or "").strip().upper() for column in SERVICE_COLUMNS)
+    return list(dict.fromkeys(code for code in codes if code))
+
+
+@lru_cache(maxsize=None)
+def load_catalogs(roots: Tuple[str, ...] = DEFAULT_ROOTS) -> Dict[str, Any]:
+    """Parse every catalog once per process.
+
+    Returns ``{"catalogs": [catalog, ...], "by_service": {CODE: [(catalog, row), ...]}}``
+    where a catalog is ``{"path", "rel_path", "encoding", "rows"}`` and rows are
+    the raw ``csv.DictReader`` dicts in file order. A row whose two service
+    columns differ is listed under both codes. Callers must not mutate them.
+    """
+    catalogs = [read_catalog(path) for path in discover_catalogs(roots)]
+    by_service: Dict[str, List[Tuple[Dict[str, Any], Dict[str, str]]]] = {}
+    for catalog in catalogs:
+        for row in catalog["rows"]:
+            for code in row_services(row):
+                by_service.setdefault(code, []).append((catalog, row))
+    return {"catalogs": catalogs, "by_service": by_service}
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Rule tables for classifying screen catalog rows by surface and HTTP method.
+
+A rule is ``(name, value, patterns)``; earlier rules win. Each table
+compiles into one regex over a prefix trie of its patterns (``RuleSet``),
+so an entry is classified in a single scan of its text whose cost does not
+grow with the number of rules, instead of one substring test per keyword,
+and the result names the rule that fired:
+
+- surface rules are screen_id prefixes, matched at the start of the
+  upper-cased id (the first listed rule with a matching prefix wins);
+- method rules are keywords found anywhere in the lower-cased
+  ``"<screen_id> <notes>"`` text (the highest-priority rule with any keyword
+  in the text wins, wherever it occurs).
+
+``SERVICE_SURFACE_RULES`` / ``SERVICE_METHOD_RULES`` put a service's own rules
+ahead of the defaults. ``python scripts/screen_rules.py SCREEN_ID [NOTES]``
+shows which rules fire; bench_screen_rules.py times the engine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+Rule = Tuple[str, str, Tuple[str, ...]]
+Match = Tuple[str, str]  # (value, rule name)
+
+SURFACE_RULES: Tuple[Rule, ...] = (
+    ("app-user", "APP-USER", ("APP_USER",)),
+    ("app-partner", "APP-PARTNER", ("APP_PARTNER",)),
+    ("app-captain", "APP-CAPTAIN", ("APP_CAPTAIN", "CAPTAIN_")),
+    ("partner", "APP-PARTNER", ("PARTNER_",)),
+    ("dash-ops", "DASH-OPS", ("DASH_OPS",)),
+    ("dash-fleet", "DASH-FLEET", ("DASH_FLEET",)),
+    ("dash-support", "DASH-SUPPORT", ("DASH_SUPPORT",)),
+    ("dash-partner", "DASH-PARTNER", ("DASH_PARTNER",)),
+    ("dash-ssot", "DASH-SSOT", ("DASH_SSO",)),
+    ("field", "APP-FIELD", ("FIELD.",)),
+)
+
+METHOD_RULES: Tuple[Rule, ...] = (
+    ("read", "GET", ("list", "details", "timeline", "track", "عرض", "قائمة", "تفاصيل")),
+    (
+        "create",
+        "POST",
+        (
+            "create",
+            "checkout",
+            "confirm",
+            "issue",
+            "submit",
+            "reorder",
+            "feedback",
+            "upsert",
+            "إصدار",
+            "إرسال",
+            "تأكيد",
+            "بدء",
+            "إضافة",
+        ),
+    ),
+    ("update", "PATCH", ("update", "patch", "set", "تحديث", "تعديل", "ضبط")),
+    ("delete", "DELETE", ("delete", "remove", "إلغاء", "حذف")),
+    ("transition", "POST", ("accept", "reject", "close", "complete", "verify", "ack", "إقفال", "اعتماد", "تحقق")),
+)
+
+# Per-service rules, checked before the defaults, e.g.
+# SERVICE_SURFACE_RULES = {"KWD": (("kwd-admin", "DASH-ADMIN", ("KWD_ADMIN",)),)}
+SERVICE_SURFACE_RULES: Dict[str, Tuple[Rule, ...]] = {}
+SERVICE_METHOD_RULES: Dict[str, Tuple[Rule, ...]] = {}
+
+
+def trie_pattern(patterns: Sequence[str]) -> str:
+    """Regex for ``patterns`` with shared prefixes factored out (``set|settle`` -> ``set(?:tle)?``).
+
+    The engine then walks one branch per character instead of trying every
+    pattern at every position, and the greedy optional groups make a match
+    the longest pattern starting there.
+    """
+    trie: Dict[str, Any] = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie) if patterns else "(?!)"
+
+
+class RuleSet:
+    """A rule table compiled into one prefix-trie regex over all of its patterns."""
+
+    __slots__ = ("rules", "rank", "pattern")
+
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        self.rules = tuple(rules)
+        first: Dict[str, int] = {}
+        for position, (_, _, patterns) in enumerate(self.rules):
+            for pattern in patterns:
+                if pattern:
+                    first.setdefault(pattern, position)
+        # A match is the longest pattern at its position and every shorter
+        # pattern matching there is one of its prefixes, so each pattern maps
+        # to the best rule among itself and its prefixes.
+        self.rank: Dict[str, int] = {
+            pattern: min(first[pattern[:size]] for size in range(1, len(pattern) + 1) if pattern[:size] in first)
+            for pattern in first
+        }
+        self.pattern = re.compile(trie_pattern(list(first)))
+
+    def fired(self, position: int) -> Match:
+        name, value, _ = self.rules[position]
+        return value, name
+
+    def match_prefix(self, text: str) -> Optional[Match]:
+        """(value, rule name) of the first rule with a prefix of ``text``."""
+        found = self.pattern.match(text)
+        return self.fired(self.rank[found.group()]) if found else None
+
+    def search(self, text: str) -> Optional[Match]:
+        """(value, rule name) of the highest-priority rule with a pattern anywhere in ``text``.
+
+        One left-to-right scan; each search resumes one character after the
+        previous hit so overlapping patterns are not skipped, and the scan stops
+        as soon as the top rule fires.
+        """
+        best = len(self.rules)
+        position = 0
+        search = self.pattern.search
+        while best:
+            found = search(text, position)
+            if found is None:
+                break
+            best = min(best, self.rank[found.group()])
+            position = found.start() + 1
+        return self.fired(best) if best < len(self.rules) else None
+
+
+@lru_cache(maxsize=None)
+def service_rules(code: str = "") -> Tuple[RuleSet, RuleSet]:
+    """Compiled (surface, method) rule sets for service ``code``: its own rules first, then the defaults."""
+    code = code.upper()
+    return (
+        RuleSet(SERVICE_SURFACE_RULES.get(code, ()) + SURFACE_RULES),
+        RuleSet(SERVICE_METHOD_RULES.get(code, ()) + METHOD_RULES),
+    )
+
+
+def classify_surface(screen_id: str, rules: Optional[RuleSet] = None) -> Optional[Match]:
+    return (rules or service_rules()[0]).match_prefix((screen_id or "").upper())
+
+
+def classify_method(screen_id: str, notes: str, rules: Optional[RuleSet] = None) -> Optional[Match]:
+    return (rules or service_rules()[1]).search(f"{screen_id} {notes}".lower())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Show which surface and method rules fire for a screen")
+    parser.add_argument("screen_id")
+    parser.add_argument("notes", nargs="?", default="")
+    parser.add_argument("--service", default="", help="Apply this service's extra rules first")
+    args = parser.parse_args()
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+    surface_rules, method_rules = service_rules(args.service)
+    for label, result in (
+        ("surface", classify_surface(args.screen_id, surface_rules)),
+        ("method", classify_method(args.screen_id, args.notes, method_rules)),
+    ):
+        print(f"{label}: {result[0]} (rule {result[1]})" if result else f"{label}: - (no rule)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""On-disk cache of parsed OpenAPI specs.
+
+Parsed documents are pickled under ``.cache/specs`` keyed by the SHA-256 of the
+file bytes and a loader tag (cache format, PyYAML version, loader class), so an
+unchanged spec is never parsed twice and any edit or loader upgrade misses the
+cache automatically. The cache only holds data produced locally from repo files.
+
+Set ``SPEC_CACHE=0`` to bypass it and ``SPEC_CACHE_DIR`` to relocate it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from yaml_io import SafeLoader, load_yaml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_FORMAT = 1
+MAX_ENTRIES = 64
+
+LOADER_TAG = hashlib.sha256(
+    f"{CACHE_FORMAT}:{yaml.__version__}:{SafeLoader.__module__}.{SafeLoader.__name__}".encode("utf-8")
+).hexdigest()[:12]
+
+
+def cache_enabled() -> bool:
+    return os.environ.get("SPEC_CACHE", "1") not in {"0", "false", "FALSE"}
+
+
+def cache_dir() -> Path:
+    override = os.environ.get("SPEC_CACHE_DIR")
+    return Path(override) if override else REPO_ROOT / ".cache" / "specs"
+
+
+def cache_path_for(content: bytes) -> Path:
+    return cache_dir() / f"{hashlib.sha256(content).hexdigest()}.{LOADER_TAG}.pickle"
+
+
+def _evict(directory: Path) -> None:
+    entries = sorted(directory.glob("*.pickle"), key=lambda entry: entry.stat().st_mtime)
+    for stale in entries[:-MAX_ENTRIES]:
+        stale.unlink(missing_ok=True)
+
+
+def _store(target: Path, doc: Any) -> None:
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(doc, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, target)
+        _evict(target.parent)
+    except OSError:
+        # A read-only or full cache directory must never break a pipeline step.
+        pass
+
+
+def read_spec(path: Path) -> Any:
+    """Return the parsed YAML at ``path``, served from the cache when unchanged."""
+    content = path.read_bytes()
+    if not cache_enabled():
+        return load_yaml(content.decode("utf-8"))
+    target = cache_path_for(content)
+    try:
+        with target.open("rb") as handle:
+            return pickle.load(handle)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+    doc = load_yaml(content.decode("utf-8"))
+    _store(target, doc)
+    return doc
+
+
+def clear_cache() -> int:
+    removed = 0
+    directory = cache_dir()
+    if directory.exists():
+        for entry in directory.glob("*.pickle"):
+            entry.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Manage the parsed-spec cache")
+    parser.add_argument("--clear", action="store_true", help="Delete every cached spec")
+    parser.add_argument("--warm", nargs="*", type=Path, default=[], help="Parse and cache the given spec files")
+    args = parser.parse_args()
+    if args.clear:
+        print(f"Removed {clear_cache()} cached spec(s) from {cache_dir()}")
+    for path in args.warm:
+        read_spec(path)
+        print(f"Cached {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Generate synthetic routes CSVs shaped like DSH_routes_complete.csv.
+
+Rows carry every column generate_dsh_openapi.py reads: templated paths with
+path parameters, surface/role/guard annotations, pagination and idempotency
+flags, schema refs, plus deliberate alias collisions (a second operationId on
+the same path+method) and multi-surface duplicates (same operationId tagged
+for another surface). Output is deterministic for a given seed and is written
+row by row, so million-row catalogs do not need to fit in memory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import sys
+from pathlib import Path
+from typing import Dict, Iterator
+
+COLUMNS = [
+    "surface_id",
+    "rbac_role",
+    "path",
+    "method",
+    "operation_id",
+    "action_id",
+    "entity_code",
+    "description in english",
+    "guards_status",
+    "idempotency_present",
+    "pagination_present",
+    "req_schema_ref",
+    "res_schema_ref",
+    "errors_profile_ref",
+]
+
+SURFACES = {
+    "APP-USER": "user",
+    "APP-PARTNER": "partner",
+    "APP-CAPTAIN": "captain",
+    "APP-FIELD": "field_agent",
+    "DASH-OPS": "ops",
+    "DASH-FLEET": "fleet_manager",
+    "DASH-SUPPORT": "support",
+    "DASH-FIN": "finance",
+    "DASH-HR": "hr_manager",
+    "DASH-ADMIN": "admin",
+    "SYSTEM": "system",
+}
+NAMESPACES = ["dls", "ops/dls", "hr", "finance", "fleet", "support", "admin"]
+RESOURCES = [
+    "orders", "partners", "stores", "items", "slots", "zones", "captains", "shifts",
+    "payouts", "invoices", "tickets", "campaigns", "employees", "contracts", "vehicles", "reviews",
+]
+SUBRESOURCES = ["timeline", "chat/messages", "notes", "documents", "assignments", "history"]
+ACTIONS = ["approve", "reject", "cancel", "assign", "export", "queue", "scan"]
+GUARD_TOKENS = ["Allowlist", "Problem", "PathParam", "Step-Up", "Audit-Immutable", "Privacy-Export"]
+
+# (suffix, method, operation verb, paginated, needs request body)
+TEMPLATES = [
+    ("", "GET", "list", True, False),
+    ("", "POST", "create", False, True),
+    ("/{%s_id}", "GET", "get", False, False),
+    ("/{%s_id}", "PATCH", "update", False, True),
+    ("/{%s_id}", "DELETE", "delete", False, False),
+    ("/{%s_id}/%s", "GET", "list", True, False),
+    ("/{%s_id}/%s/{item_id}", "PUT", "upsert", False, True),
+    ("/{%s_id}/%s", "POST", "%s", False, True),
+]
+
+ALIAS_RATE = 0.03
+MULTI_SURFACE_RATE = 0.05
+
+
+def pascal(value: str) -> str:
+    return "".join(part.capitalize() for part in value.replace("/", "_").split("_") if part)
+
+
+def guards_for(rng: random.Random, method: str, has_param: bool, paginated: bool) -> str:
+    tokens = ["Allowlist", "Problem"]
+    if method in {"POST", "PUT", "PATCH", "DELETE"}:
+        tokens.insert(0, "Idem")
+    if has_param:
+        tokens.append("PathParam")
+    if paginated:
+        tokens.append("Pagination")
+    if rng.random() < 0.15:
+        tokens.append(rng.choice(GUARD_TOKENS[3:]))
+    return f"PASS({','.join(tokens)})"
+
+
+def iter_rows(count: int, seed: int = 7) -> Iterator[Dict[str, str]]:
+    """Yield ``count`` synthetic rows; paths grow with the catalog like real ones."""
+    rng = random.Random(seed)
+    surfaces = list(SURFACES)
+    emitted = 0
+    family = 0
+    while emitted < count:
+        namespace = NAMESPACES[family % len(NAMESPACES)]
+        resource = RESOURCES[(family // len(NAMESPACES)) % len(RESOURCES)]
+        generation = family // (len(NAMESPACES) * len(RESOURCES))
+        base = f"/api/{namespace}/{resource}" + (f"/v{generation}" if generation else "")
+        singular = resource.rstrip("s")
+        sub = rng.choice(SUBRESOURCES)
+        action = rng.choice(ACTIONS)
+        surface = rng.choice(surfaces)
+        family += 1
+
+        for suffix, method, verb, paginated, has_body in TEMPLATES:
+            if emitted >= count:
+                return
+            suffix = suffix.replace("{%s_id}", "{%s_id}" % singular)
+            if "%s" in suffix:
+                suffix = suffix % (action if verb == "%s" else sub)
+            verb = action if verb == "%s" else verb
+            path = base + suffix
+            op_stem = f"{namespace.replace('/', '_')}_{resource}_{verb}" + (f"_v{generation}" if generation else "")
+            if suffix.count("/") > 1 and verb in {"list", "upsert"}:
+                op_stem += f"_{sub.split('/')[0]}"
+            schema_stem = pascal(f"{singular}_{verb}")
+            row = {
+                "surface_id": surface,
+                "rbac_role": SURFACES[surface],
+                "path": path,
+                "method": method,
+                "operation_id": op_stem,
+                "action_id": f"{verb}_{singular}",
+                "entity_code": f"DEC-{namespace.upper().replace('/', '-')}-{resource.upper()}",
+                "description in english": f"{verb.capitalize()} {resource} ({namespace}).",
+                "guards_status": guards_for(rng, method, "{" in path, paginated),
+                "idempotency_present": "TRUE" if method != "GET" else "FALSE",
+                "pagination_present": "TRUE" if paginated else "FALSE",
+                "req_schema_ref": f"components.schemas.{schema_stem}Request" if has_body else "—",
+                "res_schema_ref": "—" if method == "DELETE" else f"components.schemas.{schema_stem}",
+                "errors_profile_ref": "components.schemas.Problem",
+            }
+            yield row
+            emitted += 1
+
+            if emitted < count and rng.random() < MULTI_SURFACE_RATE:
+                other = rng.choice(surfaces)
+                yield {**row, "surface_id": other, "rbac_role": SURFACES[other]}
+                emitted += 1
+            if emitted < count and rng.random() < ALIAS_RATE:
+                yield {**row, "operation_id": f"{op_stem}_alias", "surface_id": "DASH-OPS", "rbac_role": "ops"}
+                emitted += 1
+
+
+def write_routes_csv(path: Path, count: int, seed: int = 7) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=COLUMNS)
+        writer.writeheader()
+        for row in iter_rows(count, seed):
+            writer.writerow(row)
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write a synthetic routes CSV for generator benchmarks")
+    parser.add_argument("--rows", type=int, required=True, help="Number of rows to generate")
+    parser.add_argument("--output", type=Path, required=True, help="Destination CSV path")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (same seed, same CSV)")
+    args = parser.parse_args()
+    write_routes_csv(args.output, args.rows, args.seed)
+    print(f"Wrote {args.rows} synthetic routes to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
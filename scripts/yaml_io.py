@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Shared YAML load/dump layer for the spec scripts.
+
+Uses libyaml (``CSafeLoader``/``CSafeDumper``) when PyYAML was built with it
+and falls back to the pure-Python classes otherwise. Output is byte-identical
+either way: the emitters differ on double-quoted scalars (tabs, control
+characters, spaces next to line breaks), on NEL / LINE SEPARATOR / PARAGRAPH
+SEPARATOR and characters outside the BMP (libyaml always escapes them), and on
+documents whose root is not a mapping or sequence (only the pure emitter ends
+those with ``...``), so such documents are always dumped by the pure-Python
+emitter.
+
+Set ``YAML_IO_PURE=1`` to force the pure-Python classes, and run this module
+with ``--verify`` to compare both emitters over a set of files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+from typing import IO, Any, Iterable, List
+
+import yaml
+from yaml.emitter import Emitter
+
+HAS_LIBYAML = hasattr(yaml, "CSafeLoader") and hasattr(yaml, "CSafeDumper")
+USE_LIBYAML = HAS_LIBYAML and os.environ.get("YAML_IO_PURE", "") not in {"1", "true", "TRUE"}
+
+SafeLoader = yaml.CSafeLoader if USE_LIBYAML else yaml.SafeLoader
+SafeDumper = yaml.CSafeDumper if USE_LIBYAML else yaml.SafeDumper
+
+# Anything outside this class may push the emitter to a double-quoted scalar.
+PLAIN_TEXT = re.compile("[^\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd]")
+# Characters libyaml always escapes in a double-quoted scalar while the pure emitter does not.
+LIBYAML_ESCAPED = re.compile("[\x85\u2028\u2029\U00010000-\U0010ffff]")
+MAX_SIMPLE_KEY_LENGTH = 128
+
+DUMP_DEFAULTS = {"sort_keys": False, "allow_unicode": True}
+
+
+def load_yaml(source: str | bytes | IO) -> Any:
+    return yaml.load(source, Loader=SafeLoader)
+
+
+def read_yaml(path: Path) -> Any:
+    with path.open("r", encoding="utf-8") as handle:
+        return load_yaml(handle)
+
+
+def _needs_double_quotes(analyzer: Emitter, value: str, as_key: bool) -> bool:
+    # Empty or long keys become "? key" complex keys; libyaml measures in bytes.
+    if as_key and not 0 < len(value.encode("utf-8")) < MAX_SIMPLE_KEY_LENGTH:
+        return True
+    if not PLAIN_TEXT.search(value):
+        return False
+    if LIBYAML_ESCAPED.search(value):
+        return True
+    analysis = analyzer.analyze_scalar(value)
+    if as_key and analysis.multiline:
+        return True
+    return not analysis.allow_single_quoted
+
+
+def emitters_agree(data: Any, allow_unicode: bool = True) -> bool:
+    """Return True when libyaml would emit ``data`` exactly like the pure emitter."""
+    if not isinstance(data, (dict, list, tuple)):
+        return False
+    analyzer = Emitter(None, allow_unicode=allow_unicode)
+    stack: List[tuple[Any, bool]] = [(data, False)]
+    while stack:
+        value, as_key = stack.pop()
+        if isinstance(value, str):
+            if _needs_double_quotes(analyzer, value, as_key):
+                return False
+        elif isinstance(value, dict):
+            stack.extend((key, True) for key in value.keys())
+            stack.extend((item, False) for item in value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend((item, False) for item in value)
+    return True
+
+
+def pick_dumper(data: Any, allow_unicode: bool = True) -> type:
+    if SafeDumper is yaml.SafeDumper or emitters_agree(data, allow_unicode):
+        return SafeDumper
+    return yaml.SafeDumper
+
+
+def dump_yaml(data: Any, stream: IO | None = None, **options: Any) -> str | None:
+    """``yaml.safe_dump`` with the repo defaults (insertion order, raw unicode)."""
+    options = {**DUMP_DEFAULTS, **options}
+    dumper = pick_dumper(data, bool(options.get("allow_unicode")))
+    return yaml.dump(data, stream, Dumper=dumper, **options)
+
+
+def verify_files(paths: Iterable[Path]) -> List[str]:
+    """Load and dump each file with both implementations; report any mismatch."""
+    problems: List[str] = []
+    if not HAS_LIBYAML:
+        return problems
+    for path in paths:
+        text = path.read_text(encoding="utf-8")
+        pure_doc = yaml.load(text, Loader=yaml.SafeLoader)
+        if yaml.load(text, Loader=yaml.CSafeLoader) != pure_doc:
+            problems.append(f"{path}: CSafeLoader result differs")
+            continue
+        expected = yaml.dump(pure_doc, Dumper=yaml.SafeDumper, **DUMP_DEFAULTS)
+        actual = yaml.dump(pure_doc, Dumper=pick_dumper(pure_doc), **DUMP_DEFAULTS)
+        if actual != expected:
+            problems.append(f"{path}: dump_yaml output differs from pure-Python emitter")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that libyaml and pure-Python YAML I/O agree byte for byte")
+    parser.add_argument("--verify", nargs="+", type=Path, required=True, help="YAML files to round-trip")
+    args = parser.parse_args()
+    if not HAS_LIBYAML:
+        print("libyaml not available; pure-Python YAML in use, nothing to verify.")
+        return 0
+    problems = verify_files(args.verify)
+    for problem in problems:
+        print(f"- {problem}")
+    print(f"Verified {len(args.verify)} file(s): {'OK' if not problems else f'{len(problems)} mismatch(es)'}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Snapshot diffs must agree with comparing the full entry rows of both runs."""
+
+import random
+
+from audit_delta import CHANGES, KINDS, build_snapshot, diff_snapshots, entry_hash, render_delta_markdown, unique_keys
+
+
+def legacy_changes(kind, previous_rows, current_rows):
+    """Full-row comparison: {key: change} for entries whose row differs between runs."""
+    changes = {}
+    for key, row in current_rows.items():
+        before = previous_rows.get(key)
+        if before is None:
+            changes[key] = "added"
+        elif before != row:
+            if before["linked"] != row["linked"]:
+                changes[key] = "matched" if row["linked"] else "orphaned"
+            else:
+                changes[key] = "changed"
+    for key in previous_rows:
+        if key not in current_rows:
+            changes[key] = "removed"
+    return {(kind, key): change for key, change in changes.items()}
+
+
+def section(rows):
+    return {key: [row["surface"], row["id"], int(row["linked"]), entry_hash(row["fields"] + (row["linked"],))] for key, row in rows.items()}
+
+
+def random_rows(rng, prefix, count):
+    return {
+        f"{prefix}{n}": {"surface": rng.choice(["APP-USER", "DASH-OPS", ""]), "id": f"id{n}", "linked": rng.random() < 0.7, "fields": (f"v{n}", "x")}
+        for n in range(count)
+    }
+
+
+def mutate(rng, rows):
+    result = {}
+    for key, row in rows.items():
+        roll = rng.random()
+        if roll < 0.1:
+            continue
+        row = dict(row)
+        if roll < 0.2:
+            row["linked"] = not row["linked"]
+        elif roll < 0.3:
+            row["fields"] = row["fields"] + ("edited",)
+        result[key] = row
+    for n in range(rng.randint(0, 4)):
+        result[f"new{n}"] = {"surface": "DASH-OPS", "id": f"new{n}", "linked": rng.random() < 0.5, "fields": ("n",)}
+    return result
+
+
+def test_diff_matches_full_row_comparison():
+    rng = random.Random(7)
+    for _ in range(50):
+        before = {"operation": random_rows(rng, "GET /p", 30), "screen": random_rows(rng, "cat.csv:S", 30)}
+        after = {kind: mutate(rng, rows) for kind, rows in before.items()}
+        delta = diff_snapshots(
+            build_snapshot("DSH", section(before["operation"]), section(before["screen"])),
+            build_snapshot("DSH", section(after["operation"]), section(after["screen"])),
+        )
+        expected = {}
+        for kind in KINDS:
+            expected.update(legacy_changes(kind, before[kind], after[kind]))
+        assert {(change["kind"], change["key"]): change["change"] for change in delta["changes"]} == expected
+        for kind in KINDS:
+            for name in CHANGES:
+                assert delta["totals"][kind][name] == sum(1 for (k, _), change in expected.items() if k == kind and change == name)
+
+
+def test_unchanged_snapshot_has_no_changes():
+    rows = section(random_rows(random.Random(1), "GET /p", 5))
+    snapshot = build_snapshot("DSH", rows, {})
+    delta = diff_snapshots(snapshot, snapshot)
+    assert delta["changes"] == [] and delta["baseline"]
+    assert "No changes since the previous run." in render_delta_markdown(delta)
+
+
+def test_no_baseline_reports_everything_added():
+    rows = section(random_rows(random.Random(2), "GET /p", 4))
+    delta = diff_snapshots(None, build_snapshot("DSH", rows, {}))
+    assert not delta["baseline"]
+    assert [change["change"] for change in delta["changes"]] == ["added"] * 4
+    assert render_delta_markdown(delta).startswith("# SRV-DSH Audit Delta\n\nNo previous snapshot")
+
+
+def test_unique_keys():
+    assert unique_keys(["a", "b", "a", "a"]) == ["a", "b", "a#2", "a#3"]
+    assert unique_keys([]) == []
+
+
+def test_entry_hash_is_field_sensitive():
+    assert entry_hash(("a", "b")) == entry_hash(["a", "b"])
+    assert entry_hash(("a", "b")) != entry_hash(("ab",))
+    assert entry_hash((True, 1)) != entry_hash((False, 1))
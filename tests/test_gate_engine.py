@@ -0,0 +1,148 @@
+"""The gate engine must reach the same verdicts as the hard-coded checks it replaced."""
+
+import csv
+import random
+
+import pytest
+
+import gate_engine
+from gate_engine import evaluate, load_gates, status_tokens
+
+PARITY_FIELDS = ["target_BE", "trace_link_ok", "orphan_BE_flag", "orphan_FE_flag"]
+
+
+def legacy_parity(rows):
+    """Issue counts of the previous check_parity: (unmatched BE, orphan BE, orphan FE)."""
+    be_rows = [row for row in rows if row.get("target_BE", "").strip() == "1"]
+    fe_only_rows = [row for row in rows if row.get("target_BE", "").strip() == "0"]
+    unmatched = [row for row in be_rows if row.get("trace_link_ok", "").upper() != "TRUE"]
+    orphan_be = [row for row in be_rows if row.get("orphan_BE_flag", "").upper() == "TRUE"]
+    orphan_fe = [row for row in fe_only_rows if row.get("orphan_FE_flag", "").upper() == "TRUE"]
+    return len(unmatched), len(orphan_be), len(orphan_fe)
+
+
+def legacy_failing_guards(statuses):
+    return [f"{name} -> {status}" for name, status in statuses.items() if "✅" not in status]
+
+
+def write_fixture(tmp_path, parity, trace, guards):
+    with (tmp_path / "PARITY.csv").open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, PARITY_FIELDS)
+        writer.writeheader()
+        writer.writerows(parity)
+    with (tmp_path / "TRACE_TABLE.csv").open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, ["screen_id", "trace_link_ok"])
+        writer.writeheader()
+        writer.writerows(trace)
+    lines = ["# Guards", "", "| Guard | Status |", "| --- | --- |"]
+    lines += [f"| {name} | {status} |" for name, status in guards.items()]
+    (tmp_path / "GUARDS.md").write_text("\n".join(lines) + "\n\nFooter\n", encoding="utf-8")
+    gates = tmp_path / "gates.yml"
+    gates.write_text(
+        f"""service: SRV-TST
+thresholds:
+  parity: {{target: 1.0, artifact: {tmp_path / 'PARITY.csv'}}}
+  trace: {{target: 1.0, allow_empty: true, artifact: {tmp_path / 'TRACE_TABLE.csv'}}}
+  orphan_be: {{allowed: 0, artifact: {tmp_path / 'PARITY.csv'}}}
+  orphan_fe: {{allowed: 0, artifact: {tmp_path / 'PARITY.csv'}}}
+  guards: {{required_status: pass, artifact: {tmp_path / 'GUARDS.md'}}}
+""",
+        encoding="utf-8",
+    )
+    return gates
+
+
+def random_parity(rng, count):
+    rows = []
+    for _ in range(count):
+        if rng.random() < 0.8:
+            linked = rng.random() < 0.9
+            rows.append({"target_BE": "1", "trace_link_ok": str(linked).upper(), "orphan_BE_flag": str(not linked).upper(), "orphan_FE_flag": ""})
+        else:
+            rows.append({"target_BE": "0", "trace_link_ok": "FALSE", "orphan_BE_flag": "", "orphan_FE_flag": rng.choice(["TRUE", "FALSE"])})
+    return rows
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_matches_legacy_checks(tmp_path, seed):
+    rng = random.Random(seed)
+    parity = random_parity(rng, rng.randint(1, 60))
+    trace = [{"screen_id": f"S{n}", "trace_link_ok": rng.choice(["TRUE", "TRUE", "FALSE"])} for n in range(rng.randint(1, 30))]
+    guards = {f"G{n}": rng.choice(["✅", "✅ PASS", "✅PASS", "OK✅", "❌", "PASS", "BYPASS"]) for n in range(5)}
+    _, gates = load_gates(write_fixture(tmp_path, parity, trace, guards))
+    issues = {gate.name: issue for gate, issue in evaluate(gates)}
+
+    unmatched, orphan_be, orphan_fe = legacy_parity(parity)
+    assert (issues["parity"] is not None) == (unmatched > 0)
+    assert (issues["orphan_be"] is not None) == (orphan_be > 0)
+    assert (issues["orphan_fe"] is not None) == (orphan_fe > 0)
+    if orphan_be:
+        assert issues["orphan_be"] == f"Found {orphan_be} backend orphan rows (see PARITY.csv)"
+    if orphan_fe:
+        assert issues["orphan_fe"] == f"Found {orphan_fe} front-end orphan rows (see PARITY.csv)"
+    missing = sum(row["trace_link_ok"] != "TRUE" for row in trace)
+    assert (issues["trace"] is not None) == (missing > 0)
+    failing = legacy_failing_guards(guards)
+    assert issues["guards"] == ("Non-pass guard statuses detected: " + ", ".join(failing) if failing else None)
+
+
+def test_guard_status_tokens():
+    assert status_tokens("✅ PASS") == {"✅", "PASS"}
+    violates = gate_engine.compile_guards("guards", gate_engine.REPO_ROOT / "x.md", "", {}).violates
+    for status in ("✅", "(✅)", "✅PASS", "✅.", "OK✅"):
+        assert not violates({"status": status}), status
+    for status in ("PASS", "BYPASS", "NOT PASS", "PASSIVE", "❌ FAIL", ""):
+        assert violates({"status": status}), status
+
+
+def test_word_markers_need_a_whole_token():
+    spec = {"required_status": "ok"}
+    violates = gate_engine.compile_guards("guards", gate_engine.REPO_ROOT / "x.md", "", spec).violates
+    assert not violates({"status": "OK"})
+    assert not violates({"status": "ok (manual)"})
+    for status in ("BROKEN", "NOT_OK", ""):
+        assert violates({"status": status}), status
+
+
+def test_empty_trace_passes_like_the_legacy_check(tmp_path):
+    parity = [{"target_BE": "1", "trace_link_ok": "TRUE", "orphan_BE_flag": "FALSE", "orphan_FE_flag": ""}]
+    _, gates = load_gates(write_fixture(tmp_path, parity, [], {"G": "✅"}))
+    issues = {gate.name: issue for gate, issue in evaluate(gates)}
+    assert issues["trace"] is None
+    assert all(issue is None for issue in issues.values())
+
+
+def test_empty_ratio_gate_fails_without_allow_empty(tmp_path):
+    gates = tmp_path / "gates.yml"
+    (tmp_path / "TRACE_TABLE.csv").write_text("screen_id,trace_link_ok\n", encoding="utf-8")
+    gates.write_text(f"thresholds:\n  trace: {{artifact: {tmp_path / 'TRACE_TABLE.csv'}}}\n", encoding="utf-8")
+    _, compiled = load_gates(gates)
+    [(_, issue)] = evaluate(compiled)
+    assert issue == "TRACE check: no screen rows found in TRACE_TABLE.csv"
+
+
+def test_fail_fast_reports_lower_bound(tmp_path):
+    parity = [{"target_BE": "1", "trace_link_ok": value, "orphan_BE_flag": "", "orphan_FE_flag": ""} for value in ("TRUE", "FALSE", "FALSE", "TRUE")]
+    _, gates = load_gates(write_fixture(tmp_path, parity, [{"screen_id": "S", "trace_link_ok": "TRUE"}], {"G": "✅"}))
+    results = evaluate(gates, fail_fast=True)
+    assert len(results) == 1
+    gate, issue = results[0]
+    assert gate.name == "parity"
+    assert issue == "PARITY below 1.0: at least 1 backend rows unlinked (stopped early after 2 rows of PARITY.csv)"
+    assert "ratio" not in issue
+
+
+def test_missing_artifact(tmp_path):
+    gates = write_fixture(tmp_path, [], [], {})
+    (tmp_path / "TRACE_TABLE.csv").unlink()
+    _, compiled = load_gates(gates)
+    issues = {gate.name: issue for gate, issue in evaluate(compiled)}
+    assert issues["trace"].startswith("Missing required artifact:")
+    assert issues["parity"].startswith("PARITY check: no backend rows")
+
+
+def test_unknown_kind(tmp_path):
+    path = tmp_path / "gates.yml"
+    path.write_text("thresholds:\n  nope: {artifact: x.csv}\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="unknown gate kind"):
+        load_gates(path)
@@ -0,0 +1,118 @@
+"""Trie lookup and the composite index must pick what the per-path candidate filter picked."""
+
+import itertools
+
+import pytest
+
+from audit_records import Operation
+from path_index import build_operation_index, compile_path_trie, match_path, normalise_endpoint, resolve_operations
+
+
+def operation(method, path, tags=(), operation_id=""):
+    return Operation(method, path, operation_id or f"{method.lower()}_{path}", "", "", list(tags), "", "", "", "", False, False, "", "", "", [])
+
+
+def legacy_pick(operations, endpoint, surface="", method_hint=None):
+    """Candidate selection of the previous match_fe_to_be: exact path, then surface, then method."""
+    candidates = [op for op in operations if op.path == endpoint]
+    if len(candidates) > 1 and surface:
+        tagged = [op for op in candidates if surface in op.tags]
+        if tagged:
+            candidates = tagged
+    if len(candidates) > 1 and method_hint:
+        filtered = [op for op in candidates if op.method == method_hint]
+        if filtered:
+            candidates = filtered
+    return candidates[0] if candidates else None
+
+
+OPERATIONS = [
+    operation("GET", "/api/dls/orders", ["APP-USER"]),
+    operation("POST", "/api/dls/orders", ["APP-USER"]),
+    operation("GET", "/api/dls/orders", ["DASH-OPS"]),
+    operation("GET", "/api/dls/orders/{order_id}", ["APP-USER", "DASH-OPS"]),
+    operation("PATCH", "/api/dls/orders/{order_id}", ["DASH-OPS"]),
+    operation("DELETE", "/api/dls/orders/{order_id}", ["DASH-OPS", "DASH-OPS"]),
+    operation("GET", "/api/dls/orders/{order_id}/timeline", ["APP-USER"]),
+    operation("GET", "/api/dls/orders/summary", ["DASH-BI"]),
+    operation("POST", "/api/dls/partners/{partner_id}/stores/{store_id}", []),
+    operation("GET", "/api/dls/orders/export?format=csv", ["DASH-BI"]),
+]
+
+
+def test_resolve_matches_legacy_selection():
+    index = build_operation_index(OPERATIONS)
+    paths = sorted({op.path for op in OPERATIONS}) + ["/api/dls/missing"]
+    surfaces = ["", "APP-USER", "DASH-OPS", "DASH-BI", "DASH-FIN"]
+    methods = [None, "GET", "POST", "PATCH", "DELETE", "PUT"]
+    for path, surface, method in itertools.product(paths, surfaces, methods):
+        candidates = resolve_operations(index, path, surface, method)
+        expected = legacy_pick(OPERATIONS, path, surface, method)
+        assert (candidates[0] if candidates else None) is expected, (path, surface, method)
+
+
+def test_trie_then_index_matches_legacy_on_exact_endpoints():
+    # Endpoints that equal a template (query string included) must link as before the trie.
+    index = build_operation_index(OPERATIONS)
+    trie = compile_path_trie(op.path for op in OPERATIONS)
+    for op in OPERATIONS:
+        for surface in ["", *op.tags]:
+            expected = legacy_pick(OPERATIONS, op.path, surface, op.method)
+            assert expected is not None
+            assert resolve_operations(index, match_path(trie, op.path), surface, op.method)[0] is expected
+
+
+def test_real_spec_matches_legacy_selection():
+    auto_dsh_audit = pytest.importorskip("auto_dsh_audit")
+    if not auto_dsh_audit.DSH_PROFILE["openapi"].exists():
+        pytest.skip("DSH spec not present")
+    operations = auto_dsh_audit.load_be_operations()
+    index = build_operation_index(operations)
+    trie = compile_path_trie(op.path for op in operations)
+    surfaces = sorted({tag for op in operations for tag in op.tags}) + [""]
+    for op in operations:
+        assert match_path(trie, op.path) == op.path
+        for surface in surfaces:
+            expected = legacy_pick(operations, op.path, surface, op.method)
+            assert resolve_operations(index, op.path, surface, op.method)[0] is expected
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        ("/api/dls/orders/{order_id}", "/api/dls/orders/{order_id}"),
+        ("/api/dls/orders/123", "/api/dls/orders/{order_id}"),
+        ("/api/dls/orders/:id", "/api/dls/orders/{order_id}"),
+        ("/api/dls/orders/<id>/timeline", "/api/dls/orders/{order_id}/timeline"),
+        ("/api/dls/orders/123/timeline?page=2#top", "/api/dls/orders/{order_id}/timeline"),
+        ("https://api.bthwani.com/api/dls//orders/", "/api/dls/orders"),
+        ("/api/dls/orders/summary", "/api/dls/orders/summary"),
+        ("/api/dls/orders/{id}/summary", None),
+        ("/api/dls/partners/7/stores/9", "/api/dls/partners/{partner_id}/stores/{store_id}"),
+        ("/api/dls/orders/export?format=csv", "/api/dls/orders/export?format=csv"),
+        ("/api/dls/orders/export?format=pdf", "/api/dls/orders/export?format=csv"),
+        ("/api/dls/unknown", None),
+        ("", None),
+    ],
+)
+def test_match_path(endpoint, expected):
+    trie = compile_path_trie(op.path for op in OPERATIONS)
+    assert match_path(trie, endpoint) == expected
+
+
+def test_exact_templates_behave_like_dict_lookup():
+    # Before the trie an endpoint matched only when it equalled a template verbatim.
+    trie = compile_path_trie(op.path for op in OPERATIONS)
+    for path in {op.path for op in OPERATIONS}:
+        assert match_path(trie, path) == path
+
+
+def test_first_template_wins_on_param_spelling():
+    trie = compile_path_trie(["/a/{id}", "/a/{other}"])
+    assert match_path(trie, "/a/5") == "/a/{id}"
+
+
+def test_normalise_endpoint():
+    assert normalise_endpoint(" /x//y/?q=1 ") == "/x/y"
+    assert normalise_endpoint("/") == "/"
+    assert normalise_endpoint("") == ""
@@ -0,0 +1,57 @@
+"""Compiled rule sets must classify exactly like the keyword scans they replaced."""
+
+import random
+import re
+
+import pytest
+
+from bench_screen_rules import catalog_pairs, legacy_method, legacy_surface, synthetic_rules
+from screen_rules import METHOD_RULES, SURFACE_RULES, RuleSet, classify_method, classify_surface, trie_pattern
+
+
+def value(match):
+    return match[0] if match else None
+
+
+def test_catalog_rows_match_legacy():
+    pairs = catalog_pairs()
+    assert pairs
+    for screen_id, notes in pairs:
+        assert value(classify_surface(screen_id)) == legacy_surface(SURFACE_RULES, screen_id), screen_id
+        assert value(classify_method(screen_id, notes)) == legacy_method(METHOD_RULES, screen_id, notes), screen_id
+
+
+@pytest.mark.parametrize("extra", [0, 20])
+def test_random_text_matches_legacy(extra):
+    surface_rules = synthetic_rules("SYN", extra, True) + SURFACE_RULES
+    method_rules = synthetic_rules("syn", extra, False) + METHOD_RULES
+    surface_set, method_set = RuleSet(surface_rules), RuleSet(method_rules)
+    rng = random.Random(extra)
+    words = [p for _, _, patterns in surface_rules + method_rules for p in patterns] + ["x", "_", " ", "ع"]
+    for _ in range(3000):
+        text = "".join(rng.choice(words)[: rng.randint(1, 8)] for _ in range(rng.randint(0, 5)))
+        notes = "".join(rng.choice(words) for _ in range(rng.randint(0, 3)))
+        assert value(classify_surface(text, surface_set)) == legacy_surface(surface_rules, text), text
+        assert value(classify_method(text, notes, method_set)) == legacy_method(method_rules, text, notes), (text, notes)
+
+
+def test_overlapping_keywords_pick_highest_priority():
+    # Rule order decides, not keyword position: "settle" holds "set" (update) but "list" (read) ranks first.
+    assert value(classify_method("SCREEN", "settle and list")) == "GET"
+    assert value(classify_method("SCREEN", "accept then delete")) == "DELETE"
+    assert classify_method("SCREEN", "nothing here") is None
+
+
+def test_rule_name_reported():
+    assert classify_surface("DASH_SSOT_HOME") == ("DASH-SSOT", "dash-ssot")
+    assert classify_method("APP_USER_ORDERS", "عرض الطلبات") == ("GET", "read")
+
+
+def test_trie_pattern_matches_exactly_its_patterns():
+    patterns = ["set", "settle", "se", "list", "لا", "a.b"]
+    regex = re.compile(trie_pattern(patterns))
+    for pattern in patterns:
+        assert regex.fullmatch(pattern), pattern
+    for other in ("s", "sett", "settles", "lis", "axb", ""):
+        assert not regex.fullmatch(other), other
+    assert not re.compile(trie_pattern([])).search("anything")
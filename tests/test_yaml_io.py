@@ -0,0 +1,47 @@
+"""dump_yaml must match the pure-Python SafeDumper byte for byte."""
+
+import random
+
+import pytest
+import yaml
+
+import yaml_io
+from yaml_io import DUMP_DEFAULTS, dump_yaml
+
+pytestmark = pytest.mark.skipif(not yaml_io.HAS_LIBYAML, reason="libyaml not available")
+
+
+def legacy_dump(data):
+    return yaml.dump(data, Dumper=yaml.SafeDumper, **DUMP_DEFAULTS)
+
+
+@pytest.mark.parametrize("text", ["a\x85b", "a b", "a b", " ", "tail\x85"])
+def test_unicode_line_breaks(text):
+    for data in ({"k": text}, {text: "v"}, [text], {"k": [{"nested": text}]}):
+        assert dump_yaml(data) == legacy_dump(data)
+
+
+@pytest.mark.parametrize("root", [None, "x", "plain", 1, 1.5, True, ""])
+def test_non_container_roots(root):
+    assert dump_yaml(root) == legacy_dump(root)
+
+
+def test_plain_documents_use_libyaml():
+    data = {"openapi": "3.0.3", "paths": {"/a/{id}": {"get": {"tags": ["Dsh"], "summary": "قائمة"}}}, "list": [1, None]}
+    assert yaml_io.pick_dumper(data) is yaml_io.SafeDumper
+    assert dump_yaml(data) == legacy_dump(data)
+
+
+def test_tabs_and_controls():
+    for text in ("a\tb", "a\x01", " lead", "a \nb", "x" * 200):
+        for data in ({"k": text}, {text: 1}):
+            assert dump_yaml(data) == legacy_dump(data)
+
+
+def test_random_strings():
+    rng = random.Random(20240501)
+    alphabet = "ab :#-'\"\t\n\r\x85  \xa0﻿éم\U0001f600{}[],&*!|>%@`?"
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        data = {text or "k": [text, {"v": text}]}
+        assert dump_yaml(data) == legacy_dump(data), repr(text)